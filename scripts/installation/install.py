@@ -35,101 +35,321 @@ Requirements:
 """
 
 import argparse
+import asyncio
+import csv
+import functools
+import hashlib
+import importlib
+import importlib.metadata
+import json
+import mmap
 import os
 import platform
+import re
 import shutil
+import site
 import subprocess
 import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+except ImportError:
+    # packaging ships alongside pip/setuptools but is not guaranteed;
+    # without it every spec is handed to pip unchecked
+    Requirement = None
+    InvalidRequirement = ValueError
+
+
+def _default_cache_dir():
+    """Return the persistent pip cache directory shared across runs."""
+    if platform.system() == "Windows" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "terminalai-pip"
+    return Path.home() / ".cache" / "terminalai-pip"
+
+
+def _canonical_name(name):
+    """Normalize a distribution name per PEP 503."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _file_contains(path, needle):
+    """
+    Search a file's raw bytes for an ASCII marker without decoding it.
+
+    Args:
+        path: File to search
+        needle: Bytes to look for
+
+    Returns:
+        True if the marker occurs in the file
+    """
+    with open(path, "rb") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            return False  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(needle) != -1
+
+
+# Marker comment written by patch_basicsr_torchvision
+_BASICSR_PATCH_SENTINEL = b"Fix for torchvision >= 0.17"
+
+# Common Maxine SDK install locations, split by platform
+_WIN_MAXINE_PATHS = (
+    r"C:\Program Files\NVIDIA Corporation\NVIDIA Video Effects",
+    r"C:\Program Files\NVIDIA\Maxine",
+)
+_POSIX_MAXINE_PATHS = (
+    "/opt/nvidia/maxine",
+)
+
+# Dependencies shared by Real-ESRGAN and GFPGAN, installed as one group
+_COMMON_AI_DEPS = ("numpy", "opencv-python", "basicsr", "facexlib")
+
+_LOG_PREFIXES = {
+    "INFO": "[OK]",
+    "WARN": "[WARN]",
+    "ERROR": "[ERROR]",
+    "STEP": "==>",
+}
+
 
 class TerminalAIInstaller:
     """Comprehensive installer for TerminalAI with all dependencies."""
 
-    def __init__(self, install_type="basic"):
+    def __init__(self, install_type="basic", cache_dir=None, parallel_download=False,
+                 verbose=False, use_uv=None, force=False, compile_bytecode=False):
         self.install_type = install_type
+        self.cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+        self.parallel_download = parallel_download
+        self.verbose = verbose
+        # uv is used automatically when found on PATH (use_uv=None),
+        # or forced on/off with --use-uv / --no-uv
+        self.pip_frontend = shutil.which("uv") if use_uv is not False else None
+        self.force = force
+        # Dev installs run pytest straight away, so keep their .pyc files
+        self.compile_bytecode = compile_bytecode or install_type == "dev"
         self.system = platform.system()
+        self.plan_key = self._compute_plan_key()
         self.errors = []
         self.warnings = []
         self.installed = []
+        self._path_bins = {}
+        # Optional packages are queued as (label, specs, warning) and
+        # installed together by _flush_pip() in a single resolver pass
+        self._pending_installs = []
+        # Specs compiled from source (Rust/C++), built off to the side
+        self._source_builds = []
+        # Guards installed/warnings when installs run on worker threads
+        self._lock = threading.Lock()
+        # Installed distributions (canonical name -> version), scanned once
+        self._installed_versions = None
+
+        # Per-level loggers with the prefix pre-bound (no level lookup per call)
+        self.log_info = functools.partial(self._emit, _LOG_PREFIXES["INFO"])
+        self.log_warn = functools.partial(self._emit, _LOG_PREFIXES["WARN"])
+        self.log_error = functools.partial(self._emit, _LOG_PREFIXES["ERROR"])
+        self.log_step = functools.partial(self._emit, _LOG_PREFIXES["STEP"])
 
     def log(self, message, level="INFO"):
         """Log installation progress."""
-        prefix = {
-            "INFO": "[OK]",
-            "WARN": "[WARN]",
-            "ERROR": "[ERROR]",
-            "STEP": "==>"
-        }.get(level, "*")
+        self._emit(_LOG_PREFIXES.get(level, "*"), message)
+
+    @staticmethod
+    def _emit(prefix, message):
+        """Print a prefixed log line."""
         try:
             print(f"{prefix} {message}")
         except UnicodeEncodeError:
             # Fallback for terminals with encoding issues
             print(f"{prefix} {message}".encode('ascii', 'replace').decode('ascii'))
 
+    def _which(self, name):
+        """Resolve an executable on PATH once and cache the result."""
+        if name not in self._path_bins:
+            self._path_bins[name] = shutil.which(name)
+        return self._path_bins[name]
+
+    @staticmethod
+    def _is_executable(path):
+        """Check that a resolved tool path exists and is executable."""
+        return bool(path) and os.access(path, os.X_OK)
+
+    def _version_line(self, cmd):
+        """
+        Run a ``--version``-style probe and return its first output line.
+
+        Version strings are only cosmetic, so basic installs skip the
+        subprocess entirely and rely on the executable check instead.
+
+        Returns:
+            First line of stdout, or None if skipped or the probe failed
+        """
+        if self.install_type == "basic":
+            return None
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=10
+            )
+            # Only the first line matters; avoid splitting the whole banner
+            return result.stdout.partition('\n')[0].strip() or None
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            return None
+
+    def _compute_plan_key(self):
+        """
+        Fingerprint everything that decides what this run installs.
+
+        Returns:
+            SHA-256 hex digest of install type, installer options, platform,
+            interpreter (including when its venv was created) and the
+            project's pyproject.toml
+        """
+        pyproject = Path("pyproject.toml")
+        # A venv recreated at the same path gets a new pyvenv.cfg
+        try:
+            venv_created = (Path(sys.prefix) / "pyvenv.cfg").stat().st_mtime_ns
+        except OSError:
+            venv_created = 0
+        plan = (
+            self.install_type,
+            bool(self.pip_frontend),
+            self.compile_bytecode,
+            self.system,
+            sys.executable,
+            sys.prefix,
+            venv_created,
+            sys.version_info[:2],
+            pyproject.read_bytes() if pyproject.exists() else b"",
+        )
+        return hashlib.sha256(repr(plan).encode()).hexdigest()
+
+    @property
+    def plan_sentinel(self):
+        """Marker file written after a successful run of this exact plan."""
+        return Path.home() / ".cache" / "terminalai-install" / f"{self.plan_key}.ok"
+
+    def _pip_install_cmd(self, use_uv=True):
+        """
+        Return the ``install`` command of the package installer frontend.
+
+        uv's resolver and parallel downloader are much faster than pip for
+        multi-package installs, so it is preferred when available.
+        """
+        if use_uv and self.pip_frontend:
+            return [self.pip_frontend, "pip", "install", "--python", sys.executable]
+        return [sys.executable, "-m", "pip", "install"]
+
+    def _pip_base_cmd(self, use_uv=True):
+        """
+        Build the common ``pip install`` command prefix.
+
+        Every pip call shares one explicit wheel/HTTP cache so repeated
+        runs and CI jobs reuse downloads, and prefers binary wheels over
+        source builds.
+
+        Args:
+            use_uv: Allow the uv frontend (pass False for pip-only options
+                such as ``--report``)
+        """
+        if use_uv and self.pip_frontend:
+            # uv keeps its own cache format, is binary-first and skips
+            # bytecode compilation by default
+            cmd = self._pip_install_cmd() + ["--cache-dir", str(self.cache_dir / "uv")]
+            if self.compile_bytecode:
+                cmd.append("--compile-bytecode")
+        else:
+            cmd = self._pip_install_cmd(use_uv=False) + [
+                "--cache-dir", str(self.cache_dir),
+                "--prefer-binary",
+                "--disable-pip-version-check",
+            ]
+            # Nothing in the install flow needs .pyc files up front, and
+            # compiling torch/basicsr costs noticeable CPU time
+            if not self.compile_bytecode:
+                cmd.append("--no-compile")
+        # Dev installs reuse the already-present build backend instead of
+        # creating a fresh PEP 517 build environment for every build
+        if self.install_type == "dev" and self._already_satisfied("setuptools>=61.0") \
+                and self._already_satisfied("wheel"):
+            cmd.append("--no-build-isolation")
+        return cmd
+
+    def _pip_output(self):
+        """
+        Output redirection for pip installs.
+
+        pip's progress output is never inspected, so it is discarded
+        rather than buffered in memory; stderr is kept for diagnostics.
+        With --verbose both streams go straight to the terminal.
+        """
+        if self.verbose:
+            return {}
+        return {"stdout": subprocess.DEVNULL, "stderr": subprocess.PIPE}
+
+    def _log_pip_failure(self, stderr):
+        """Log the tail of pip's stderr from a failed install."""
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode("utf-8", "replace")
+        for line in (stderr or "").strip().splitlines()[-5:]:
+            self.log_warn(f"  {line}")
+
     def check_python_version(self):
         """Verify Python version meets requirements."""
-        self.log("Checking Python version...", "STEP")
+        self.log_step("Checking Python version...")
         version = sys.version_info
         if version.major < 3 or (version.major == 3 and version.minor < 10):
             self.errors.append(
                 f"Python 3.10+ required, found {version.major}.{version.minor}"
             )
             return False
-        self.log(f"Python {version.major}.{version.minor}.{version.micro}")
+        self.log_info(f"Python {version.major}.{version.minor}.{version.micro}")
         return True
 
     def check_pip(self):
         """Verify pip is available."""
-        self.log("Checking pip...", "STEP")
+        self.log_step("Checking pip...")
         try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "--version"],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-            self.log("pip is available")
+            import pip
+            self.log_info(f"pip {pip.__version__} is available")
             return True
-        except subprocess.CalledProcessError:
+        except ImportError:
             self.errors.append("pip not found - please install pip")
             return False
 
     def check_rust(self):
         """Check if Rust and Cargo are installed."""
-        self.log("Checking Rust compiler...", "STEP")
+        self.log_step("Checking Rust compiler...")
 
         # Check for cargo (Rust package manager)
         cargo_path = shutil.which("cargo")
         rustc_path = shutil.which("rustc")
 
-        if cargo_path and rustc_path:
-            try:
-                # Get Rust version
-                result = subprocess.run(
-                    ["rustc", "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=5
-                )
-                version = result.stdout.strip()
-                self.log(f"Rust found: {version}")
-                return True
-            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                pass
+        if self._is_executable(cargo_path) and self._is_executable(rustc_path):
+            version = self._version_line([rustc_path, "--version"])
+            self.log_info(f"Rust found: {version or rustc_path}")
+            return True
 
-        self.log("Rust compiler not found", "WARN")
+        self.log_warn("Rust compiler not found")
         return False
 
     def install_rust(self):
         """Install Rust compiler automatically."""
-        self.log("Installing Rust compiler (required for DeepFilterNet)...", "STEP")
+        self.log_step("Installing Rust compiler (required for DeepFilterNet)...")
 
         try:
             if self.system == "Windows":
                 # Windows: Download and run rustup-init.exe
-                self.log("Downloading rustup-init.exe...")
+                self.log_info("Downloading rustup-init.exe...")
 
                 import urllib.request
                 import tempfile
@@ -141,29 +361,30 @@ class TerminalAIInstaller:
 
                     try:
                         urllib.request.urlretrieve(rustup_url, rustup_path)
-                        self.log("Downloaded rustup-init.exe")
+                        self.log_info("Downloaded rustup-init.exe")
                     except Exception as e:
                         self.errors.append(f"Failed to download rustup: {e}")
                         return False
 
                     # Run rustup-init with silent installation
-                    self.log("Running rustup installer (this may take a few minutes)...")
+                    self.log_info("Running rustup installer (this may take a few minutes)...")
                     try:
                         result = subprocess.run(
                             [str(rustup_path), "-y", "--default-toolchain", "stable"],
-                            capture_output=True,
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE,
                             text=True,
                             timeout=600  # 10 minutes timeout
                         )
 
                         if result.returncode == 0:
-                            self.log("Rust installed successfully")
+                            self.log_info("Rust installed successfully")
 
                             # Update PATH for current session
                             cargo_bin = Path.home() / ".cargo" / "bin"
                             if cargo_bin.exists():
                                 os.environ["PATH"] = f"{cargo_bin}{os.pathsep}{os.environ['PATH']}"
-                                self.log(f"Added {cargo_bin} to PATH")
+                                self.log_info(f"Added {cargo_bin} to PATH")
 
                             self.installed.append("Rust compiler and Cargo")
                             return True
@@ -180,7 +401,7 @@ class TerminalAIInstaller:
 
             else:
                 # Linux/macOS: Use curl | sh method
-                self.log("Running rustup installer via curl...")
+                self.log_info("Running rustup installer via curl...")
 
                 try:
                     # Download and run rustup script
@@ -208,7 +429,7 @@ class TerminalAIInstaller:
                     stdout, stderr = sh_proc.communicate(timeout=600)
 
                     if sh_proc.returncode == 0:
-                        self.log("Rust installed successfully")
+                        self.log_info("Rust installed successfully")
 
                         # Source cargo env for current session
                         cargo_env = Path.home() / ".cargo" / "env"
@@ -216,7 +437,7 @@ class TerminalAIInstaller:
                             # Update PATH
                             cargo_bin = Path.home() / ".cargo" / "bin"
                             os.environ["PATH"] = f"{cargo_bin}{os.pathsep}{os.environ['PATH']}"
-                            self.log(f"Added {cargo_bin} to PATH")
+                            self.log_info(f"Added {cargo_bin} to PATH")
 
                         self.installed.append("Rust compiler and Cargo")
                         return True
@@ -240,7 +461,7 @@ class TerminalAIInstaller:
 
     def install_package(self):
         """Install TerminalAI package with appropriate extras."""
-        self.log("Installing TerminalAI package...", "STEP")
+        self.log_step("Installing TerminalAI package...")
 
         # First install base package + dev if requested
         extras = []
@@ -252,18 +473,21 @@ class TerminalAIInstaller:
         else:
             extras_str = ""
 
-        try:
-            cmd = [sys.executable, "-m", "pip", "install", "-e", f".{extras_str}"]
-            self.log(f"Running: {' '.join(cmd)}")
-            subprocess.run(cmd, check=True)
+        if self._editable_install_current(extras):
+            self.log_info(f"TerminalAI package{extras_str} already installed editable - skipping")
+        else:
+            cmd = self._pip_base_cmd() + ["-e", f".{extras_str}"]
+            self.log_info(f"Running: {' '.join(cmd)}")
+            ok, stderr = self._run_pip_cmd(cmd, timeout=900)
+            if not ok:
+                self._log_pip_failure(stderr)
+                self.errors.append(f"Failed to install base package{extras_str}")
+                return False
             self.installed.append(f"TerminalAI package{extras_str}")
-        except subprocess.CalledProcessError as e:
-            self.errors.append(f"Failed to install base package: {e}")
-            return False
 
         # Install PyTorch with CUDA support FIRST (Windows-specific)
         if self.install_type in ["full", "audio"] and self.system == "Windows":
-            self.log("Installing PyTorch with CUDA support (Windows)...", "STEP")
+            self.log_step("Installing PyTorch with CUDA support (Windows)...")
             if self._install_pytorch_windows():
                 self.installed.append("PyTorch with CUDA support")
             else:
@@ -271,188 +495,413 @@ class TerminalAIInstaller:
 
         # Try to install audio extras separately (optional, may fail on some platforms)
         if self.install_type in ["full", "audio"]:
-            self.log("Attempting to install audio AI features...", "STEP")
-            self.log("Note: Audio features require PyTorch (installed above)")
+            self.log_step("Attempting to install audio AI features...")
+            self.log_info("Note: Audio features require PyTorch (installed above)")
             try:
-                # Install Demucs first (most stable)
-                try:
-                    cmd = [sys.executable, "-m", "pip", "install", "demucs>=4.0.0"]
-                    subprocess.run(cmd, check=True, capture_output=True)
-                    self.installed.append("demucs")
-                except subprocess.CalledProcessError:
-                    self.warnings.append("Failed to install demucs (optional)")
-
-                # Install DeepFilterNet (requires Rust compiler)
-                try:
-                    # Check for Rust, install if missing
-                    if not self.check_rust():
-                        self.log("DeepFilterNet requires Rust compiler - installing...", "STEP")
-                        if not self.install_rust():
-                            self.warnings.append("Failed to install Rust - skipping deepfilternet")
-                        else:
-                            # Retry DeepFilterNet installation after Rust is installed
-                            try:
-                                cmd = [sys.executable, "-m", "pip", "install", "deepfilternet>=0.5.0"]
-                                subprocess.run(cmd, check=True, capture_output=True, timeout=300)
-                                self.installed.append("deepfilternet")
-                            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                                self.warnings.append("Failed to install deepfilternet even with Rust installed")
-                    else:
-                        # Rust already available, install DeepFilterNet directly
-                        cmd = [sys.executable, "-m", "pip", "install", "deepfilternet>=0.5.0"]
-                        subprocess.run(cmd, check=True, capture_output=True, timeout=300)
-                        self.installed.append("deepfilternet")
-                except subprocess.CalledProcessError:
-                    self.warnings.append("Failed to install deepfilternet (optional)")
-                except subprocess.TimeoutExpired:
-                    self.warnings.append("DeepFilterNet installation timed out (may still be building)")
-
-                # Install AudioSR (optional, often fails on Windows)
-                try:
-                    cmd = [sys.executable, "-m", "pip", "install", "audiosr>=0.0.4"]
-                    subprocess.run(cmd, check=True, capture_output=True, timeout=300)
-                    self.installed.append("audiosr")
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                    self.warnings.append("Failed to install audiosr (optional, known Windows issues)")
+                self._install_demucs()
+                self._install_deepfilternet()
+                self._install_audiosr()
             except Exception as e:
                 self.warnings.append(f"Audio features installation failed (optional): {e}")
 
         return True
 
-    def _install_pytorch_windows(self):
+    def _editable_install_current(self, extras):
         """
-        Install PyTorch with CUDA support on Windows.
-        Detects GPU hardware BEFORE downloading to install correct version.
+        Check whether this source tree is already installed in editable mode.
+
+        Uses the PEP 610 ``direct_url.json`` record of the installed
+        distribution. Runtime requirements (and those of the requested
+        extras) must still be satisfied, so a changed dependency list
+        still triggers a reinstall.
+
+        Args:
+            extras: Extras requested for the editable install
 
         Returns:
-            True if successful, False otherwise
+            True if ``pip install -e .`` would be a no-op
         """
-        # Detect NVIDIA GPU details using nvidia-smi (lightweight, no downloads)
-        has_cuda = False
-        cuda_version = None
-        gpu_name = None
-        compute_cap = None
+        if Requirement is None:
+            return False
+        try:
+            dist = importlib.metadata.distribution("terminalai")
+            direct_url = json.loads(dist.read_text("direct_url.json") or "{}")
+        except (importlib.metadata.PackageNotFoundError, json.JSONDecodeError):
+            return False
+
+        if not direct_url.get("dir_info", {}).get("editable"):
+            return False
+        if direct_url.get("url") != Path.cwd().resolve().as_uri():
+            return False
+
+        for spec in dist.requires or []:
+            try:
+                req = Requirement(spec)
+            except InvalidRequirement:
+                return False
+            if req.marker and not any(
+                req.marker.evaluate({"extra": extra}) for extra in ["", *extras]
+            ):
+                continue
+            if not self._already_satisfied(spec):
+                return False
+        return True
+
+    def _install_demucs(self):
+        """Queue Demucs stem separation (most stable audio extra)."""
+        self._queue_pip("demucs", ["demucs>=4.0.0"],
+                        "Failed to install demucs (optional)")
 
+    def _install_deepfilternet(self):
+        """Queue DeepFilterNet, installing the Rust compiler it needs first."""
+        if self.check_rust():
+            warning = "Failed to install deepfilternet (optional)"
+        else:
+            self.log_step("DeepFilterNet requires Rust compiler - installing...")
+            if not self.install_rust():
+                self.warnings.append("Failed to install Rust - skipping deepfilternet")
+                return
+            warning = "Failed to install deepfilternet even with Rust installed"
+
+        # The Rust build is CPU-bound, so it runs next to the network-bound
+        # batch instead of inside it
+        self._queue_pip("deepfilternet", ["deepfilternet>=0.5.0"], warning,
+                        source_build=True)
+
+    def _install_audiosr(self):
+        """Queue AudioSR upsampling (optional, often fails on Windows)."""
+        self._queue_pip("audiosr", ["audiosr>=0.0.4"],
+                        "Failed to install audiosr (optional, known Windows issues)")
+
+    def _already_satisfied(self, spec):
+        """
+        Check whether a requirement is already met by the current environment.
+
+        Args:
+            spec: Requirement specifier, e.g. ``"demucs>=4.0.0"``
+
+        Returns:
+            True if an installed distribution satisfies the spec
+        """
+        if Requirement is None:
+            return False
         try:
-            # Get GPU name, driver version, and compute capability
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name,driver_version,compute_cap", "--format=csv,noheader"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5
+            req = Requirement(spec)
+        except InvalidRequirement:
+            return False
+
+        if self._installed_versions is None:
+            self._installed_versions = {
+                _canonical_name(dist.metadata["Name"]): dist.version
+                for dist in importlib.metadata.distributions()
+                if dist.metadata["Name"]
+            }
+
+        version = self._installed_versions.get(_canonical_name(req.name))
+        if version is None:
+            return False
+        return req.specifier.contains(version, prereleases=True)
+
+    def _queue_pip(self, label, specs, warning, source_build=False):
+        """
+        Queue optional packages for the batched pip install.
+
+        Args:
+            label: Name recorded in the summary once installed
+            specs: Requirement specifiers installed together
+            warning: Warning recorded if the packages fail to install
+            source_build: Packages are compiled locally; build their wheels
+                concurrently with the batched install
+        """
+        if all(self._already_satisfied(spec) for spec in specs):
+            self.log_info(f"{label} already present")
+            return
+        self._pending_installs.append((label, list(specs), warning))
+        if source_build:
+            self._source_builds.extend(specs)
+
+    def _flush_pip(self):
+        """
+        Install all queued optional packages with one pip invocation.
+
+        pip resolves the combined requirement set once instead of once per
+        package. Packages that compile from source get their wheels built
+        by separate pip processes at the same time, so the CPU-bound build
+        overlaps the network-bound batch, and are installed from those
+        wheels afterwards. If the batch fails, the queued groups are
+        retried on their own so failures are still attributed to the
+        right feature.
+        """
+        if not self._pending_installs:
+            return True
+
+        pending, self._pending_installs = self._pending_installs, []
+        source_builds, self._source_builds = self._source_builds, []
+        compiled = [item for item in pending if set(item[1]) & set(source_builds)]
+        batched = [item for item in pending if item not in compiled]
+        specs = list(dict.fromkeys(spec for _, group, _ in batched for spec in group))
+        wheel_dir = self.cache_dir / "wheels"
+
+        commands = []
+        if specs:
+            self.log_step(f"Installing optional packages: {' '.join(specs)}")
+            local_wheels = self._prefetch_wheels(specs) if self.parallel_download else []
+            commands.append([*self._pip_base_cmd(), *local_wheels, *specs])
+        if compiled:
+            self.log_step(f"Building from source: {' '.join(source_builds)}")
+            commands += [self._pip_wheel_cmd(wheel_dir) + [spec] for spec in source_builds]
+
+        # Same time budget the groups had when installed one by one
+        timeout = 300 * len(pending)
+        if compiled:
+            results = asyncio.run(self._run_concurrently(commands, timeout))
+        else:
+            results = [self._run_pip_cmd(commands[0], timeout)]
+
+        if batched:
+            ok, stderr = results[0]
+            if ok:
+                self.installed.extend(label for label, _, _ in batched)
+            else:
+                self._log_pip_failure(stderr)
+                self.log_warn("Batched install failed - retrying packages individually")
+                self._install_groups(batched)
+
+        # Install the freshly built wheels; their remaining dependencies
+        # were mostly satisfied by the batch above
+        for label, group, warning in compiled:
+            ok, _ = self._run_pip_cmd(
+                [*self._pip_base_cmd(), "--find-links", str(wheel_dir), *group], 300
             )
+            if ok:
+                self.installed.append(label)
+            else:
+                self.warnings.append(warning)
 
-            if result.stdout.strip():
-                parts = [p.strip() for p in result.stdout.strip().split(",")]
-                gpu_name = parts[0] if len(parts) > 0 else None
-                driver_version = parts[1] if len(parts) > 1 else None
-                compute_cap = parts[2] if len(parts) > 2 else None
-
-                self.log(f"Detected GPU: {gpu_name}")
-                self.log(f"Driver: {driver_version}, Compute Capability: {compute_cap}")
-
-                # Determine CUDA version based on Python version and GPU
-                python_version = sys.version_info
-                use_nightly = False
-
-                # RTX 50 series requires PyTorch nightly with CUDA 12.8 for compute capability 12.0
-                if gpu_name and "RTX 50" in gpu_name:
-                    use_nightly = True
-                    cuda_version = "cu128"
-                    self.log(f"RTX 50 series detected - installing PyTorch nightly with CUDA 12.8 for sm_120 support")
-                elif python_version.minor >= 13:
-                    # Python 3.13+ requires newer PyTorch with cu124
-                    cuda_version = "cu124"
-                    self.log("Python 3.13+ detected - using CUDA 12.4 index")
-                elif python_version.minor == 12:
-                    # Python 3.12 works with cu121 or cu124
-                    cuda_version = "cu121"
-                    self.log("Python 3.12 detected - using CUDA 12.1 index")
-                else:
-                    # Python 3.10-3.11
-                    cuda_version = "cu121"
-                    self.log("Python 3.10/3.11 detected - using CUDA 12.1 index")
+        return True
+
+    def _install_groups(self, pending):
+        """
+        Install queued groups one by one after a failed batch.
+
+        The retries stay sequential: the groups share transitive
+        dependencies (torch, torchaudio, numpy), and concurrent pip
+        processes unpacking the same distribution into one site-packages
+        can corrupt its dist-info.
+
+        Args:
+            pending: Queued (label, specs, warning) groups
+        """
+        for label, group, warning in pending:
+            ok, _ = self._run_pip_cmd([*self._pip_base_cmd(), *group], 300)
+            if ok:
+                self.installed.append(label)
+            else:
+                self.warnings.append(warning)
+
+    def _pip_wheel_cmd(self, wheel_dir):
+        """Command that builds a single package's wheel into ``wheel_dir``."""
+        return [
+            sys.executable, "-m", "pip", "wheel",
+            "--cache-dir", str(self.cache_dir),
+            "--disable-pip-version-check",
+            "--no-deps",
+            "--wheel-dir", str(wheel_dir),
+        ]
+
+    def _run_pip_cmd(self, cmd, timeout=600, retries=2):
+        """
+        Run one pip command, retrying if it hangs.
+
+        Args:
+            cmd: Full pip command
+            timeout: Seconds allowed per attempt
+            retries: Extra attempts after a timeout, with exponential backoff
+
+        Returns:
+            Tuple of (succeeded, stderr or None)
+        """
+        for attempt in range(retries + 1):
+            try:
+                subprocess.run(cmd, check=True, timeout=timeout, **self._pip_output())
+                return True, None
+            except subprocess.CalledProcessError as e:
+                return False, e.stderr
+            except subprocess.TimeoutExpired as e:
+                if attempt == retries:
+                    return False, e.stderr
+                delay = 2 ** attempt
+                self.log_warn(f"pip timed out after {timeout}s - retrying in {delay}s")
+                time.sleep(delay)
+
+    async def _run_concurrently(self, commands, timeout, max_parallel=3):
+        """
+        Run several pip processes at once.
+
+        Args:
+            commands: Commands to run
+            timeout: Per-command timeout in seconds
+            max_parallel: Maximum number of processes alive at once
+
+        Returns:
+            List of (succeeded, stderr or None), in command order
+        """
+        semaphore = asyncio.Semaphore(max_parallel)
+        output = self._pip_output()
+
+        async def run(cmd):
+            async with semaphore:
+                proc = await asyncio.create_subprocess_exec(*cmd, **output)
+                try:
+                    _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    return False, None
+                return proc.returncode == 0, stderr
+
+        return await asyncio.gather(*(run(cmd) for cmd in commands))
+
+    def _resolve_plan(self, specs):
+        """
+        Resolve the full dependency set once with ``pip --dry-run --report``.
+
+        Args:
+            specs: Requirement specifiers to resolve together
+
+        Returns:
+            Download URLs of every distribution pip would install
+        """
+        cmd = [*self._pip_base_cmd(use_uv=False), "--dry-run", "--quiet", "--report", "-", *specs]
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=600)
+        report = json.loads(result.stdout)
+        return [
+            item["download_info"]["url"]
+            for item in report.get("install", [])
+            if item.get("download_info", {}).get("url", "").startswith(("http://", "https://"))
+        ]
+
+    def _prefetch_wheels(self, specs, max_workers=8):
+        """
+        Download the resolved install plan in parallel into the wheel cache.
+
+        pip fetches distributions one at a time; resolving once and
+        downloading concurrently lets the large transfers overlap.
+
+        Returns:
+            Extra pip arguments pointing at the local wheels (empty if the
+            plan could not be resolved)
+        """
+        try:
+            urls = self._resolve_plan(specs)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired,
+                json.JSONDecodeError, KeyError) as e:
+            self.log_warn(f"Could not resolve install plan, using pip downloads: {e}")
+            return []
+        if not urls:
+            return []
+
+        wheel_dir = self.cache_dir / "wheels"
+        wheel_dir.mkdir(parents=True, exist_ok=True)
+
+        def download(url):
+            filename = urllib.parse.unquote(Path(urllib.parse.urlparse(url).path).name)
+            target = wheel_dir / filename
+            if target.exists():
+                return target
+            partial = target.with_name(filename + ".part")
+            with urllib.request.urlopen(url, timeout=60) as response, open(partial, "wb") as f:
+                shutil.copyfileobj(response, f)
+            partial.replace(target)
+            return target
+
+        self.log_info(f"Downloading {len(urls)} distributions ({max_workers} parallel)...")
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                files = list(executor.map(download, urls))
+        except OSError as e:
+            self.log_warn(f"Parallel download failed, using pip downloads: {e}")
+            return ["--find-links", str(wheel_dir)]
 
-                has_cuda = True
-                self.details["use_pytorch_nightly"] = use_nightly
+        # Source distributions may still need build requirements from the index
+        if all(f.suffix == ".whl" for f in files):
+            return ["--no-index", "--find-links", str(wheel_dir)]
+        return ["--find-links", str(wheel_dir)]
 
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-            self.log("No NVIDIA GPU detected - installing CPU-only PyTorch", "WARN")
-            self.log(f"Detection details: {e}", "DEBUG")
+    def _install_pytorch_windows(self):
+        """
+        Install PyTorch with CUDA support on Windows.
+        Detects GPU hardware BEFORE downloading to install correct version.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Detect NVIDIA GPU details using nvidia-smi (lightweight, no downloads)
+        gpu_name, driver_version = self._query_gpu_info()
+        cuda_tag = self.cuda_index_tag
+        has_cuda = cuda_tag is not None
+        packages = ["torch", "torchvision", "torchaudio"]
 
         # Install PyTorch with appropriate CUDA support
         try:
-            if has_cuda and cuda_version:
-                # Use nightly builds for RTX 50 series (compute capability 12.0)
-                if self.details.get("use_pytorch_nightly", False):
-                    index_url = f"https://download.pytorch.org/whl/nightly/{cuda_version}"
-                    packages = ["torch", "torchvision", "torchaudio"]
-                    self.log(f"Installing PyTorch NIGHTLY with CUDA {cuda_version} for {gpu_name}...")
-                    self.log("(Nightly required for RTX 50 series sm_120 support)")
+            if has_cuda:
+                self.log_info(f"Detected GPU: {gpu_name}")
+                self.log_info(f"Driver: {driver_version}")
+                index_url = f"https://download.pytorch.org/whl/{cuda_tag}"
+                # Nightly builds for RTX 50 series (compute capability 12.0)
+                if cuda_tag.startswith("nightly/"):
+                    self.log_info(f"Installing PyTorch NIGHTLY with CUDA {cuda_tag} for {gpu_name}...")
+                    self.log_info("(Nightly required for RTX 50 series sm_120 support)")
                 else:
-                    index_url = f"https://download.pytorch.org/whl/{cuda_version}"
-                    packages = ["torch", "torchvision", "torchaudio"]
-                    self.log(f"Installing PyTorch with CUDA {cuda_version} support for {gpu_name}...")
+                    self.log_info(f"Installing PyTorch with CUDA {cuda_tag} support for {gpu_name}...")
             else:
+                self.log_warn("No NVIDIA GPU detected - installing CPU-only PyTorch")
                 index_url = None
-                packages = ["torch", "torchvision", "torchaudio"]
-                self.log("Installing CPU-only PyTorch...")
-
-            cmd = [sys.executable, "-m", "pip", "install"] + packages
-            if index_url:
-                cmd.extend(["--index-url", index_url])
+                self.log_info("Installing CPU-only PyTorch...")
 
-            subprocess.run(cmd, check=True, timeout=600)
+            if all(self._already_satisfied(package) for package in packages):
+                self.log_info("PyTorch already present - skipping download")
+            else:
+                cmd = self._pip_base_cmd() + packages
+                if index_url:
+                    cmd.extend(["--index-url", index_url])
+
+                ok, stderr = self._run_pip_cmd(cmd)
+                if not ok:
+                    self._log_pip_failure(stderr)
+                    self.errors.append("PyTorch installation failed")
+                    return False
 
             # Verify CUDA availability
             if has_cuda:
                 try:
-                    verify_cmd = [
-                        sys.executable, "-c",
-                        "import torch; print(f'CUDA available: {torch.cuda.is_available()}'); "
-                        "print(f'Device: {torch.cuda.get_device_name(0) if torch.cuda.is_available() else \"N/A\"}')"
-                    ]
-                    result = subprocess.run(verify_cmd, capture_output=True, text=True, timeout=10)
-                    self.log(result.stdout.strip())
-
-                    if "CUDA available: False" in result.stdout:
+                    importlib.invalidate_caches()
+                    import torch
+                    cuda_available = torch.cuda.is_available()
+                    self.log_info(f"CUDA available: {cuda_available}")
+                    if cuda_available:
+                        self.log_info(f"Device: {torch.cuda.get_device_name(0)}")
+                    else:
                         self.warnings.append(
                             "PyTorch installed but CUDA not available. "
                             "This may be due to driver/CUDA version mismatch."
                         )
                 except Exception as e:
-                    self.log(f"CUDA verification warning: {e}", "WARN")
+                    self.log_warn(f"CUDA verification warning: {e}")
 
             return True
-        except subprocess.CalledProcessError as e:
-            self.log(f"PyTorch installation failed: {e}", "ERROR")
+        except Exception as e:
+            self.log_error(f"PyTorch installation failed: {e}")
             self.errors.append(f"PyTorch installation failed: {e}")
             return False
-        except subprocess.TimeoutExpired:
-            self.log("PyTorch installation timed out", "ERROR")
-            self.errors.append("PyTorch installation timed out after 10 minutes")
-            return False
 
     def check_ffmpeg(self):
         """Check if FFmpeg is installed."""
-        self.log("Checking FFmpeg...", "STEP")
-        ffmpeg_path = shutil.which("ffmpeg")
-        ffprobe_path = shutil.which("ffprobe")
-
-        if ffmpeg_path and ffprobe_path:
-            try:
-                result = subprocess.run(
-                    ["ffmpeg", "-version"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                version = result.stdout.split('\n')[0]
-                self.log(f"FFmpeg found: {version}")
-                return True
-            except subprocess.CalledProcessError:
-                pass
+        self.log_step("Checking FFmpeg...")
+        if self._is_executable(self.ffmpeg_path) and self._is_executable(self.ffprobe_path):
+            version = self._version_line([self.ffmpeg_path, "-version"])
+            self.log_info(f"FFmpeg found: {version or self.ffmpeg_path}")
+            return True
 
         self.warnings.append("FFmpeg not found - required for video processing")
         return False
@@ -464,7 +913,7 @@ class TerminalAIInstaller:
         Returns:
             True if build tools are available, False otherwise
         """
-        self.log("Checking C/C++ build tools...", "STEP")
+        self.log_step("Checking C/C++ build tools...")
 
         if self.system == "Windows":
             # Check for Visual Studio Build Tools or MSVC
@@ -472,7 +921,7 @@ class TerminalAIInstaller:
                 # Check if cl.exe is in PATH
                 cl_path = shutil.which("cl")
                 if cl_path:
-                    self.log(f"MSVC compiler found: {cl_path}")
+                    self.log_info(f"MSVC compiler found: {cl_path}")
                     return True
 
                 # Check common installation paths via vswhere
@@ -484,12 +933,12 @@ class TerminalAIInstaller:
                         text=True
                     )
                     if result.returncode == 0 and result.stdout.strip():
-                        self.log("Visual Studio Build Tools found")
+                        self.log_info("Visual Studio Build Tools found")
                         return True
             except Exception:
                 pass
 
-            self.log("Build tools not found (required for some packages)", "WARN")
+            self.log_warn("Build tools not found (required for some packages)")
             return False
 
         elif self.system == "Darwin":
@@ -502,10 +951,10 @@ class TerminalAIInstaller:
                     check=True
                 )
                 if result.returncode == 0:
-                    self.log(f"Xcode Command Line Tools found: {result.stdout.strip()}")
+                    self.log_info(f"Xcode Command Line Tools found: {result.stdout.strip()}")
                     return True
             except (subprocess.CalledProcessError, FileNotFoundError):
-                self.log("Xcode Command Line Tools not found", "WARN")
+                self.log_warn("Xcode Command Line Tools not found")
                 return False
 
         else:  # Linux
@@ -515,18 +964,9 @@ class TerminalAIInstaller:
             has_make = shutil.which("make") is not None
 
             if has_gcc and has_gxx and has_make:
-                try:
-                    result = subprocess.run(
-                        ["gcc", "--version"],
-                        capture_output=True,
-                        text=True,
-                        check=True
-                    )
-                    version = result.stdout.split('\n')[0]
-                    self.log(f"Build tools found: {version}")
-                    return True
-                except subprocess.CalledProcessError:
-                    pass
+                version = self._version_line(["gcc", "--version"])
+                self.log_info(f"Build tools found: {version or 'gcc, g++, make'}")
+                return True
 
             missing = []
             if not has_gcc:
@@ -537,7 +977,7 @@ class TerminalAIInstaller:
                 missing.append("make")
 
             if missing:
-                self.log(f"Missing build tools: {', '.join(missing)}", "WARN")
+                self.log_warn(f"Missing build tools: {', '.join(missing)}")
                 return False
 
         return False
@@ -549,76 +989,76 @@ class TerminalAIInstaller:
         Returns:
             True if installation succeeded or user should install manually
         """
-        self.log("Installing C/C++ build tools...", "STEP")
+        self.log_step("Installing C/C++ build tools...")
 
         if self.system == "Windows":
-            self.log("Build tools installation on Windows:", "WARN")
-            self.log("Option 1 - Visual Studio Build Tools (recommended):", "WARN")
-            self.log("  1. Download from: https://visualstudio.microsoft.com/downloads/", "WARN")
-            self.log("  2. Run installer and select 'Desktop development with C++'", "WARN")
-            self.log("  3. Restart terminal after installation", "WARN")
-            self.log("", "WARN")
-            self.log("Option 2 - Quick command (if winget available):", "WARN")
-            self.log("  winget install Microsoft.VisualStudio.2022.BuildTools", "WARN")
-            self.log("", "WARN")
-            self.log("Note: Build tools are optional but needed for DeepFilterNet", "WARN")
+            self.log_warn("Build tools installation on Windows:")
+            self.log_warn("Option 1 - Visual Studio Build Tools (recommended):")
+            self.log_warn("  1. Download from: https://visualstudio.microsoft.com/downloads/")
+            self.log_warn("  2. Run installer and select 'Desktop development with C++'")
+            self.log_warn("  3. Restart terminal after installation")
+            self.log_warn("")
+            self.log_warn("Option 2 - Quick command (if winget available):")
+            self.log_warn("  winget install Microsoft.VisualStudio.2022.BuildTools")
+            self.log_warn("")
+            self.log_warn("Note: Build tools are optional but needed for DeepFilterNet")
             self.warnings.append("Build tools need manual installation on Windows")
             return True  # Don't fail installation, just warn
 
         elif self.system == "Darwin":
-            self.log("Attempting to install Xcode Command Line Tools...")
+            self.log_info("Attempting to install Xcode Command Line Tools...")
             try:
                 # Trigger installation dialog
                 subprocess.run(
                     ["xcode-select", "--install"],
                     check=False  # May fail if already installed
                 )
-                self.log("Xcode Command Line Tools installation started", "WARN")
-                self.log("Please follow the installation dialog and restart terminal", "WARN")
+                self.log_warn("Xcode Command Line Tools installation started")
+                self.log_warn("Please follow the installation dialog and restart terminal")
                 return True
             except Exception as e:
-                self.log(f"Failed to trigger installation: {e}", "ERROR")
-                self.log("Install manually: xcode-select --install", "WARN")
+                self.log_error(f"Failed to trigger installation: {e}")
+                self.log_warn("Install manually: xcode-select --install")
                 self.warnings.append("Build tools need manual installation")
                 return True
 
         else:  # Linux
-            self.log("Build tools can be installed with package manager:", "WARN")
+            self.log_warn("Build tools can be installed with package manager:")
 
             # Detect package manager
-            if shutil.which("apt-get"):
-                self.log("Debian/Ubuntu detected. Install with:", "WARN")
-                self.log("  sudo apt-get update", "WARN")
-                self.log("  sudo apt-get install build-essential", "WARN")
+            if self._which("apt-get"):
+                self.log_warn("Debian/Ubuntu detected. Install with:")
+                self.log_warn("  sudo apt-get update")
+                self.log_warn("  sudo apt-get install build-essential")
 
                 # Attempt automatic installation if running as root
                 if os.geteuid() == 0:
                     try:
-                        self.log("Attempting automatic installation...")
+                        self.log_info("Attempting automatic installation...")
                         subprocess.run(["apt-get", "update"], check=True)
                         subprocess.run(["apt-get", "install", "-y", "build-essential"], check=True)
-                        self.log("Build tools installed successfully")
+                        self.log_info("Build tools installed successfully")
                         self.installed.append("build-essential")
                         return True
                     except subprocess.CalledProcessError as e:
-                        self.log(f"Installation failed: {e}", "ERROR")
+                        self.log_error(f"Installation failed: {e}")
                         return False
 
-            elif shutil.which("dnf"):
-                self.log("Fedora/RHEL detected. Install with:", "WARN")
-                self.log("  sudo dnf groupinstall 'Development Tools'", "WARN")
+            elif self._which("dnf"):
+                self.log_warn("Fedora/RHEL detected. Install with:")
+                self.log_warn("  sudo dnf groupinstall 'Development Tools'")
 
-            elif shutil.which("yum"):
-                self.log("CentOS/RHEL detected. Install with:", "WARN")
-                self.log("  sudo yum groupinstall 'Development Tools'", "WARN")
+            elif self._which("yum"):
+                self.log_warn("CentOS/RHEL detected. Install with:")
+                self.log_warn("  sudo yum groupinstall 'Development Tools'")
 
-            elif shutil.which("pacman"):
-                self.log("Arch Linux detected. Install with:", "WARN")
-                self.log("  sudo pacman -S base-devel", "WARN")
+            elif self._which("pacman"):
+                self.log_warn("Arch Linux detected. Install with:")
+                self.log_warn("  sudo pacman -S base-devel")
 
             else:
-                self.log("Unknown Linux distribution", "WARN")
-                self.log("Install gcc, g++, and make using your package manager", "WARN")
+                self.log_warn("Unknown Linux distribution")
+                self.log_warn("Install gcc, g++, and make using your package manager")
 
             self.warnings.append("Build tools need manual installation (requires sudo)")
             return True  # Don't fail, just warn
@@ -630,67 +1070,67 @@ class TerminalAIInstaller:
         Returns:
             True if installation succeeded, False otherwise
         """
-        self.log("Installing FFmpeg...", "STEP")
+        self.log_step("Installing FFmpeg...")
 
         if self.system == "Windows":
             # Check if winget is available
-            if shutil.which("winget"):
+            if self._which("winget"):
                 try:
-                    self.log("Installing FFmpeg using winget...")
+                    self.log_info("Installing FFmpeg using winget...")
                     subprocess.run(
                         ["winget", "install", "FFmpeg", "--silent"],
                         check=True,
                         timeout=300  # 5 minute timeout
                     )
-                    self.log("FFmpeg installed successfully")
+                    self.log_info("FFmpeg installed successfully")
                     self.installed.append("FFmpeg")
 
                     # Verify installation
                     if shutil.which("ffmpeg"):
                         return True
                     else:
-                        self.log("FFmpeg installed but not in PATH. Restart terminal.", "WARN")
+                        self.log_warn("FFmpeg installed but not in PATH. Restart terminal.")
                         return True
 
                 except subprocess.CalledProcessError as e:
-                    self.log(f"winget installation failed: {e}", "ERROR")
-                    self.log("Install manually:", "WARN")
-                    self.log("  Download from: https://ffmpeg.org/download.html", "WARN")
-                    self.log("  Or use: choco install ffmpeg (if Chocolatey installed)", "WARN")
+                    self.log_error(f"winget installation failed: {e}")
+                    self.log_warn("Install manually:")
+                    self.log_warn("  Download from: https://ffmpeg.org/download.html")
+                    self.log_warn("  Or use: choco install ffmpeg (if Chocolatey installed)")
                     return False
                 except subprocess.TimeoutExpired:
-                    self.log("Installation timed out", "ERROR")
+                    self.log_error("Installation timed out")
                     return False
             else:
-                self.log("winget not found. Install FFmpeg manually:", "WARN")
-                self.log("  Download from: https://ffmpeg.org/download.html", "WARN")
-                self.log("  Or install winget and run: winget install FFmpeg", "WARN")
+                self.log_warn("winget not found. Install FFmpeg manually:")
+                self.log_warn("  Download from: https://ffmpeg.org/download.html")
+                self.log_warn("  Or install winget and run: winget install FFmpeg")
                 self.warnings.append("FFmpeg needs manual installation")
                 return False
 
         elif self.system == "Darwin":
             # Check if brew is available
-            if shutil.which("brew"):
+            if self._which("brew"):
                 try:
-                    self.log("Installing FFmpeg using Homebrew...")
+                    self.log_info("Installing FFmpeg using Homebrew...")
                     subprocess.run(
                         ["brew", "install", "ffmpeg"],
                         check=True,
                         timeout=600  # 10 minute timeout (can be slow)
                     )
-                    self.log("FFmpeg installed successfully")
+                    self.log_info("FFmpeg installed successfully")
                     self.installed.append("FFmpeg")
                     return True
                 except subprocess.CalledProcessError as e:
-                    self.log(f"Homebrew installation failed: {e}", "ERROR")
+                    self.log_error(f"Homebrew installation failed: {e}")
                     return False
                 except subprocess.TimeoutExpired:
-                    self.log("Installation timed out", "ERROR")
+                    self.log_error("Installation timed out")
                     return False
             else:
-                self.log("Homebrew not found. Install FFmpeg manually:", "WARN")
-                self.log("  Install Homebrew: /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"", "WARN")
-                self.log("  Then run: brew install ffmpeg", "WARN")
+                self.log_warn("Homebrew not found. Install FFmpeg manually:")
+                self.log_warn("  Install Homebrew: /bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"")
+                self.log_warn("  Then run: brew install ffmpeg")
                 self.warnings.append("FFmpeg needs manual installation")
                 return False
 
@@ -698,66 +1138,66 @@ class TerminalAIInstaller:
             package_installed = False
 
             # Try apt (Debian/Ubuntu)
-            if shutil.which("apt-get"):
-                self.log("Debian/Ubuntu detected. Installing FFmpeg with apt...", "WARN")
+            if self._which("apt-get"):
+                self.log_warn("Debian/Ubuntu detected. Installing FFmpeg with apt...")
 
                 if os.geteuid() == 0:  # Running as root
                     try:
                         subprocess.run(["apt-get", "update"], check=True)
                         subprocess.run(["apt-get", "install", "-y", "ffmpeg"], check=True)
-                        self.log("FFmpeg installed successfully")
+                        self.log_info("FFmpeg installed successfully")
                         self.installed.append("FFmpeg")
                         package_installed = True
                     except subprocess.CalledProcessError as e:
-                        self.log(f"Installation failed: {e}", "ERROR")
+                        self.log_error(f"Installation failed: {e}")
                 else:
-                    self.log("Run with sudo to auto-install, or install manually:", "WARN")
-                    self.log("  sudo apt-get update", "WARN")
-                    self.log("  sudo apt-get install ffmpeg", "WARN")
+                    self.log_warn("Run with sudo to auto-install, or install manually:")
+                    self.log_warn("  sudo apt-get update")
+                    self.log_warn("  sudo apt-get install ffmpeg")
 
             # Try dnf (Fedora)
-            elif shutil.which("dnf"):
-                self.log("Fedora/RHEL detected. Install FFmpeg with:", "WARN")
+            elif self._which("dnf"):
+                self.log_warn("Fedora/RHEL detected. Install FFmpeg with:")
                 if os.geteuid() == 0:
                     try:
                         subprocess.run(["dnf", "install", "-y", "ffmpeg"], check=True)
-                        self.log("FFmpeg installed successfully")
+                        self.log_info("FFmpeg installed successfully")
                         self.installed.append("FFmpeg")
                         package_installed = True
                     except subprocess.CalledProcessError as e:
-                        self.log(f"Installation failed: {e}", "ERROR")
+                        self.log_error(f"Installation failed: {e}")
                 else:
-                    self.log("  sudo dnf install ffmpeg", "WARN")
+                    self.log_warn("  sudo dnf install ffmpeg")
 
             # Try yum (CentOS/older RHEL)
-            elif shutil.which("yum"):
-                self.log("CentOS/RHEL detected. Install FFmpeg with:", "WARN")
+            elif self._which("yum"):
+                self.log_warn("CentOS/RHEL detected. Install FFmpeg with:")
                 if os.geteuid() == 0:
                     try:
                         subprocess.run(["yum", "install", "-y", "ffmpeg"], check=True)
-                        self.log("FFmpeg installed successfully")
+                        self.log_info("FFmpeg installed successfully")
                         self.installed.append("FFmpeg")
                         package_installed = True
                     except subprocess.CalledProcessError as e:
-                        self.log(f"Installation failed: {e}", "ERROR")
+                        self.log_error(f"Installation failed: {e}")
                 else:
-                    self.log("  sudo yum install ffmpeg", "WARN")
+                    self.log_warn("  sudo yum install ffmpeg")
 
             # Try pacman (Arch)
-            elif shutil.which("pacman"):
-                self.log("Arch Linux detected. Install FFmpeg with:", "WARN")
+            elif self._which("pacman"):
+                self.log_warn("Arch Linux detected. Install FFmpeg with:")
                 if os.geteuid() == 0:
                     try:
                         subprocess.run(["pacman", "-S", "--noconfirm", "ffmpeg"], check=True)
-                        self.log("FFmpeg installed successfully")
+                        self.log_info("FFmpeg installed successfully")
                         self.installed.append("FFmpeg")
                         package_installed = True
                     except subprocess.CalledProcessError as e:
-                        self.log(f"Installation failed: {e}", "ERROR")
+                        self.log_error(f"Installation failed: {e}")
                 else:
-                    self.log("  sudo pacman -S ffmpeg", "WARN")
+                    self.log_warn("  sudo pacman -S ffmpeg")
             else:
-                self.log("Unknown package manager. Install FFmpeg manually.", "WARN")
+                self.log_warn("Unknown package manager. Install FFmpeg manually.")
 
             if not package_installed and os.geteuid() != 0:
                 self.warnings.append("FFmpeg needs manual installation (requires sudo)")
@@ -776,9 +1216,9 @@ class TerminalAIInstaller:
         Returns:
             Dictionary with check results
         """
-        self.log("\n" + "=" * 80, "INFO")
-        self.log("SYSTEM DEPENDENCIES CHECK", "INFO")
-        self.log("=" * 80 + "\n", "INFO")
+        self.log_info("\n" + "=" * 80)
+        self.log_info("SYSTEM DEPENDENCIES CHECK")
+        self.log_info("=" * 80 + "\n")
 
         results = {
             "build_tools": False,
@@ -788,7 +1228,7 @@ class TerminalAIInstaller:
         # Check build tools
         results["build_tools"] = self.check_build_tools()
         if not results["build_tools"]:
-            self.log("Attempting to install build tools...", "STEP")
+            self.log_step("Attempting to install build tools...")
             self.install_build_tools()
             # Re-check after installation attempt
             results["build_tools"] = self.check_build_tools()
@@ -798,100 +1238,82 @@ class TerminalAIInstaller:
         # Check FFmpeg
         results["ffmpeg"] = self.check_ffmpeg()
         if not results["ffmpeg"]:
-            self.log("Attempting to install FFmpeg...", "STEP")
+            self.log_step("Attempting to install FFmpeg...")
             if self.install_ffmpeg():
-                # Re-check after installation
+                # Re-check after installation (PATH lookups were cached)
+                for name in ("ffmpeg", "ffprobe"):
+                    self._path_bins.pop(name, None)
+                    self.__dict__.pop(f"{name}_path", None)
                 results["ffmpeg"] = self.check_ffmpeg()
 
-        self.log("\n" + "=" * 80, "INFO")
-        self.log("SYSTEM DEPENDENCIES SUMMARY", "INFO")
-        self.log("=" * 80, "INFO")
-        self.log(f"Build Tools: {'[OK] Available' if results['build_tools'] else '[WARN] Missing (optional)'}", "INFO")
-        self.log(f"FFmpeg:      {'[OK] Available' if results['ffmpeg'] else '[ERROR] Missing (required)'}", "INFO")
-        self.log("=" * 80 + "\n", "INFO")
+        self.log_info("\n" + "=" * 80)
+        self.log_info("SYSTEM DEPENDENCIES SUMMARY")
+        self.log_info("=" * 80)
+        self.log_info(f"Build Tools: {'[OK] Available' if results['build_tools'] else '[WARN] Missing (optional)'}")
+        self.log_info(f"FFmpeg:      {'[OK] Available' if results['ffmpeg'] else '[ERROR] Missing (required)'}")
+        self.log_info("=" * 80 + "\n")
 
         if not results["ffmpeg"]:
-            self.log("WARNING: FFmpeg is required for video processing!", "ERROR")
-            self.log("The application will not work without FFmpeg.", "ERROR")
+            self.log_error("WARNING: FFmpeg is required for video processing!")
+            self.log_error("The application will not work without FFmpeg.")
 
         if not results["build_tools"]:
-            self.log("Note: Build tools are optional but needed for some features:", "WARN")
-            self.log("  - DeepFilterNet (AI audio denoising)", "WARN")
-            self.log("  - Packages with C/C++ extensions", "WARN")
+            self.log_warn("Note: Build tools are optional but needed for some features:")
+            self.log_warn("  - DeepFilterNet (AI audio denoising)")
+            self.log_warn("  - Packages with C/C++ extensions")
 
         return results
 
     def install_optional_vapoursynth(self):
-        """Install VapourSynth for advanced deinterlacing (optional)."""
+        """Queue VapourSynth for advanced deinterlacing (optional)."""
         if self.install_type not in ["full"]:
             return
 
-        self.log("Installing VapourSynth (optional)...", "STEP")
-        try:
-            # Try to install Python bindings
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "vapoursynth", "vapoursynth-havsfunc"],
-                check=True,
-                capture_output=True
-            )
-            self.installed.append("VapourSynth Python bindings")
-            self.log("VapourSynth Python bindings installed")
-            self.log("Note: VapourSynth runtime may need separate installation:", "WARN")
-            self.log("  https://github.com/vapoursynth/vapoursynth/releases", "WARN")
-        except subprocess.CalledProcessError:
-            self.warnings.append("VapourSynth installation failed (optional)")
-
-    def install_optional_realesrgan(self):
-        """Install Real-ESRGAN for AI upscaling (optional)."""
+        self.log_step("Queueing VapourSynth (optional)...")
+        self._queue_pip(
+            "VapourSynth Python bindings",
+            ["vapoursynth", "vapoursynth-havsfunc"],
+            "VapourSynth installation failed (optional)"
+        )
+        self.log_warn("Note: VapourSynth runtime may need separate installation:")
+        self.log_warn("  https://github.com/vapoursynth/vapoursynth/releases")
+
+    def install_common_ai_deps(self):
+        """Queue the dependencies shared by Real-ESRGAN and GFPGAN (optional)."""
         if self.install_type not in ["full"]:
             return
 
-        self.log("Installing Real-ESRGAN (optional)...", "STEP")
-        try:
-            # Install opencv and numpy first (required by Real-ESRGAN)
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "opencv-python", "numpy"],
-                check=True,
-                capture_output=True
-            )
+        self.log_step("Queueing shared AI dependencies (optional)...")
+        self._queue_pip(
+            "Shared AI dependencies (NumPy, OpenCV, basicsr, facexlib)",
+            list(_COMMON_AI_DEPS),
+            "Shared AI dependencies failed to install (optional)"
+        )
 
-            # Install facexlib (required by Real-ESRGAN)
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "facexlib"],
-                check=True,
-                capture_output=True
-            )
+    def install_optional_realesrgan(self):
+        """Queue Real-ESRGAN for AI upscaling (optional)."""
+        if self.install_type not in ["full"]:
+            return
 
-            # Install Real-ESRGAN (will pull basicsr as dependency)
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "realesrgan"],
-                check=True,
-                capture_output=True,
-                timeout=300
-            )
-            self.installed.append("Real-ESRGAN AI upscaling")
-            self.log("Real-ESRGAN installed")
-        except subprocess.CalledProcessError as e:
-            self.warnings.append(f"Real-ESRGAN installation failed (optional): {e}")
-        except subprocess.TimeoutExpired:
-            self.warnings.append("Real-ESRGAN installation timed out (optional)")
+        self.log_step("Queueing Real-ESRGAN (optional)...")
+        # opencv, numpy, basicsr and facexlib come from install_common_ai_deps
+        self._queue_pip(
+            "Real-ESRGAN AI upscaling",
+            ["realesrgan"],
+            "Real-ESRGAN installation failed (optional)"
+        )
 
     def install_optional_gfpgan(self):
-        """Install GFPGAN for face restoration (optional)."""
+        """Queue GFPGAN for face restoration (optional)."""
         if self.install_type not in ["full"]:
             return
 
-        self.log("Installing GFPGAN (optional)...", "STEP")
-        try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "gfpgan", "basicsr", "facexlib"],
-                check=True,
-                capture_output=True
-            )
-            self.installed.append("GFPGAN face restoration")
-            self.log("GFPGAN installed")
-        except subprocess.CalledProcessError:
-            self.warnings.append("GFPGAN installation failed (optional)")
+        self.log_step("Queueing GFPGAN (optional)...")
+        self._queue_pip(
+            "GFPGAN face restoration",
+            ["gfpgan"],
+            "GFPGAN installation failed (optional)"
+        )
 
     def patch_basicsr_torchvision(self):
         """
@@ -902,7 +1324,7 @@ class TerminalAIInstaller:
 
         Solution: Add try/except fallback to import from functional instead.
         """
-        self.log("Checking for basicsr torchvision compatibility patch...", "STEP")
+        self.log_step("Checking for basicsr torchvision compatibility patch...")
 
         try:
             # Find basicsr installation directory
@@ -917,17 +1339,16 @@ class TerminalAIInstaller:
             degradations_file = basicsr_dir / "data" / "degradations.py"
 
             if not degradations_file.exists():
-                self.log("basicsr not installed or degradations.py not found - skipping patch")
+                self.log_info("basicsr not installed or degradations.py not found - skipping patch")
                 return
 
-            # Read current content
-            content = degradations_file.read_text(encoding='utf-8')
-
-            # Check if already patched (idempotent check)
-            if "Fix for torchvision >= 0.17" in content:
-                self.log("basicsr already patched for torchvision >= 0.17")
+            # Check if already patched (idempotent check) before decoding
+            if _file_contains(degradations_file, _BASICSR_PATCH_SENTINEL):
+                self.log_info("basicsr already patched for torchvision >= 0.17")
                 return
 
+            content = degradations_file.read_text(encoding='utf-8')
+
             # Apply patch: Replace line 8 with try/except fallback
             old_import = "from torchvision.transforms.functional_tensor import rgb_to_grayscale"
             new_import = """# Fix for torchvision >= 0.17 where functional_tensor was removed
@@ -943,135 +1364,238 @@ except ImportError:
                 degradations_file.write_text(patched_content, encoding='utf-8')
 
                 # Verify patch worked
-                verify_content = degradations_file.read_text(encoding='utf-8')
-                if "Fix for torchvision >= 0.17" in verify_content:
-                    self.log("Successfully patched basicsr for torchvision >= 0.17")
+                if _file_contains(degradations_file, _BASICSR_PATCH_SENTINEL):
+                    self.log_info("Successfully patched basicsr for torchvision >= 0.17")
                     self.installed.append("basicsr torchvision compatibility patch")
                 else:
                     self.warnings.append("basicsr patch verification failed")
             else:
                 # Import line not found or already modified
-                self.log("basicsr import line not found or already modified - skipping patch")
+                self.log_info("basicsr import line not found or already modified - skipping patch")
 
         except subprocess.CalledProcessError:
             # basicsr not installed
-            self.log("basicsr not installed - skipping patch")
+            self.log_info("basicsr not installed - skipping patch")
         except Exception as e:
             self.warnings.append(f"basicsr patching failed (non-critical): {e}")
 
+    @functools.cached_property
+    def nvidia_smi_path(self):
+        """Location of nvidia-smi (PATH lookup cached for the whole run)."""
+        nvidia_smi = self._which("nvidia-smi")
+        if not nvidia_smi and self.system != "Windows":
+            nvidia_smi = "/usr/bin/nvidia-smi"
+        return nvidia_smi
+
+    @functools.cached_property
+    def ffmpeg_path(self):
+        """Location of ffmpeg, or None if not on PATH."""
+        return self._which("ffmpeg")
+
+    @functools.cached_property
+    def ffprobe_path(self):
+        """Location of ffprobe, or None if not on PATH."""
+        return self._which("ffprobe")
+
+    @functools.cached_property
+    def nvidia_gpu_info(self):
+        """
+        GPU fields from a single nvidia-smi query, shared by every step.
+
+        Returns:
+            List of CSV fields (name, driver_version), or None if
+            nvidia-smi failed
+        """
+        return self._nvidia_details()
+
+    @functools.cached_property
+    def nvidia_driver_version(self):
+        """NVIDIA driver version string, or None without a working GPU."""
+        gpu_info = self.nvidia_gpu_info
+        return gpu_info[1] if gpu_info and len(gpu_info) > 1 else None
+
+    def _query_gpu_info(self):
+        """
+        GPU name and driver version from the shared nvidia-smi query.
+
+        Returns:
+            Tuple of (name, driver_version); (None, None) without a GPU
+        """
+        gpu_info = self.nvidia_gpu_info if self._has_nvidia_gpu() else None
+        if not gpu_info:
+            return None, None
+        return gpu_info[0], self.nvidia_driver_version
+
+    @functools.cached_property
+    def cuda_index_tag(self):
+        """
+        PyTorch wheel index for this GPU and Python version, chosen once.
+
+        Returns:
+            Index path such as ``"cu121"`` or ``"nightly/cu128"``, or None
+            for CPU-only PyTorch
+        """
+        gpu_name, _ = self._query_gpu_info()
+        if not gpu_name:
+            return None
+        # RTX 50 series requires PyTorch nightly with CUDA 12.8 for compute capability 12.0
+        if "RTX 50" in gpu_name:
+            return "nightly/cu128"
+        # Python 3.13+ requires newer PyTorch with cu124; 3.10-3.12 use cu121
+        if sys.version_info >= (3, 13):
+            return "cu124"
+        return "cu121"
+
+    def _has_nvidia_gpu(self):
+        """Cheap existence check for the NVIDIA driver tools (no subprocess)."""
+        return self._is_executable(self.nvidia_smi_path)
+
+    def _nvidia_details(self):
+        """
+        Query GPU name and driver version from nvidia-smi.
+
+        Returns:
+            List of CSV fields, or None on failure
+        """
+        try:
+            result = subprocess.run(
+                [self.nvidia_smi_path, "--query-gpu=name,driver_version", "--format=csv,noheader"],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=10
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+            return None
+        first_gpu = result.stdout.lstrip().partition('\n')[0]
+        gpu_info = [field.strip() for field in next(csv.reader([first_gpu]), [])]
+        return gpu_info if gpu_info and gpu_info[0] else None
+
     def check_nvidia_gpu(self):
         """Check for NVIDIA GPU availability."""
-        self.log("Checking for NVIDIA GPU...", "STEP")
+        self.log_step("Checking for NVIDIA GPU...")
 
-        if self.system == "Windows":
-            nvidia_smi = shutil.which("nvidia-smi")
-        else:
-            nvidia_smi = shutil.which("nvidia-smi") or "/usr/bin/nvidia-smi"
+        if self._has_nvidia_gpu():
+            # Basic installs never pick a CUDA build, so the driver tools
+            # being present is all we need to know
+            if self.install_type == "basic":
+                self.log_info(f"NVIDIA driver tools found: {self.nvidia_smi_path}")
+                return True
 
-        if nvidia_smi and os.path.exists(nvidia_smi):
-            try:
-                result = subprocess.run(
-                    [nvidia_smi, "--query-gpu=name,driver_version", "--format=csv,noheader"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                gpu_info = result.stdout.strip().split(',')
-                if gpu_info:
-                    self.log(f"NVIDIA GPU found: {gpu_info[0].strip()}")
-                    if len(gpu_info) > 1:
-                        self.log(f"Driver version: {gpu_info[1].strip()}")
-                    return True
-            except subprocess.CalledProcessError:
-                pass
+            gpu_info = self.nvidia_gpu_info
+            if gpu_info:
+                self.log_info(f"NVIDIA GPU found: {gpu_info[0]}")
+                if self.nvidia_driver_version:
+                    self.log_info(f"Driver version: {self.nvidia_driver_version}")
+                return True
 
-        self.log("No NVIDIA GPU detected - GPU acceleration unavailable", "WARN")
+        self.log_warn("No NVIDIA GPU detected - GPU acceleration unavailable")
         return False
 
-    def check_maxine_sdk(self):
-        """Check if NVIDIA Maxine SDK is installed."""
-        self.log("Checking NVIDIA Maxine SDK...", "STEP")
+    @functools.cached_property
+    def maxine_path(self):
+        """
+        Locate the NVIDIA Maxine SDK once per run.
 
+        Returns:
+            Path to the SDK directory, or None if not found
+        """
         maxine_env = os.environ.get("MAXINE_HOME")
-        if maxine_env and os.path.exists(maxine_env):
-            self.log(f"Maxine SDK found at: {maxine_env}")
-            return True
+        if maxine_env and Path(maxine_env).is_dir():
+            return Path(maxine_env)
 
-        # Check common installation locations
-        common_paths = [
-            r"C:\Program Files\NVIDIA Corporation\NVIDIA Video Effects",
-            r"C:\Program Files\NVIDIA\Maxine",
-            "/opt/nvidia/maxine",
-            str(Path.home() / "NVIDIA" / "Maxine")
-        ]
+        # Only stat the locations that can exist on this OS
+        candidates = _WIN_MAXINE_PATHS if self.system == "Windows" else _POSIX_MAXINE_PATHS
+        for path in (*candidates, Path.home() / "NVIDIA" / "Maxine"):
+            path = Path(path)
+            if path.is_dir():
+                return path
+        return None
 
-        for path in common_paths:
-            if os.path.exists(path):
-                self.log(f"Maxine SDK found at: {path}")
-                self.log(f"Set MAXINE_HOME environment variable: {path}", "WARN")
-                return True
+    def check_maxine_sdk(self):
+        """Check if NVIDIA Maxine SDK is installed."""
+        self.log_step("Checking NVIDIA Maxine SDK...")
 
-        self.log("Maxine SDK not found (optional - best AI upscaling)", "WARN")
-        self.log("Download from: https://developer.nvidia.com/maxine", "WARN")
+        maxine_path = self.maxine_path
+        if maxine_path:
+            self.log_info(f"Maxine SDK found at: {maxine_path}")
+            if str(maxine_path) != os.environ.get("MAXINE_HOME"):
+                self.log_warn(f"Set MAXINE_HOME environment variable: {maxine_path}")
+            return True
+
+        self.log_warn("Maxine SDK not found (optional - best AI upscaling)")
+        self.log_warn("Download from: https://developer.nvidia.com/maxine")
         return False
 
     def check_realesrgan(self):
         """Check if Real-ESRGAN is installed."""
-        self.log("Checking Real-ESRGAN...", "STEP")
+        self.log_step("Checking Real-ESRGAN...")
 
-        realesrgan = shutil.which("realesrgan-ncnn-vulkan")
+        realesrgan = self._which("realesrgan-ncnn-vulkan")
         if not realesrgan and self.system == "Windows":
-            realesrgan = shutil.which("realesrgan-ncnn-vulkan.exe")
+            realesrgan = self._which("realesrgan-ncnn-vulkan.exe")
 
         if realesrgan:
-            self.log(f"Real-ESRGAN found: {realesrgan}")
+            self.log_info(f"Real-ESRGAN found: {realesrgan}")
             return True
 
-        self.log("Real-ESRGAN not found (optional - AI upscaling)", "WARN")
-        self.log("Download from: https://github.com/xinntao/Real-ESRGAN/releases", "WARN")
+        self.log_warn("Real-ESRGAN not found (optional - AI upscaling)")
+        self.log_warn("Download from: https://github.com/xinntao/Real-ESRGAN/releases")
         return False
 
     def create_config(self):
         """Create default configuration file if it doesn't exist."""
-        self.log("Checking configuration...", "STEP")
+        self.log_step("Checking configuration...")
 
         config_path = Path("vhs_upscaler") / "config.yaml"
         if config_path.exists():
-            self.log("Configuration file already exists")
+            self.log_info("Configuration file already exists")
             return True
 
-        self.log("Default configuration will be created on first run")
+        self.log_info("Default configuration will be created on first run")
         return True
 
     def verify_installation(self):
         """Verify the installation is working."""
-        self.log("Verifying installation...", "STEP")
+        self.log_step("Verifying installation...")
 
         try:
-            # Test package import
-            result = subprocess.run(
-                [sys.executable, "-c", "from vhs_upscaler import VideoQueue, QueueJob, JobStatus; print('OK')"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            if "OK" in result.stdout:
-                self.log("Package import successful")
+            # Test package import in-process. The editable install registers
+            # itself through a .pth file, which this interpreter only picks
+            # up once site-packages is re-scanned.
+            importlib.invalidate_caches()
+            try:
+                package = importlib.import_module("vhs_upscaler")
+            except ImportError:
+                for site_dir in site.getsitepackages() + [site.getusersitepackages()]:
+                    site.addsitedir(site_dir)
+                importlib.invalidate_caches()
+                package = importlib.import_module("vhs_upscaler")
+
+            missing = [
+                name for name in ("VideoQueue", "QueueJob", "JobStatus")
+                if getattr(package, name, None) is None
+            ]
+            if missing:
+                self.warnings.append(
+                    f"Package import verification unclear (missing: {', '.join(missing)})"
+                )
             else:
-                self.warnings.append("Package import verification unclear")
-        except subprocess.CalledProcessError as e:
+                self.log_info("Package import successful")
+        except Exception as e:
             self.errors.append(f"Package import failed: {e}")
             return False
 
-        # Test CLI entry point
+        # Test CLI entry point in a clean interpreter
         try:
             subprocess.run(
                 [sys.executable, "-m", "vhs_upscaler.vhs_upscale", "--help"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True,
                 timeout=5
             )
-            self.log("CLI entry point working")
+            self.log_info("CLI entry point working")
         except subprocess.CalledProcessError:
             self.warnings.append("CLI entry point check failed")
         except subprocess.TimeoutExpired:
@@ -1117,6 +1641,34 @@ except ImportError:
 
         return True
 
+    def _run_step(self, description, func):
+        """Run one installer step, recording a failure in ``self.errors``."""
+        try:
+            func()
+        except Exception as e:
+            with self._lock:
+                self.errors.append(f"{description} failed: {e}")
+        print()
+
+    def _run_steps(self, steps, concurrent=False):
+        """
+        Run installer steps, continuing past failed ones.
+
+        Args:
+            steps: (description, callable) pairs, in order
+            concurrent: Run the steps side by side on a thread pool. Only
+                for read-only probes: steps that install anything or may
+                prompt must stay sequential so their output (and any sudo
+                prompt) isn't interleaved with other steps
+        """
+        if not concurrent:
+            for description, func in steps:
+                self._run_step(description, func)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            list(executor.map(lambda step: self._run_step(*step), steps))
+
     def run(self):
         """Run the complete installation process."""
         print("=" * 80)
@@ -1125,37 +1677,62 @@ except ImportError:
         print("=" * 80)
         print()
 
-        steps = [
+        # Nothing changed since the last successful install of this plan:
+        # only confirm the package still imports
+        if not self.force and self.plan_sentinel.exists():
+            self.log_info("Identical installation already completed - verifying only")
+            self.log_info("(use --force to reinstall)")
+            print()
+            self.verify_installation()
+            return self.print_summary()
+
+        self._run_steps([
             ("Checking Python", self.check_python_version),
             ("Checking pip", self.check_pip),
             ("Checking system dependencies", self.check_system_dependencies),
-            ("Installing package", self.install_package),
+        ])
+
+        # The probes only inspect the system, so they can overlap; the
+        # package install below needs the GPU result
+        self._run_steps([
             ("Checking NVIDIA GPU", self.check_nvidia_gpu),
             ("Checking Maxine SDK", self.check_maxine_sdk),
             ("Checking Real-ESRGAN", self.check_realesrgan),
-        ]
+        ], concurrent=True)
+
+        steps = [("Installing package", self.install_package)]
 
         if self.install_type == "full":
             steps.extend([
+                ("Installing shared AI dependencies", self.install_common_ai_deps),
                 ("Installing VapourSynth", self.install_optional_vapoursynth),
                 ("Installing Real-ESRGAN", self.install_optional_realesrgan),
                 ("Installing GFPGAN", self.install_optional_gfpgan),
-                ("Patching basicsr", self.patch_basicsr_torchvision),
             ])
 
+        # Every queued optional package is installed in one pip call
+        steps.append(("Installing optional packages", self._flush_pip))
+
+        if self.install_type == "full":
+            steps.append(("Patching basicsr", self.patch_basicsr_torchvision))
+
         steps.extend([
             ("Creating config", self.create_config),
             ("Verifying installation", self.verify_installation),
         ])
 
-        for step_name, step_func in steps:
-            try:
-                step_func()
-            except Exception as e:
-                self.errors.append(f"{step_name} failed: {e}")
-            print()
+        self._run_steps(steps)
 
-        return self.print_summary()
+        success = self.print_summary()
+        # Warnings mean something optional failed to install or needs
+        # manual action; keep re-running the plan until it comes out clean
+        if success and not self.warnings:
+            try:
+                self.plan_sentinel.parent.mkdir(parents=True, exist_ok=True)
+                self.plan_sentinel.touch()
+            except OSError:
+                pass  # Only an optimization for the next run
+        return success
 
 
 def main():
@@ -1200,10 +1777,67 @@ Examples:
         help="Install with audio AI features"
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=_default_cache_dir(),
+        help="Persistent pip cache directory (default: %(default)s)"
+    )
+
+    parser.add_argument(
+        "--parallel-download",
+        action="store_true",
+        help="Resolve optional packages once and download them in parallel before installing"
+    )
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Show pip output instead of discarding it"
+    )
+
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        dest="compile_bytecode",
+        help="Byte-compile installed packages (e.g. for production images)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every step even if this exact installation already succeeded"
+    )
+
+    uv_group = parser.add_mutually_exclusive_group()
+    uv_group.add_argument(
+        "--use-uv",
+        action="store_true",
+        dest="use_uv",
+        default=None,
+        help="Install packages with uv (default: automatic when uv is on PATH)"
+    )
+    uv_group.add_argument(
+        "--no-uv",
+        action="store_false",
+        dest="use_uv",
+        help="Always install packages with pip"
+    )
+
     parser.set_defaults(install_type="basic")
     args = parser.parse_args()
 
-    installer = TerminalAIInstaller(install_type=args.install_type)
+    if args.use_uv and not shutil.which("uv"):
+        parser.error("--use-uv requires uv on PATH (https://docs.astral.sh/uv/)")
+
+    installer = TerminalAIInstaller(
+        install_type=args.install_type,
+        cache_dir=args.cache_dir,
+        parallel_download=args.parallel_download,
+        verbose=args.verbose,
+        use_uv=args.use_uv,
+        force=args.force,
+        compile_bytecode=args.compile_bytecode,
+    )
     success = installer.run()
 
     sys.exit(0 if success else 1)
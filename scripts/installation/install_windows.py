@@ -13,19 +13,68 @@ Usage:
 """
 
 import argparse
+import ctypes
+import importlib.metadata
+import importlib.util
+import json
 import os
 import platform
 import shutil
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional
+
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:  # pip vendors packaging, but it may not be importable
+    Version = None
+    InvalidVersion = ValueError
+
+# Machine facts (GPU, driver, FFmpeg) cached on disk are trusted this long
+PROBE_CACHE_TTL = 24 * 60 * 60
+
+# Upper bound for fetching the PyTorch wheels (~2 GB for CUDA builds)
+PYTORCH_DOWNLOAD_TIMEOUT = 30 * 60
+
+# nvidia-smi fields queried in one call, and the keys they are cached under
+GPU_QUERY_FIELDS = {
+    "name": "name",
+    "driver_version": "driver",
+    "compute_cap": "compute_cap",
+    "memory.total": "memory_mb",
+    "pci.bus_id": "pci_bus_id",
+}
+
+
+class _NvmlMemory(ctypes.Structure):
+    _fields_ = [
+        ("total", ctypes.c_ulonglong),
+        ("free", ctypes.c_ulonglong),
+        ("used", ctypes.c_ulonglong),
+    ]
+
+
+class _NvmlPciInfo(ctypes.Structure):
+    _fields_ = [
+        ("busIdLegacy", ctypes.c_char * 16),
+        ("domain", ctypes.c_uint),
+        ("bus", ctypes.c_uint),
+        ("device", ctypes.c_uint),
+        ("pciDeviceId", ctypes.c_uint),
+        ("pciSubSystemId", ctypes.c_uint),
+        ("busId", ctypes.c_char * 32),
+    ]
 
 
 class WindowsInstaller:
     """Windows-specific installer with PyTorch CUDA support."""
 
-    def __init__(self):
+    def __init__(self, use_pip=False, reprobe=False):
         self.system = platform.system()
         if self.system != "Windows":
             print("⚠ This installer is optimized for Windows.")
@@ -38,9 +87,49 @@ class WindowsInstaller:
         self.errors = []
         self.warnings = []
         self.installed = []
+        # Guards installed/warnings/errors and console output while install
+        # lanes run on worker threads
+        self._lock = threading.Lock()
+        # Per-thread output buffer of the lane running on that thread
+        self._lane = threading.local()
         self.cuda_available = False
         self.cuda_version = None
 
+        # uv installs (and downloads) in parallel; plain pip is the fallback
+        self._pip_cmd = self._find_pip_cmd()
+        self.uv_path = None if use_pip else shutil.which("uv")
+        if self.uv_path:
+            self._installer_cmd = [self.uv_path, "pip", "install", "--python", sys.executable]
+        else:
+            self._installer_cmd = [
+                *self._pip_cmd, "install", "--no-input", "--disable-pip-version-check"
+            ]
+
+        # Probe results are stable for the lifetime of the installer
+        self._pip_ok: Optional[bool] = None
+        self._gpu_probe_result: Optional[bool] = None
+        self._ffmpeg_ok: Optional[bool] = None
+        self._gpu_info_cache: dict = {}
+        self._ffmpeg_version: Optional[str] = None
+
+        # Results from an earlier run, e.g. --audio followed by --faces
+        self._probe_cache = {} if reprobe else self._load_probe_cache()
+
+    @staticmethod
+    def _find_pip_cmd() -> List[str]:
+        """
+        Locate the pip launcher that belongs to this interpreter.
+
+        Scripts\\pip.exe starts pip's entry point directly instead of going
+        through ``python -m pip`` and runpy. Venvs keep it next to
+        python.exe, base installs in the Scripts folder.
+        """
+        python_dir = Path(sys.executable).parent
+        for pip_exe in (python_dir / "pip.exe", python_dir / "Scripts" / "pip.exe"):
+            if pip_exe.is_file():
+                return [str(pip_exe)]
+        return [sys.executable, "-m", "pip"]
+
     def log(self, message, level="INFO"):
         """Log installation progress."""
         prefix = {
@@ -50,7 +139,20 @@ class WindowsInstaller:
             "STEP": "→",
             "QUESTION": "?"
         }.get(level, "•")
-        print(f"{prefix} {message}")
+        self._write(f"{prefix} {message}")
+
+    def _write(self, text: str):
+        """Print a line, or hold it back while inside an install lane."""
+        output = getattr(self._lane, "output", None)
+        if output is not None:
+            output.append(text)
+        else:
+            print(text)
+
+    def _record(self, results: List[str], item: str):
+        """Append to installed/warnings/errors; safe from lane threads."""
+        with self._lock:
+            results.append(item)
 
     def check_prerequisites(self):
         """Check system prerequisites."""
@@ -66,70 +168,218 @@ class WindowsInstaller:
         self.log(f"Python {self.python_version.major}.{self.python_version.minor}.{self.python_version.micro}")
 
         # Check pip
-        try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "--version"],
-                check=True,
-                capture_output=True
-            )
-            self.log("pip available")
-        except subprocess.CalledProcessError:
+        if self._pip_ok is None:
+            try:
+                subprocess.run(
+                    [*self._pip_cmd, "--version"],
+                    check=True,
+                    capture_output=True
+                )
+                self._pip_ok = True
+            except subprocess.CalledProcessError:
+                self._pip_ok = False
+
+        if not self._pip_ok:
             self.errors.append("pip not found")
             return False
 
+        self.log("pip available")
         return True
 
     def check_nvidia_gpu(self) -> bool:
         """Check for NVIDIA GPU and CUDA support."""
+        if self._gpu_probe_result is not None:
+            return self._gpu_probe_result
+
+        cached = self._probe_cache.get("gpu")
+        if cached:
+            self.log("Checking NVIDIA GPU (cached)...", "STEP")
+            self.log(f"GPU: {cached['name']}")
+            self.log(f"Driver: {cached['driver']}")
+            self._gpu_info_cache = {k: v for k, v in cached.items() if k != "cuda_version"}
+            self.cuda_version = cached["cuda_version"]
+            self.cuda_available = True
+            self._gpu_probe_result = True
+            return True
+
+        self._gpu_probe_result = self._probe_nvidia_gpu()
+        if self._gpu_probe_result:
+            self._probe_cache["gpu"] = {**self._gpu_info_cache, "cuda_version": self.cuda_version}
+            self._save_probe_cache()
+        return self._gpu_probe_result
+
+    def _probe_nvidia_gpu(self) -> bool:
+        """Detect the GPU and pick the CUDA build for its driver."""
         self.log("Checking NVIDIA GPU...", "STEP")
 
+        gpu_info = self._probe_gpu_nvml() or self._probe_gpu_smi()
+        if gpu_info is None:
+            return False
+
+        self._gpu_info_cache = gpu_info
+        driver_version = gpu_info["driver"]
+        self.log(f"GPU: {gpu_info['name']}")
+        self.log(f"Driver: {driver_version}")
+        self.log(f"Compute Capability: {gpu_info['compute_cap']}")
+        self.log(f"Memory: {gpu_info['memory_mb']} MiB (PCI {gpu_info['pci_bus_id']})")
+
+        # Determine CUDA version from driver
+        try:
+            driver_major = int(driver_version.split('.')[0])
+            if driver_major >= 525:  # CUDA 12.x support
+                self.cuda_version = "cu121"
+                self.cuda_available = True
+                self.log("CUDA 12.1 compatible driver detected")
+            elif driver_major >= 450:  # CUDA 11.x support
+                self.cuda_version = "cu118"
+                self.cuda_available = True
+                self.log("CUDA 11.8 compatible driver detected")
+            else:
+                self.log("NVIDIA driver too old for CUDA support", "WARN")
+                return False
+        except (ValueError, IndexError):
+            self.log("Could not determine CUDA version from driver", "WARN")
+            return False
+
+        return True
+
+    def _probe_gpu_nvml(self) -> Optional[dict]:
+        """
+        Read GPU 0's details through NVML.
+
+        Loads the NVML library that ships with the driver, which avoids
+        starting nvidia-smi.
+
+        Returns:
+            Dict keyed like GPU_QUERY_FIELDS values, or None if NVML is
+            unavailable
+        """
+        try:
+            if self.system == "Windows":
+                system32 = Path(os.environ.get("SystemRoot", r"C:\Windows")) / "System32"
+                nvml = ctypes.WinDLL(str(system32 / "nvml.dll"))
+            else:
+                nvml = ctypes.CDLL("libnvidia-ml.so.1")
+        except (OSError, AttributeError):
+            return None
+
+        try:
+            if nvml.nvmlInit_v2() != 0:
+                return None
+        except AttributeError:
+            return None
+
+        try:
+            handle = ctypes.c_void_p()
+            name = ctypes.create_string_buffer(96)
+            driver = ctypes.create_string_buffer(80)
+            major, minor = ctypes.c_int(), ctypes.c_int()
+            if (
+                nvml.nvmlDeviceGetHandleByIndex_v2(0, ctypes.byref(handle)) != 0
+                or nvml.nvmlDeviceGetName(handle, name, len(name)) != 0
+                or nvml.nvmlSystemGetDriverVersion(driver, len(driver)) != 0
+                or nvml.nvmlDeviceGetCudaComputeCapability(
+                    handle, ctypes.byref(major), ctypes.byref(minor)
+                ) != 0
+            ):
+                return None
+
+            # Memory and PCI location are informational only
+            memory, pci = _NvmlMemory(), _NvmlPciInfo()
+            memory_ok = nvml.nvmlDeviceGetMemoryInfo(handle, ctypes.byref(memory)) == 0
+            pci_ok = nvml.nvmlDeviceGetPciInfo_v3(handle, ctypes.byref(pci)) == 0
+            return {
+                "name": name.value.decode(errors="replace"),
+                "driver": driver.value.decode(errors="replace"),
+                "compute_cap": f"{major.value}.{minor.value}",
+                "memory_mb": str(memory.total // (1024 * 1024)) if memory_ok else "unknown",
+                "pci_bus_id": pci.busId.decode(errors="replace") if pci_ok else "unknown",
+            }
+        except AttributeError:
+            return None
+        finally:
+            nvml.nvmlShutdown()
+
+    def _probe_gpu_smi(self) -> Optional[dict]:
+        """
+        Read the first GPU's details with a single nvidia-smi query.
+
+        Returns:
+            Dict keyed like GPU_QUERY_FIELDS values, or None
+        """
         nvidia_smi = shutil.which("nvidia-smi")
         if not nvidia_smi:
             self.log("No NVIDIA GPU detected (CPU mode available)", "WARN")
-            return False
+            return None
+
+        # Container toolkits can put nvidia-smi on PATH without any NVIDIA
+        # hardware; don't download multi-GB CUDA wheels for those hosts
+        if self._has_nvidia_pci_device() is False:
+            self.log("nvidia-smi found but no NVIDIA PCI device (CPU mode available)", "WARN")
+            return None
 
         try:
             result = subprocess.run(
-                [nvidia_smi, "--query-gpu=name,driver_version,compute_cap", "--format=csv,noheader"],
+                [
+                    nvidia_smi,
+                    f"--query-gpu={','.join(GPU_QUERY_FIELDS)}",
+                    "--format=csv,noheader,nounits"
+                ],
                 capture_output=True,
                 text=True,
                 check=True
             )
-            gpu_info = result.stdout.strip().split(',')
-            if gpu_info:
-                gpu_name = gpu_info[0].strip()
-                driver_version = gpu_info[1].strip() if len(gpu_info) > 1 else "unknown"
-                compute_cap = gpu_info[2].strip() if len(gpu_info) > 2 else "unknown"
-
-                self.log(f"GPU: {gpu_name}")
-                self.log(f"Driver: {driver_version}")
-                self.log(f"Compute Capability: {compute_cap}")
-
-                # Determine CUDA version from driver
-                try:
-                    driver_major = int(driver_version.split('.')[0])
-                    if driver_major >= 525:  # CUDA 12.x support
-                        self.cuda_version = "cu121"
-                        self.cuda_available = True
-                        self.log("CUDA 12.1 compatible driver detected")
-                    elif driver_major >= 450:  # CUDA 11.x support
-                        self.cuda_version = "cu118"
-                        self.cuda_available = True
-                        self.log("CUDA 11.8 compatible driver detected")
-                    else:
-                        self.log("NVIDIA driver too old for CUDA support", "WARN")
-                        return False
-                except (ValueError, IndexError):
-                    self.log("Could not determine CUDA version from driver", "WARN")
-                    return False
-
-                return True
-
         except subprocess.CalledProcessError:
             self.log("nvidia-smi failed - GPU may not be available", "WARN")
-            return False
+            return None
+
+        lines = result.stdout.strip().splitlines()
+        if not lines:
+            self.log("nvidia-smi reported no GPUs (CPU mode available)", "WARN")
+            return None
 
-        return False
+        values = [field.strip() for field in lines[0].split(',')]
+        values += ["unknown"] * (len(GPU_QUERY_FIELDS) - len(values))
+        return dict(zip(GPU_QUERY_FIELDS.values(), values))
+
+    def _has_nvidia_pci_device(self) -> Optional[bool]:
+        """
+        Look for a display device with the NVIDIA PCI vendor ID (0x10de).
+
+        Returns:
+            True/False if the device list could be read, None if unknown
+        """
+        if self.system == "Windows":
+            try:
+                result = subprocess.run(
+                    ["wmic", "path", "Win32_VideoController", "get", "PNPDeviceID"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                    timeout=10
+                )
+            except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired):
+                return None  # wmic is missing on newer Windows builds
+            return "VEN_10DE" in result.stdout.upper()
+
+        # WSL2 exposes the GPU through /dev/dxg, not as a PCI device, so
+        # sysfs can't rule anything out there
+        if Path("/usr/lib/wsl").is_dir():
+            return None
+        pci_devices = Path("/sys/bus/pci/devices")
+        if not pci_devices.is_dir():
+            return None
+        vendors_read = False
+        for vendor_file in pci_devices.glob("*/vendor"):
+            try:
+                vendor = vendor_file.read_text().strip().lower()
+            except OSError:
+                continue
+            vendors_read = True
+            if vendor == "0x10de":
+                return True
+        # No readable devices at all (e.g. a restricted container): unknown
+        return False if vendors_read else None
 
     def install_pytorch(self, force_cpu=False) -> bool:
         """
@@ -149,14 +399,23 @@ class WindowsInstaller:
             index_url = f"https://download.pytorch.org/whl/{self.cuda_version}"
             packages = ["torch", "torchvision", "torchaudio"]
 
+        index_args = ["--index-url", index_url] if index_url else []
+        variant = self.cuda_version if index_url else "cpu"
+        wheel_dir = self._wheel_cache_dir() / variant
+
         try:
-            cmd = [sys.executable, "-m", "pip", "install"] + packages
-            if index_url:
-                cmd.extend(["--index-url", index_url])
+            if self.uv_path:
+                # uv keeps every wheel it downloads in its own cache
+                cmd = [*self._installer_cmd, *packages, *index_args]
+                if index_url:
+                    cmd.extend(["--index-strategy", "unsafe-best-match"])
+            else:
+                cmd = self._pip_cached_wheels_cmd(packages, index_args, wheel_dir)
 
             self.log(f"Command: {' '.join(cmd)}")
             subprocess.run(cmd, check=True)
             self.installed.append(f"PyTorch ({self.cuda_version if self.cuda_available else 'CPU'})")
+            self._prune_wheel_cache(wheel_dir)
 
             # Verify CUDA availability
             if not force_cpu and self.cuda_available:
@@ -168,6 +427,105 @@ class WindowsInstaller:
             self.errors.append(f"PyTorch installation failed: {e}")
             return False
 
+    def _pip_cached_wheels_cmd(self, packages, index_args, wheel_dir) -> List[str]:
+        """
+        Build the pip command that installs PyTorch from local wheels.
+
+        download.pytorch.org sends Cache-Control: no-store, so pip never
+        keeps the multi-GB CUDA wheels between runs. Download them into a
+        local wheel directory (files already there are reused) and install
+        from it.
+        """
+        self.log(f"Fetching PyTorch wheels into {wheel_dir}")
+        try:
+            download = subprocess.run(
+                [*self._pip_cmd, "download", "--prefer-binary",
+                 "--disable-pip-version-check", "-d", str(wheel_dir), *packages, *index_args],
+                timeout=PYTORCH_DOWNLOAD_TIMEOUT
+            )
+            if download.returncode == 0:
+                return [*self._installer_cmd, "--no-index", "--find-links", str(wheel_dir), *packages]
+        except subprocess.TimeoutExpired:
+            self.log("Wheel download timed out", "WARN")
+
+        self.log("Wheel download failed - installing directly from the index", "WARN")
+        return [*self._installer_cmd, "--prefer-binary", *packages, *index_args]
+
+    def _prune_wheel_cache(self, wheel_dir: Path):
+        """
+        Drop cached wheels that the next install will never use.
+
+        Removes the wheel directories of other PyTorch variants (e.g. an
+        older CUDA build) and, within ``wheel_dir``, every wheel older
+        than the newest one of the same project. Best effort.
+        """
+        cache_dir = self._wheel_cache_dir()
+        if not cache_dir.is_dir():
+            return
+        for variant_dir in cache_dir.iterdir():
+            if variant_dir.is_dir() and variant_dir != wheel_dir:
+                shutil.rmtree(variant_dir, ignore_errors=True)
+
+        if Version is None or not wheel_dir.is_dir():
+            return
+        # Wheel names are "<project>-<version>-<tags>.whl"
+        wheels = {}
+        for wheel in wheel_dir.glob("*.whl"):
+            try:
+                project, version = wheel.name.split("-")[:2]
+                wheels.setdefault(project.lower(), []).append((Version(version), wheel))
+            except (ValueError, InvalidVersion):
+                continue
+        for versions in wheels.values():
+            newest = max(version for version, _ in versions)
+            for version, wheel in versions:
+                if version != newest:
+                    try:
+                        wheel.unlink()
+                    except OSError:
+                        pass
+
+    def _data_dir(self) -> Path:
+        """Per-user directory for state kept between installer runs."""
+        local_app_data = os.environ.get("LOCALAPPDATA")
+        if local_app_data:
+            return Path(local_app_data) / "TerminalAI"
+        return Path.home() / ".cache" / "terminalai"
+
+    def _wheel_cache_dir(self) -> Path:
+        """Directory holding downloaded wheels that are reused across runs."""
+        return self._data_dir() / "wheels"
+
+    def _load_probe_cache(self) -> dict:
+        """
+        Load probe results saved by an earlier run.
+
+        Returns:
+            Cached results, or an empty dict if missing, stale, or written
+            for a different Python interpreter
+        """
+        try:
+            cache = json.loads((self._data_dir() / "probe.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        if cache.get("python") != sys.executable:
+            return {}
+        if time.time() - cache.get("ts", 0) > PROBE_CACHE_TTL:
+            return {}
+        return cache
+
+    def _save_probe_cache(self):
+        """Persist probe results for later runs (best effort)."""
+        self._probe_cache.update(python=sys.executable, ts=self._probe_cache.get("ts", time.time()))
+        try:
+            cache_file = self._data_dir() / "probe.json"
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(self._probe_cache, indent=2), encoding="utf-8")
+        except OSError:
+            pass
+
     def _verify_pytorch_cuda(self):
         """Verify PyTorch CUDA support after installation."""
         self.log("Verifying PyTorch CUDA support...", "STEP")
@@ -199,7 +557,7 @@ class WindowsInstaller:
         self.log("Installing TerminalAI base package...", "STEP")
 
         try:
-            cmd = [sys.executable, "-m", "pip", "install", "-e", "."]
+            cmd = [*self._installer_cmd, "-e", "."]
             subprocess.run(cmd, check=True)
             self.installed.append("TerminalAI core")
             return True
@@ -207,56 +565,145 @@ class WindowsInstaller:
             self.errors.append(f"Base package installation failed: {e}")
             return False
 
-    def install_audio_ai(self) -> bool:
-        """Install audio AI features (Demucs, DeepFilterNet, AudioSR)."""
-        self.log("Installing audio AI features...", "STEP")
+    def _run_pip(self, cmd: List[str], timeout=None):
+        """
+        Run a pip command, streaming its output as it arrives.
 
-        success = True
+        Only the last 200 lines are kept, for the error raised on failure.
 
-        # Install Demucs
-        self.log("Installing Demucs (AI stem separation)...")
+        Raises:
+            subprocess.CalledProcessError: pip exited with an error
+            subprocess.TimeoutExpired: pip ran longer than ``timeout``
+        """
+        tail = deque(maxlen=200)
+        timed_out = threading.Event()
+
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True,
+            errors="replace"
+        ) as proc:
+            def expire():
+                timed_out.set()
+                proc.kill()
+
+            timer = threading.Timer(timeout, expire) if timeout else None
+            if timer:
+                timer.start()
+            try:
+                for line in proc.stdout:
+                    line = line.rstrip()
+                    if line:
+                        tail.append(line)
+                        self._write(f"    {line}")
+            finally:
+                if timer:
+                    timer.cancel()
+            returncode = proc.wait()
+
+        output = "\n".join(tail)
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout, output=output)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd, output=output)
+
+    @staticmethod
+    def _already_installed(spec: str) -> bool:
+        """
+        Check whether a ``name>=version`` requirement is already installed.
+
+        Args:
+            spec: Package name with an optional ``>=`` minimum version
+
+        Returns:
+            True if an installed distribution satisfies the spec
+        """
+        name, _, minimum = spec.partition(">=")
         try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "demucs>=4.0.0"],
-                check=True,
-                capture_output=True
-            )
-            self.installed.append("Demucs")
-        except subprocess.CalledProcessError:
-            self.warnings.append("Demucs installation failed (optional)")
-            success = False
+            current = importlib.metadata.version(name.strip())
+        except importlib.metadata.PackageNotFoundError:
+            return False
 
-        # Install DeepFilterNet
-        self.log("Installing DeepFilterNet (AI audio denoising)...")
+        if not minimum:
+            return True
+        if Version is None:
+            return False
         try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "deepfilternet>=0.5.0"],
-                check=True,
-                capture_output=True
-            )
-            self.installed.append("DeepFilterNet")
-        except subprocess.CalledProcessError:
-            self.warnings.append(
-                "DeepFilterNet installation failed (may require Rust compiler)"
-            )
-            self.log("Install Rust from: https://www.rust-lang.org/tools/install", "WARN")
-            success = False
+            return Version(current) >= Version(minimum.strip())
+        except InvalidVersion:
+            return False
+
+    def _pip_install(self, packages: List[str], timeout=None) -> List[str]:
+        """
+        Install packages with a single pip call.
+
+        If the batch fails, each package is retried on its own so the
+        failures can be attributed.
+
+        Args:
+            packages: Requirement specifiers to install
+            timeout: Per-package timeout in seconds (None for no limit)
 
-        # Install AudioSR (optional, often fails on Windows)
-        self.log("Installing AudioSR (AI audio upsampling) - optional...")
+        Returns:
+            List of packages that failed to install
+        """
+        # Skip pip (and its index round-trips) for requirements already met
+        packages = [package for package in packages if not self._already_installed(package)]
+        if not packages:
+            self.log("All packages already installed - skipping pip")
+            return []
+
+        cmd = self._installer_cmd
+        batch_timeout = timeout * len(packages) if timeout else None
         try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "audiosr>=0.0.4"],
-                check=True,
-                capture_output=True,
-                timeout=300  # 5 minute timeout
-            )
-            self.installed.append("AudioSR")
+            self._run_pip(cmd + packages, timeout=batch_timeout)
+            return []
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            self.warnings.append(
+            if len(packages) == 1:
+                return list(packages)
+            self.log("Batched install failed - retrying packages individually", "WARN")
+
+        failed = []
+        for package in packages:
+            try:
+                self._run_pip(cmd + [package], timeout=timeout)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+                failed.append(package)
+        return failed
+
+    def install_audio_ai(self) -> bool:
+        """Install audio AI features (Demucs, DeepFilterNet, AudioSR)."""
+        self.log("Installing audio AI features...", "STEP")
+
+        # AudioSR often fails on Windows, so its failure is not fatal
+        packages = {
+            "demucs>=4.0.0": ("Demucs", "Demucs installation failed (optional)"),
+            "deepfilternet>=0.5.0": (
+                "DeepFilterNet",
+                "DeepFilterNet installation failed (may require Rust compiler)"
+            ),
+            "audiosr>=0.0.4": (
+                "AudioSR",
                 "AudioSR installation failed (known Windows compatibility issues, optional)"
-            )
-            # Don't mark as failure since AudioSR is optional
+            ),
+        }
+
+        self.log("Installing Demucs, DeepFilterNet and AudioSR (optional)...")
+        failed = self._pip_install(list(packages), timeout=300)  # 5 minutes per package
+
+        success = True
+        for package, (name, warning) in packages.items():
+            if package not in failed:
+                self._record(self.installed, name)
+                continue
+            self._record(self.warnings, warning)
+            if name == "DeepFilterNet":
+                self.log("Install Rust from: https://www.rust-lang.org/tools/install", "WARN")
+            if name != "AudioSR":
+                success = False
 
         return success
 
@@ -264,7 +711,6 @@ class WindowsInstaller:
         """Install GFPGAN/CodeFormer for face restoration."""
         self.log("Installing face restoration (GFPGAN)...", "STEP")
 
-        # Install in correct order for Windows
         packages = [
             "opencv-python>=4.5.0",
             "basicsr>=1.4.2",
@@ -272,26 +718,17 @@ class WindowsInstaller:
             "gfpgan>=1.3.0"
         ]
 
-        success = True
-        for package in packages:
-            package_name = package.split('>=')[0]
-            self.log(f"Installing {package_name}...")
-            try:
-                subprocess.run(
-                    [sys.executable, "-m", "pip", "install", package],
-                    check=True,
-                    capture_output=True
-                )
-            except subprocess.CalledProcessError:
-                self.warnings.append(f"{package_name} installation failed")
-                success = False
+        self.log(f"Installing {', '.join(package.split('>=')[0] for package in packages)}...")
+        failed = self._pip_install(packages)
+        for package in failed:
+            self._record(self.warnings, f"{package.split('>=')[0]} installation failed")
 
-        if success:
-            self.installed.append("GFPGAN face restoration")
+        if not failed:
+            self._record(self.installed, "GFPGAN face restoration")
         else:
-            self.warnings.append("Face restoration installation incomplete")
+            self._record(self.warnings, "Face restoration installation incomplete")
 
-        return success
+        return not failed
 
     def install_vapoursynth(self) -> bool:
         """
@@ -305,21 +742,69 @@ class WindowsInstaller:
         self.log("Download from: https://github.com/vapoursynth/vapoursynth/releases", "WARN")
 
         try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "vapoursynth"],
-                check=True,
-                capture_output=True
-            )
-            self.installed.append("VapourSynth Python bindings")
+            self._run_pip([*self._installer_cmd, "vapoursynth"])
+            self._record(self.installed, "VapourSynth Python bindings")
             return True
         except subprocess.CalledProcessError:
-            self.warnings.append(
+            self._record(
+                self.warnings,
                 "VapourSynth Python bindings installation failed (runtime may be missing)"
             )
             return False
 
+    def _run_lanes(self, lanes):
+        """
+        Run lanes of install steps concurrently.
+
+        Steps within a lane run in order. Lanes must install disjoint
+        package sets so two pip processes never write the same files.
+        Each lane's output (log lines and pip's progress) is buffered and
+        printed in one block when the lane finishes, so lanes never
+        interleave on the console.
+
+        Args:
+            lanes: List of lists of install methods
+        """
+        def run_lane(steps):
+            self._lane.output = []
+            try:
+                for step in steps:
+                    step()
+            except Exception as e:
+                self._record(self.errors, f"Installation step failed: {e}")
+            finally:
+                output, self._lane.output = self._lane.output, None
+                with self._lock:
+                    for line in output:
+                        print(line)
+
+        with ThreadPoolExecutor(max_workers=len(lanes)) as pool:
+            list(pool.map(run_lane, lanes))
+
     def check_ffmpeg(self) -> bool:
         """Check FFmpeg installation."""
+        if self._ffmpeg_ok is not None:
+            return self._ffmpeg_ok
+
+        cached = self._probe_cache.get("ffmpeg")
+        if cached and os.path.isfile(cached["path"]):
+            self.log("Checking FFmpeg (cached)...", "STEP")
+            self.log(f"FFmpeg found: {cached['version']}")
+            self._ffmpeg_version = cached["version"]
+            self._ffmpeg_ok = True
+            return True
+
+        self._ffmpeg_ok = self._probe_ffmpeg()
+        if self._ffmpeg_ok:
+            self._probe_cache["ffmpeg"] = {
+                "path": shutil.which("ffmpeg"),
+                "version": self._ffmpeg_version,
+            }
+            self._save_probe_cache()
+        return self._ffmpeg_ok
+
+    def _probe_ffmpeg(self) -> bool:
+        """Run ffmpeg -version and report the result."""
         self.log("Checking FFmpeg...", "STEP")
 
         ffmpeg = shutil.which("ffmpeg")
@@ -338,6 +823,7 @@ class WindowsInstaller:
             )
             version = result.stdout.split('\n')[0]
             self.log(f"FFmpeg found: {version}")
+            self._ffmpeg_version = version
             return True
         except subprocess.CalledProcessError:
             self.warnings.append("FFmpeg found but not working")
@@ -347,8 +833,11 @@ class WindowsInstaller:
         """Download AI models."""
         self.log("Downloading AI models...", "STEP")
 
+        # Lowercase the installed labels once for all the checks below
+        installed = {item.lower() for item in self.installed}
+
         # GFPGAN model
-        if any("gfpgan" in item.lower() for item in self.installed):
+        if any("gfpgan" in item for item in installed):
             self.log("Downloading GFPGAN model...")
             try:
                 subprocess.run(
@@ -361,7 +850,7 @@ class WindowsInstaller:
                 self.warnings.append("GFPGAN model download failed (can be done manually later)")
 
         # Demucs models (auto-downloaded on first use)
-        if any("demucs" in item.lower() for item in self.installed):
+        if any("demucs" in item for item in installed):
             self.log("Demucs models will be downloaded automatically on first use")
 
     def run_verification(self):
@@ -370,10 +859,16 @@ class WindowsInstaller:
 
         verify_script = Path("scripts") / "verify_setup.py"
         if verify_script.exists():
+            # Hand over the FFmpeg version probed earlier so the script
+            # doesn't run ffmpeg -version again
+            env = os.environ.copy()
+            if self._ffmpeg_version:
+                env["TERMINALAI_FFMPEG_VERSION"] = self._ffmpeg_version
             try:
                 subprocess.run(
                     [sys.executable, str(verify_script)],
-                    check=True
+                    check=True,
+                    env=env
                 )
             except subprocess.CalledProcessError:
                 self.warnings.append("Verification script failed")
@@ -512,16 +1007,21 @@ class WindowsInstaller:
                 self.log("GPU not detected - skipping PyTorch", "WARN")
             print()
 
+        # Audio AI and face restoration share numpy/scipy/opencv, so they
+        # stay in one lane; VapourSynth has no dependencies in common and
+        # installs alongside them
+        ai_steps = []
         if install_type in ["full", "audio"]:
-            self.install_audio_ai()
-            print()
-
+            ai_steps.append(self.install_audio_ai)
         if install_type in ["full", "faces"]:
-            self.install_face_restoration()
-            print()
+            ai_steps.append(self.install_face_restoration)
 
+        lanes = [ai_steps] if ai_steps else []
         if install_type == "full":
-            self.install_vapoursynth()
+            lanes.append([self.install_vapoursynth])
+
+        if lanes:
+            self._run_lanes(lanes)
             print()
 
         self.check_ffmpeg()
@@ -555,15 +1055,11 @@ class WindowsInstaller:
             "VapourSynth": "vapoursynth",
         }
 
+        # find_spec locates each module without importing it
         for name, module in components.items():
-            try:
-                result = subprocess.run(
-                    [sys.executable, "-c", f"import {module}"],
-                    capture_output=True,
-                    check=True
-                )
+            if importlib.util.find_spec(module) is not None:
                 self.log(f"{name}: Installed")
-            except subprocess.CalledProcessError:
+            else:
                 self.log(f"{name}: Not installed", "WARN")
 
         print()
@@ -631,11 +1127,24 @@ Examples:
         action="store_true",
         help="Check installation status"
     )
+    parser.add_argument(
+        "--force-reprobe",
+        action="store_true",
+        help="Ignore cached GPU/FFmpeg detection from earlier runs"
+    )
+    parser.add_argument(
+        "--use-pip",
+        action="store_true",
+        help="Install with pip even if uv is available"
+    )
 
     parser.set_defaults(install_type="interactive")
     args = parser.parse_args()
 
-    installer = WindowsInstaller()
+    installer = WindowsInstaller(
+        use_pip=args.use_pip,
+        reprobe=args.check or args.force_reprobe
+    )
 
     if args.check:
         installer.check_status()
@@ -20,19 +20,27 @@ Usage:
     python verify_installation.py --quick      # Quick check
     python verify_installation.py --report     # Generate detailed report
     python verify_installation.py --fix        # Attempt automatic fixes
+    python verify_installation.py --no-cache   # Ignore cached results
 """
 
-import json
+import functools
+import importlib
+import importlib.metadata
 import logging
 import os
 import platform
+import re
+import shutil
 import subprocess
 import sys
+import time
 import traceback
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field, fields
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Any
 
 # Fix Windows console encoding for unicode characters
 if sys.platform == "win32":
@@ -55,37 +63,232 @@ class ComponentStatus(Enum):
     NOT_TESTED = "not_tested"
 
 
-@dataclass
+# Status -> JSON string, looked up without going through Enum.value
+_STATUS_STR = {status: status.value for status in ComponentStatus}
+
+# Status -> label printed by verify_all()
+_STATUS_SYMBOL = {
+    ComponentStatus.AVAILABLE: "[OK]",
+    ComponentStatus.PARTIAL: "[PARTIAL]",
+    ComponentStatus.UNAVAILABLE: "[NOT INSTALLED]",
+    ComponentStatus.ERROR: "[ERROR]"
+}
+
+
+# Suggestion/note texts repeat across components and runs; share one copy.
+# Cleared when full so long-running processes don't grow it without bound
+_STR_POOL: Dict[str, str] = {}
+_STR_POOL_MAX = 1024
+
+
+def _pooled(text: str) -> str:
+    """Return the pooled copy of ``text``, adding it if new."""
+    pooled = _STR_POOL.get(text)
+    if pooled is None:
+        if len(_STR_POOL) >= _STR_POOL_MAX:
+            _STR_POOL.clear()
+        pooled = _STR_POOL[text] = text
+    return pooled
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values json/orjson have no native support for."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+@functools.cache
+def _get_json_encoder():
+    """
+    Import the JSON encoder on first use.
+
+    Most runs only print the report, so neither json nor orjson is loaded
+    at startup. Returns the orjson module when installed, else None.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+# Optional modules that failed to import, kept so later verifiers re-raise
+# the error instead of searching sys.path again
+_FAILED_IMPORTS: Dict[str, ImportError] = {}
+
+
+def _import_optional(name: str):
+    """
+    Import an optional dependency, remembering failures.
+
+    Successful imports are already cached in sys.modules. A module that
+    failed raises its original ImportError again on later calls.
+    """
+    error = _FAILED_IMPORTS.get(name)
+    if error is not None:
+        raise error.with_traceback(None)
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        _FAILED_IMPORTS[name] = e
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _find_executable(name: str) -> Optional[str]:
+    """Return the full path of ``name`` on PATH (None if missing), looked up once."""
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=1)
+def _system_info() -> Mapping[str, str]:
+    """
+    Return platform details, gathered once per process.
+
+    On POSIX everything comes from one os.uname() call: platform.platform()
+    also scans the interpreter binary for its libc version, and
+    platform.processor() forks `uname -p`. Windows has no os.uname().
+    """
+    if sys.platform != "win32":
+        uname = os.uname()
+        system, machine = uname.sysname, uname.machine
+        platform_str = f"{uname.sysname}-{uname.release}-{uname.machine}"
+        processor = uname.machine
+    else:
+        system, machine = platform.system(), platform.machine()
+        platform_str = platform.platform()
+        processor = platform.processor()
+
+    return MappingProxyType({
+        "platform": platform_str,
+        "system": system,
+        "machine": machine,
+        "processor": processor,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation()
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_available() -> bool:
+    """
+    Return torch.cuda.is_available(), queried once per process.
+
+    The driver probe behind it is not free. Callers must already have
+    imported torch successfully.
+    """
+    import torch
+    return torch.cuda.is_available()
+
+
+@functools.lru_cache(maxsize=1)
+def _device_count() -> int:
+    """Return torch.cuda.device_count(), queried once per process."""
+    import torch
+    return torch.cuda.device_count()
+
+
+@functools.lru_cache(maxsize=1)
+def _has_cuda_noinit() -> bool:
+    """
+    Return whether torch is a CUDA build that can see a GPU.
+
+    Only reads the build's CUDA version and the device count, neither of
+    which creates a CUDA context (is_available() did on older torch).
+    Used where CUDA only picks a status or performance note.
+    """
+    import torch
+    return getattr(torch.version, "cuda", None) is not None and _device_count() > 0
+
+
+@functools.lru_cache(maxsize=None)
+def _device_properties(index: int):
+    """Return torch.cuda.get_device_properties(index), cached per device."""
+    import torch
+    return torch.cuda.get_device_properties(index)
+
+
+@functools.lru_cache(maxsize=64)
+def _glob_pth(dir_str: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Return the ``*.pth`` file names in a model directory.
+
+    Keyed on the directory's mtime, so repeated checks only re-glob after
+    a model was added or removed.
+    """
+    return tuple(p.name for p in Path(dir_str).glob("*.pth"))
+
+
+def _compile_asdict(cls):
+    """
+    Generate a straight-line ``asdict`` method from a dataclass's fields.
+
+    Like dataclasses' own generated ``__init__``, the field names are
+    baked into one dict literal, so the method stays in sync with the
+    fields without any per-call introspection.
+    """
+    entries = ", ".join(
+        f"{f.name!r}: _STATUS_STR[self.{f.name}]" if f.name == "status"
+        else f"{f.name!r}: self.{f.name}"
+        for f in fields(cls)
+    )
+    namespace = {}
+    exec(f"def asdict(self):\n    return {{{entries}}}\n", {"_STATUS_STR": _STATUS_STR}, namespace)
+    method = namespace["asdict"]
+    method.__qualname__ = f"{cls.__qualname__}.asdict"
+    method.__doc__ = "Convert result to a JSON-ready dictionary."
+    cls.asdict = method
+    return cls
+
+
+@_compile_asdict
+@dataclass(slots=True)
 class ComponentResult:
     """Result of a component verification."""
     name: str
     status: ComponentStatus
     version: Optional[str] = None
-    details: Dict[str, Any] = None
+    details: Dict[str, Any] = field(default_factory=dict)
     error_message: Optional[str] = None
-    suggestions: List[str] = None
-    performance_notes: List[str] = None
+    suggestions: Sequence[str] = ()
+    performance_notes: Sequence[str] = ()
 
     def __post_init__(self):
-        if self.details is None:
-            self.details = {}
-        if self.suggestions is None:
-            self.suggestions = []
-        if self.performance_notes is None:
-            self.performance_notes = []
+        # Defaults are the shared empty tuple, so only real lists are touched
+        if self.suggestions:
+            self.suggestions = tuple(_pooled(text) for text in self.suggestions)
+        if self.performance_notes:
+            self.performance_notes = tuple(_pooled(text) for text in self.performance_notes)
 
     @property
     def is_available(self) -> bool:
         """Check if component is available."""
-        return self.status == ComponentStatus.AVAILABLE
+        return self.status is ComponentStatus.AVAILABLE
 
     @property
     def is_partial(self) -> bool:
         """Check if component is partially available."""
-        return self.status == ComponentStatus.PARTIAL
+        return self.status is ComponentStatus.PARTIAL
+
+
 
+def _result_from_dict(entry: Dict[str, Any]) -> ComponentResult:
+    """Rebuild a ComponentResult from its asdict() form."""
+    return ComponentResult(**{**entry, "status": ComponentStatus(entry["status"])})
 
-@dataclass
+
+def _available_names(components: Dict[str, ComponentResult]) -> frozenset:
+    """Return the names of the components whose status is AVAILABLE."""
+    return frozenset(
+        name for name, comp in components.items()
+        if comp.status is ComponentStatus.AVAILABLE
+    )
+
+
+@dataclass(slots=True)
 class VerificationReport:
     """Complete verification report."""
     system_info: Dict[str, str]
@@ -94,33 +297,86 @@ class VerificationReport:
     warnings: List[str]
     errors: List[str]
     recommendations: List[str]
+    # to_dict() result; reports are read-only once verify_all() builds them
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert report to dictionary."""
-        return {
-            "system_info": self.system_info,
-            "components": {
-                name: {
-                    "name": comp.name,
-                    "status": comp.status.value,
-                    "version": comp.version,
-                    "details": comp.details,
-                    "error_message": comp.error_message,
-                    "suggestions": comp.suggestions,
-                    "performance_notes": comp.performance_notes
-                }
-                for name, comp in self.components.items()
-            },
-            "feature_availability": self.feature_availability,
-            "warnings": self.warnings,
-            "errors": self.errors,
-            "recommendations": self.recommendations
+    def __post_init__(self):
+        # Component names repeat across reports (and become JSON keys);
+        # interning shares one string object per name
+        self.components = {
+            sys.intern(name): comp for name, comp in self.components.items()
         }
 
+    def available_components(self) -> frozenset:
+        """Return the names of all available components."""
+        return _available_names(self.components)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert report to dictionary (built once, then reused)."""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "system_info": self.system_info,
+                "components": {
+                    name: comp.asdict() for name, comp in self.components.items()
+                },
+                "feature_availability": self.feature_availability,
+                "warnings": self.warnings,
+                "errors": self.errors,
+                "recommendations": self.recommendations
+            }
+        return self._cached_dict
+
     def to_json(self, filepath: Path):
-        """Save report as JSON."""
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        """Save report as JSON (uses orjson when installed), atomically."""
+        orjson = _get_json_encoder()
+        if orjson is not None:
+            # orjson encodes the dataclasses field by field, matching
+            # to_dict() without building the intermediate dict
+            buf = orjson.dumps(
+                self,
+                default=_json_default,
+                option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_INDENT_2
+            )
+        else:
+            import json
+            buf = json.dumps(self.to_dict(), indent=2, default=_json_default).encode("utf-8")
+
+        # Write to a temporary file and rename it over the target so a
+        # reader never sees a half-written report
+        filepath = Path(filepath)
+        tmp = filepath.with_suffix(filepath.suffix + ".tmp")
+        with open(tmp, "wb", buffering=0) as f:
+            f.write(buf)
+        os.replace(tmp, filepath)
+
+    def to_ndjson_line(self) -> bytes:
+        """Encode the report as one compact JSON line (NDJSON)."""
+        orjson = _get_json_encoder()
+        if orjson is not None:
+            return orjson.dumps(
+                self,
+                default=_json_default,
+                option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_APPEND_NEWLINE
+            )
+        import json
+        return (
+            json.dumps(self.to_dict(), separators=(",", ":"), default=_json_default) + "\n"
+        ).encode("utf-8")
+
+
+def to_json_batch(reports: List[VerificationReport], filepath: Path):
+    """
+    Append reports to an NDJSON file, one compact line per report.
+
+    Args:
+        reports: Reports to append, e.g. one per CI matrix entry
+        filepath: NDJSON file, created if missing
+    """
+    buf = b"".join(report.to_ndjson_line() for report in reports)
+    with open(filepath, "ab", buffering=0) as f:
+        f.write(buf)
 
 
 # =============================================================================
@@ -168,9 +424,9 @@ class PythonVerifier(ComponentVerifier):
             status=status,
             version=version_str,
             details={
-                "implementation": platform.python_implementation(),
+                "implementation": _system_info()["python_implementation"],
                 "compiler": platform.python_compiler(),
-                "platform": platform.platform()
+                "platform": _system_info()["platform"]
             },
             suggestions=suggestions
         )
@@ -179,26 +435,41 @@ class PythonVerifier(ComponentVerifier):
 class PyTorchVerifier(ComponentVerifier):
     """Verify PyTorch installation and CUDA support."""
 
+    def __init__(self, verbose: bool = True, isolated: bool = False):
+        super().__init__(verbose)
+        # Probe from a child process, so the CUDA context the probe creates
+        # (and the VRAM it holds) goes away when the child exits
+        self.isolated = isolated
+
     def verify(self) -> ComponentResult:
+        if self.isolated:
+            return _verify_isolated(PyTorchVerifier)
+
         try:
-            import torch
+            torch = _import_optional("torch")
 
             version = torch.__version__
+            cuda_ok = _cuda_available()
             details = {
                 "version": version,
-                "cuda_available": torch.cuda.is_available(),
-                "cuda_version": torch.version.cuda if torch.cuda.is_available() else None,
-                "cudnn_version": torch.backends.cudnn.version() if torch.cuda.is_available() else None,
-                "gpu_count": torch.cuda.device_count() if torch.cuda.is_available() else 0,
+                "cuda_available": cuda_ok,
+                "cuda_version": torch.version.cuda if cuda_ok else None,
+                "cudnn_version": torch.backends.cudnn.version() if cuda_ok else None,
+                "gpu_count": _device_count() if cuda_ok else 0,
             }
 
             # Get GPU details
-            if torch.cuda.is_available():
-                gpu_names = [torch.cuda.get_device_name(i) for i in range(torch.cuda.device_count())]
+            if cuda_ok:
+                # Only report the current device if something else already
+                # initialized CUDA; the verifier shouldn't be the one to do it
+                if torch.cuda.is_initialized():
+                    details["current_device"] = torch.cuda.current_device()
+                gpu_names = [_device_properties(i).name for i in range(details["gpu_count"])]
                 details["gpu_devices"] = gpu_names
-                details["current_device"] = torch.cuda.current_device()
 
-                # Performance test - simple matrix multiplication
+            # Performance test - simple matrix multiplication. Opt-in: it
+            # allocates a CUDA context and cuBLAS workspace (up to GBs of VRAM)
+            if cuda_ok and os.environ.get("TERMINALAI_GPU_BENCH"):
                 try:
                     import time
                     device = torch.device("cuda")
@@ -230,7 +501,7 @@ class PyTorchVerifier(ComponentVerifier):
             performance_notes = []
             status = ComponentStatus.AVAILABLE
 
-            if not torch.cuda.is_available():
+            if not cuda_ok:
                 status = ComponentStatus.PARTIAL
                 suggestions.append("CUDA not available - CPU-only mode")
                 suggestions.append("Install CUDA-enabled PyTorch: https://pytorch.org/get-started/locally/")
@@ -272,7 +543,7 @@ class VapourSynthVerifier(ComponentVerifier):
 
     def verify(self) -> ComponentResult:
         try:
-            import vapoursynth as vs
+            vs = _import_optional("vapoursynth")
 
             core = vs.core
             version = core.version()
@@ -297,7 +568,7 @@ class VapourSynthVerifier(ComponentVerifier):
             for plugin, description in plugins_to_check.items():
                 try:
                     if plugin == "havsfunc":
-                        import havsfunc
+                        _import_optional("havsfunc")
                         available_plugins.append(f"{plugin} ({description})")
                     else:
                         # Try to access plugin namespace
@@ -356,8 +627,8 @@ class GFPGANVerifier(ComponentVerifier):
 
     def verify(self) -> ComponentResult:
         try:
-            import gfpgan
-            from basicsr.archs.rrdbnet_arch import RRDBNet
+            gfpgan = _import_optional("gfpgan")
+            _import_optional("basicsr.archs.rrdbnet_arch")
 
             details = {
                 "gfpgan_available": True,
@@ -366,11 +637,11 @@ class GFPGANVerifier(ComponentVerifier):
 
             # Check for model files
             model_dir = Path("models") / "gfpgan"
-            model_files = []
-            if model_dir.exists():
-                model_files = list(model_dir.glob("*.pth"))
+            model_files = ()
+            if model_dir.is_dir():
+                model_files = _glob_pth(str(model_dir), model_dir.stat().st_mtime_ns)
                 details["model_directory"] = str(model_dir)
-                details["models_found"] = [m.name for m in model_files]
+                details["models_found"] = list(model_files)
 
             suggestions = []
             status = ComponentStatus.AVAILABLE
@@ -383,7 +654,7 @@ class GFPGANVerifier(ComponentVerifier):
 
             # Try to import cv2 (required dependency)
             try:
-                import cv2
+                cv2 = _import_optional("cv2")
                 details["opencv_available"] = True
                 details["opencv_version"] = cv2.__version__
             except ImportError:
@@ -426,8 +697,8 @@ class CodeFormerVerifier(ComponentVerifier):
     def verify(self) -> ComponentResult:
         try:
             # CodeFormer requires PyTorch
-            import torch
-            import cv2
+            _import_optional("torch")
+            cv2 = _import_optional("cv2")
 
             details = {
                 "torch_available": True,
@@ -438,7 +709,7 @@ class CodeFormerVerifier(ComponentVerifier):
             # Try to import CodeFormer package
             codeformer_installed = False
             try:
-                from codeformer import CodeFormer
+                _import_optional("codeformer")
                 codeformer_installed = True
                 details["codeformer_package"] = True
             except ImportError:
@@ -446,14 +717,15 @@ class CodeFormerVerifier(ComponentVerifier):
 
             # Check for model files
             model_dir = Path("models") / "codeformer"
-            model_files = []
-            if model_dir.exists():
-                model_files = list(model_dir.glob("*.pth"))
+            model_files = ()
+            if model_dir.is_dir():
+                model_files = _glob_pth(str(model_dir), model_dir.stat().st_mtime_ns)
                 details["model_directory"] = str(model_dir)
-                details["models_found"] = [m.name for m in model_files]
+                details["models_found"] = list(model_files)
 
             suggestions = []
-            status = ComponentStatus.AVAILABLE if torch.cuda.is_available() else ComponentStatus.PARTIAL
+            cuda_ok = _has_cuda_noinit()
+            status = ComponentStatus.AVAILABLE if cuda_ok else ComponentStatus.PARTIAL
 
             if not model_files:
                 suggestions.append("CodeFormer model not found")
@@ -465,11 +737,11 @@ class CodeFormerVerifier(ComponentVerifier):
             if not codeformer_installed:
                 suggestions.append("CodeFormer package not installed (using built-in implementation)")
 
-            if not torch.cuda.is_available():
+            if not cuda_ok:
                 suggestions.append("CUDA not available - CodeFormer will be very slow on CPU")
 
             performance_notes = []
-            if torch.cuda.is_available():
+            if cuda_ok:
                 performance_notes.append("GPU acceleration available - optimal for CodeFormer")
             else:
                 performance_notes.append("CPU mode - expect slow processing (GPU highly recommended)")
@@ -508,36 +780,27 @@ class DeepFilterNetVerifier(ComponentVerifier):
 
     def verify(self) -> ComponentResult:
         try:
-            import torch
-            from df import enhance, init_df
+            _import_optional("torch")
+            # Import the module that provides init_df, but don't call it:
+            # that downloads the model and loads it into memory/VRAM
+            _import_optional("df.enhance")
 
             details = {
                 "torch_available": True,
-                "deepfilternet_available": True
+                "deepfilternet_available": True,
+                "model_loaded": False
             }
 
-            # Try to initialize DeepFilterNet
             try:
-                model, df_state, _ = init_df()
-                details["model_loaded"] = True
-                details["model_info"] = {
-                    "sr": df_state.sr(),
-                    "hop_size": df_state.hop_size(),
-                }
-                status = ComponentStatus.AVAILABLE
-                suggestions = []
-            except Exception as e:
-                details["model_loaded"] = False
-                details["load_error"] = str(e)
-                status = ComponentStatus.PARTIAL
-                suggestions = [
-                    "DeepFilterNet model initialization failed",
-                    "Model will be downloaded on first use",
-                    f"Error: {str(e)}"
-                ]
+                version = importlib.metadata.version("deepfilternet")
+            except importlib.metadata.PackageNotFoundError:
+                version = "0.5.0+"
+
+            status = ComponentStatus.AVAILABLE
+            suggestions = ["Model will be downloaded on first use"]
 
             performance_notes = []
-            if torch.cuda.is_available():
+            if _has_cuda_noinit():
                 performance_notes.append("GPU acceleration available - recommended for real-time processing")
             else:
                 performance_notes.append("CPU mode - processing will be slower but functional")
@@ -545,7 +808,7 @@ class DeepFilterNetVerifier(ComponentVerifier):
             return ComponentResult(
                 name="DeepFilterNet",
                 status=status,
-                version="0.5.0+",
+                version=version,
                 details=details,
                 suggestions=suggestions,
                 performance_notes=performance_notes
@@ -576,11 +839,11 @@ class AudioSRVerifier(ComponentVerifier):
 
     def verify(self) -> ComponentResult:
         try:
-            import torch
+            _import_optional("torch")
 
             # Try to import audiosr
             try:
-                import audiosr
+                audiosr = _import_optional("audiosr")
                 audiosr_available = True
                 audiosr_version = audiosr.__version__ if hasattr(audiosr, '__version__') else "unknown"
             except ImportError:
@@ -618,7 +881,7 @@ class AudioSRVerifier(ComponentVerifier):
                 ]
 
             performance_notes = []
-            if torch.cuda.is_available():
+            if _has_cuda_noinit():
                 performance_notes.append("GPU acceleration available - recommended for AudioSR")
             else:
                 performance_notes.append("CPU mode available but slower")
@@ -657,13 +920,13 @@ class DemucsVerifier(ComponentVerifier):
 
     def verify(self) -> ComponentResult:
         try:
-            import torch
-            import torchaudio
+            _import_optional("torch")
+            torchaudio = _import_optional("torchaudio")
 
             # Try to import demucs
             try:
-                import demucs
-                from demucs.pretrained import get_model_from_args
+                demucs = _import_optional("demucs")
+                _import_optional("demucs.pretrained")
                 demucs_available = True
                 demucs_version = demucs.__version__ if hasattr(demucs, '__version__') else "4.0.0+"
             except ImportError:
@@ -698,7 +961,7 @@ class DemucsVerifier(ComponentVerifier):
                 ]
 
             performance_notes = []
-            if torch.cuda.is_available():
+            if _has_cuda_noinit():
                 performance_notes.append("GPU acceleration available - essential for Demucs")
                 performance_notes.append("Demucs is very slow on CPU (not recommended)")
             else:
@@ -738,25 +1001,47 @@ class DemucsVerifier(ComponentVerifier):
 class FFmpegVerifier(ComponentVerifier):
     """Verify FFmpeg installation and encoders."""
 
+    INSTALL_SUGGESTIONS = (
+        "Install FFmpeg:",
+        "  Windows: winget install FFmpeg",
+        "  Linux: sudo apt install ffmpeg",
+        "  macOS: brew install ffmpeg",
+        "FFmpeg is REQUIRED for all video processing"
+    )
+
+    # Second column of an indented ``ffmpeg -encoders``/``-filters`` row
+    _LISTED_NAME_RE = re.compile(rb"^[ \t]+\S+[ \t]+(\S+)", re.MULTILINE)
+    # Version in the banner's first line, e.g. "ffmpeg version 6.0 Copyright ..."
+    _VERSION_RE = re.compile(rb"ffmpeg version (\S+)")
+
+    @classmethod
+    def _listed_names(cls, listing: bytes) -> set:
+        """Return the names column of an ``ffmpeg -encoders``/``-filters`` table."""
+        return set(cls._LISTED_NAME_RE.findall(listing))
+
     def verify(self) -> ComponentResult:
-        try:
-            # Get FFmpeg version
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                text=True,
-                check=True
+        ffmpeg = _find_executable("ffmpeg")
+        if ffmpeg is None:
+            return ComponentResult(
+                name="FFmpeg",
+                status=ComponentStatus.UNAVAILABLE,
+                error_message="ffmpeg not found on PATH",
+                suggestions=self.INSTALL_SUGGESTIONS
             )
-            version_line = result.stdout.split("\n")[0]
-            version = version_line.split("version")[1].split()[0]
 
-            # Check encoders
+        try:
+            # List encoders; without -hide_banner the version banner is
+            # printed to stderr, which saves a separate `ffmpeg -version`
             encoder_result = subprocess.run(
-                ["ffmpeg", "-hide_banner", "-encoders"],
+                [ffmpeg, "-encoders"],
                 capture_output=True,
-                text=True,
-                check=True
+                check=True,
+                timeout=10
             )
+            # The banner runs to several KB of build configuration; the
+            # version is always in its first few hundred bytes
+            match = self._VERSION_RE.search(encoder_result.stderr, 0, 256)
+            version = match.group(1).decode("ascii", "replace") if match else "unknown"
 
             encoders = {
                 "h264_nvenc": "NVIDIA H.264 hardware encoder",
@@ -770,8 +1055,9 @@ class FFmpegVerifier(ComponentVerifier):
             available_encoders = {}
             missing_encoders = {}
 
+            encoder_names = self._listed_names(encoder_result.stdout)
             for encoder, description in encoders.items():
-                if encoder in encoder_result.stdout:
+                if encoder.encode() in encoder_names:
                     available_encoders[encoder] = description
                 else:
                     missing_encoders[encoder] = description
@@ -782,13 +1068,20 @@ class FFmpegVerifier(ComponentVerifier):
                 "missing_encoders": missing_encoders
             }
 
-            # Check filters
-            filter_result = subprocess.run(
-                ["ffmpeg", "-hide_banner", "-filters"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            # Check filters; the encoders already answered, so a hang here
+            # only loses the filter list rather than the whole component
+            try:
+                filter_listing = subprocess.run(
+                    [ffmpeg, "-hide_banner", "-filters"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    check=True,
+                    timeout=10
+                ).stdout
+                filters_timed_out = False
+            except subprocess.TimeoutExpired:
+                filter_listing = b""
+                filters_timed_out = True
 
             important_filters = {
                 "yadif": "Deinterlacing",
@@ -798,8 +1091,9 @@ class FFmpegVerifier(ComponentVerifier):
             }
 
             available_filters = {}
+            filter_names = self._listed_names(filter_listing)
             for filt, desc in important_filters.items():
-                if filt in filter_result.stdout:
+                if filt.encode() in filter_names:
                     available_filters[filt] = desc
 
             details["available_filters"] = available_filters
@@ -818,6 +1112,10 @@ class FFmpegVerifier(ComponentVerifier):
             if missing_encoders:
                 status = ComponentStatus.PARTIAL
 
+            if filters_timed_out:
+                status = ComponentStatus.PARTIAL
+                suggestions.append("`ffmpeg -filters` timed out; filter support not checked")
+
             return ComponentResult(
                 name="FFmpeg",
                 status=status,
@@ -827,18 +1125,12 @@ class FFmpegVerifier(ComponentVerifier):
                 performance_notes=performance_notes
             )
 
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
             return ComponentResult(
                 name="FFmpeg",
                 status=ComponentStatus.UNAVAILABLE,
                 error_message=str(e),
-                suggestions=[
-                    "Install FFmpeg:",
-                    "  Windows: winget install FFmpeg",
-                    "  Linux: sudo apt install ffmpeg",
-                    "  macOS: brew install ffmpeg",
-                    "FFmpeg is REQUIRED for all video processing"
-                ]
+                suggestions=self.INSTALL_SUGGESTIONS
             )
         except Exception as e:
             return ComponentResult(
@@ -849,6 +1141,189 @@ class FFmpegVerifier(ComponentVerifier):
             )
 
 
+def _nvml_gpus() -> Optional[Tuple[Dict[str, str], ...]]:
+    """
+    Read the NVIDIA GPUs in-process through NVML (nvidia-ml-py).
+
+    Returns:
+        GPUs in the same shape as the nvidia-smi listing, or None if
+        pynvml isn't installed or NVML can't be initialized
+    """
+    try:
+        pynvml = _import_optional("pynvml")
+    except ImportError:
+        return None
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        return None
+
+    def text(value) -> str:
+        # Older nvidia-ml-py releases return bytes
+        return value.decode("utf-8", "replace") if isinstance(value, bytes) else value
+
+    try:
+        driver_version = text(pynvml.nvmlSystemGetDriverVersion())
+        nvidia_gpus = []
+        for index in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(index)
+            memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            nvidia_gpus.append({
+                "name": text(pynvml.nvmlDeviceGetName(handle)),
+                "memory": f"{memory.total // (1024 * 1024)} MiB",
+                "driver_version": driver_version
+            })
+        return tuple(nvidia_gpus)
+    except pynvml.NVMLError:
+        return None
+    finally:
+        pynvml.nvmlShutdown()
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_nvidia() -> Tuple[Dict[str, str], ...]:
+    """
+    Return the NVIDIA GPUs, probed once per process.
+
+    Asks NVML directly when nvidia-ml-py is installed, otherwise runs
+    nvidia-smi. Each GPU is a dict of name, memory and driver_version;
+    the result is empty when neither can report any GPU.
+    """
+    nvidia_gpus = _nvml_gpus()
+    if nvidia_gpus is not None:
+        return nvidia_gpus
+
+    nvidia_smi = _find_executable("nvidia-smi")
+    if nvidia_smi is None:
+        return ()
+    try:
+        output = subprocess.run(
+            [nvidia_smi, "--query-gpu=name,memory.total,driver_version",
+             "--format=csv,noheader"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            errors="replace",
+            check=True,
+            timeout=5
+        ).stdout
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        return ()
+
+    nvidia_gpus = (_parse_nvidia_smi_line(line) for line in output.strip().split("\n"))
+    return tuple(gpu for gpu in nvidia_gpus if gpu is not None)
+
+
+def _parse_nvidia_smi_line(line: str) -> Optional[Dict[str, str]]:
+    """Parse one ``name, memory.total, driver_version`` CSV row, or None."""
+    parts = [p.strip() for p in line.split(",")]
+    if len(parts) < 3:
+        return None
+    return {
+        "name": parts[0],
+        "memory": parts[1],
+        "driver_version": parts[2]
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _windows_adapter_names() -> bytes:
+    """
+    Return the Windows display adapter names, probed once per process.
+
+    Uses CIM through PowerShell, falling back to wmic, which is
+    deprecated and missing from newer Windows 11 builds. Returns b""
+    when neither is available or both fail.
+    """
+    powershell = _find_executable("powershell")
+    if powershell is not None:
+        try:
+            return subprocess.run(
+                [powershell, "-NoProfile", "-Command",
+                 "Get-CimInstance Win32_VideoController | Select-Object -ExpandProperty Name"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+                timeout=15
+            ).stdout
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            pass
+
+    wmic = _find_executable("wmic")
+    if wmic is None:
+        return b""
+    try:
+        return subprocess.run(
+            [wmic, "path", "win32_VideoController", "get", "name"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            timeout=10
+        ).stdout
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        return b""
+
+
+class GPUMonitor:
+    """
+    Sample NVIDIA GPUs repeatedly from one long-running nvidia-smi.
+
+    For callers that poll the GPUs in a loop: ``nvidia-smi -lms`` keeps
+    printing a CSV row per GPU every interval, so the fork+exec is paid
+    once instead of per sample. Iterating yields one dict per row, in
+    the same shape as the ``nvidia_gpus`` details of GPUVerifier, and
+    stops when nvidia-smi exits. Yields nothing without nvidia-smi.
+
+        with GPUMonitor(interval_ms=500) as monitor:
+            for gpu in monitor:
+                ...
+    """
+
+    def __init__(self, interval_ms: int = 1000):
+        self.interval_ms = interval_ms
+        self._process: Optional[subprocess.Popen] = None
+
+    def start(self):
+        """Start nvidia-smi if it is installed and not already running."""
+        nvidia_smi = _find_executable("nvidia-smi")
+        if self._process is None and nvidia_smi is not None:
+            self._process = subprocess.Popen(
+                [nvidia_smi, "--query-gpu=name,memory.total,driver_version",
+                 "--format=csv,noheader", "-lms", str(self.interval_ms)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                errors="replace"
+            )
+
+    def stop(self):
+        """Terminate nvidia-smi."""
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process.stdout.close()
+            self._process = None
+
+    def __enter__(self) -> "GPUMonitor":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def __iter__(self):
+        self.start()
+        if self._process is None:
+            return
+        for line in self._process.stdout:
+            gpu = _parse_nvidia_smi_line(line)
+            if gpu is not None:
+                yield gpu
+
+
 class GPUVerifier(ComponentVerifier):
     """Verify GPU availability and capabilities."""
 
@@ -857,70 +1332,37 @@ class GPUVerifier(ComponentVerifier):
         suggestions = []
         performance_notes = []
 
+        # The vendor queries are independent subprocesses; run them side by
+        # side so the check costs the slowest one rather than their sum
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            nvidia_future = pool.submit(_detect_nvidia)
+            if sys.platform == "win32":
+                adapters_future = pool.submit(_windows_adapter_names)
+
         # Check NVIDIA GPU via nvidia-smi
-        nvidia_available = False
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name,memory.total,driver_version",
-                 "--format=csv,noheader"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5
-            )
-            gpu_lines = result.stdout.strip().split("\n")
-            nvidia_gpus = []
-            for line in gpu_lines:
-                parts = [p.strip() for p in line.split(",")]
-                if len(parts) >= 3:
-                    nvidia_gpus.append({
-                        "name": parts[0],
-                        "memory": parts[1],
-                        "driver_version": parts[2]
-                    })
-
-            if nvidia_gpus:
-                nvidia_available = True
-                details["nvidia_gpus"] = nvidia_gpus
-                details["gpu_count"] = len(nvidia_gpus)
-                performance_notes.append(f"Found {len(nvidia_gpus)} NVIDIA GPU(s)")
-
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            details["nvidia_gpus"] = []
-
-        # Check AMD GPU (basic detection on Windows)
-        amd_available = False
-        if sys.platform == "win32":
-            try:
-                result = subprocess.run(
-                    ["wmic", "path", "win32_VideoController", "get", "name"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                if "AMD" in result.stdout or "Radeon" in result.stdout:
-                    amd_available = True
-                    details["amd_gpu_detected"] = True
-                    performance_notes.append("AMD GPU detected (Vulkan-based acceleration available)")
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
+        nvidia_gpus = list(nvidia_future.result())
+        nvidia_available = bool(nvidia_gpus)
+        details["nvidia_gpus"] = nvidia_gpus
+        if nvidia_available:
+            details["gpu_count"] = len(nvidia_gpus)
+            performance_notes.append(f"Found {len(nvidia_gpus)} NVIDIA GPU(s)")
 
-        # Check Intel GPU
+        # Check AMD and Intel GPUs (basic detection on Windows) from one
+        # adapter listing
+        amd_available = False
         intel_available = False
         if sys.platform == "win32":
-            try:
-                result = subprocess.run(
-                    ["wmic", "path", "win32_VideoController", "get", "name"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                if "Intel" in result.stdout:
-                    intel_available = True
-                    details["intel_gpu_detected"] = True
-                    performance_notes.append("Intel GPU detected (limited acceleration support)")
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
+            gpu_names = adapters_future.result()
+
+            if b"AMD" in gpu_names or b"Radeon" in gpu_names:
+                amd_available = True
+                details["amd_gpu_detected"] = True
+                performance_notes.append("AMD GPU detected (Vulkan-based acceleration available)")
+
+            if b"Intel" in gpu_names:
+                intel_available = True
+                details["intel_gpu_detected"] = True
+                performance_notes.append("Intel GPU detected (limited acceleration support)")
 
         # Determine status
         if nvidia_available:
@@ -952,15 +1394,255 @@ class GPUVerifier(ComponentVerifier):
         )
 
 
+# Components checked by verify_all(quick=True): the critical path only
+QUICK_COMPONENTS = frozenset({"Python", "FFmpeg", "GPU"})
+
+
+# One thread per built-in verifier, so none waits for another to finish
+MAX_VERIFIER_THREADS = 10
+
+
+def run_all_verifiers(verifiers: Sequence[ComponentVerifier]) -> List[Any]:
+    """
+    Run verifiers concurrently, returning their results in input order.
+
+    Checks are dominated by subprocesses and first-time imports, which
+    release the GIL, so the run takes about as long as the slowest check.
+    A verifier that raises yields its exception in place of a result.
+    """
+    def run(verifier: ComponentVerifier) -> Any:
+        try:
+            return verifier.verify()
+        except Exception as e:
+            return e
+
+    if not verifiers:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_VERIFIER_THREADS, len(verifiers))) as pool:
+        return list(pool.map(run, verifiers))
+
+
+def _verify_in_child(verifier_cls: type, conn):
+    """Child-process entry point for _verify_isolated()."""
+    try:
+        conn.send(verifier_cls(verbose=False).verify().asdict())
+    finally:
+        conn.close()
+
+
+def _verify_isolated(verifier_cls: type, timeout: float = 120) -> ComponentResult:
+    """
+    Run a verifier in a freshly spawned process and return its result.
+
+    CUDA keeps its context until the process that created it exits, so
+    probing from a child leaves none behind in long-lived callers.
+
+    Raises:
+        RuntimeError: If the child crashes or doesn't finish in time
+    """
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_verify_in_child, args=(verifier_cls, child_conn), daemon=True)
+    process.start()
+    child_conn.close()
+    try:
+        if parent_conn.poll(timeout):
+            return _result_from_dict(parent_conn.recv())
+    except EOFError:
+        pass
+    finally:
+        parent_conn.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+    raise RuntimeError(f"{verifier_cls.__name__} probe failed or timed out after {timeout}s")
+
+
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+# Seconds a cached verification result stays valid
+VERIFY_CACHE_TTL = 5 * 60
+
+
+def _cache_file() -> Path:
+    """Per-user file holding the results of the last verification run."""
+    local_app_data = os.environ.get("LOCALAPPDATA")
+    if local_app_data:
+        return Path(local_app_data) / "TerminalAI" / "verify.json"
+    return Path.home() / ".cache" / "terminalai" / "verify.json"
+
+
+def _site_packages_stamp() -> str:
+    """
+    Fingerprint the installed packages by their site directories' mtimes.
+
+    Installing, upgrading or removing a distribution adds or removes
+    entries in site-packages, which bumps the directory's mtime.
+    """
+    stamps = []
+    for entry in sys.path:
+        if os.path.basename(entry.rstrip("/\\")) in ("site-packages", "dist-packages"):
+            try:
+                stamps.append(str(os.stat(entry).st_mtime_ns))
+            except OSError:
+                pass
+    return ",".join(stamps)
+
+
+def _environment_signature() -> str:
+    """
+    Describe the environment the results depend on.
+
+    Any change (interpreter, platform, PATH, installed packages, torch
+    release, ffmpeg binary) invalidates the cache; the lookups are
+    stat/metadata reads only. PATH decides which nvidia-smi, powershell
+    and wmic the probes would find.
+    """
+    try:
+        torch_version = importlib.metadata.version("torch")
+    except importlib.metadata.PackageNotFoundError:
+        torch_version = ""
+    ffmpeg = _find_executable("ffmpeg") or ""
+    try:
+        ffmpeg_mtime = os.stat(ffmpeg).st_mtime_ns if ffmpeg else 0
+    except OSError:
+        ffmpeg_mtime = 0
+    return "|".join([
+        sys.executable, sys.version, _system_info()["platform"],
+        os.environ.get("PATH", ""), _site_packages_stamp(),
+        torch_version, ffmpeg, str(ffmpeg_mtime)
+    ])
+
+
+def _unexpired_cache_entries(signature: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the cache entries still valid for ``signature``.
+
+    Each entry carries the time its component was verified; entries
+    older than VERIFY_CACHE_TTL are dropped.
+    """
+    import json
+    try:
+        cache = json.loads(_cache_file().read_text(encoding="utf-8"))
+        if cache["signature"] != signature:
+            return {}
+        now = time.time()
+        return {
+            name: entry for name, entry in cache["components"].items()
+            if now - entry["ts"] <= VERIFY_CACHE_TTL
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return {}
+
+
+def load_cached_results() -> Dict[str, ComponentResult]:
+    """
+    Load component results saved by a recent run.
+
+    Returns:
+        Results by component name, leaving out any verified more than
+        VERIFY_CACHE_TTL ago; empty if the cache is missing, written for
+        a different environment, or disabled with TERMINALAI_VERIFY_FORCE=1
+    """
+    if os.environ.get("TERMINALAI_VERIFY_FORCE") == "1":
+        return {}
+    try:
+        return {
+            name: _result_from_dict(entry["result"])
+            for name, entry in _unexpired_cache_entries(_environment_signature()).items()
+        }
+    except (KeyError, TypeError, ValueError):
+        return {}
+
+
+def save_cached_results(components: Dict[str, ComponentResult]):
+    """
+    Persist results verified in this run (best effort).
+
+    Only AVAILABLE results are kept: a missing or partial component is
+    what the user is about to fix, and the next run has to see the fix
+    rather than a cached "not installed". Entries already in the cache
+    keep the time they were verified, so reusing a cached result never
+    extends its lifetime.
+
+    Args:
+        components: Results that were actually checked in this run
+    """
+    import json
+    signature = _environment_signature()
+    entries = _unexpired_cache_entries(signature)
+    now = time.time()
+    for name, result in components.items():
+        if result.status is ComponentStatus.AVAILABLE:
+            entries[name] = {"ts": now, "result": result.asdict()}
+        else:
+            entries.pop(name, None)
+    cache = {"signature": signature, "components": entries}
+    try:
+        cache_file = _cache_file()
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(cache, default=_json_default), encoding="utf-8")
+    except OSError:
+        pass
+
+
 # =============================================================================
 # Main Verification System
 # =============================================================================
 
+# Feature key -> title printed by print_summary()
+_FEATURE_LABELS = {
+    key: key.replace("_", " ").title()
+    for key in (
+        "basic_video_processing", "gpu_acceleration", "hardware_encoding",
+        "ai_upscaling", "advanced_deinterlacing", "face_restoration",
+        "ai_audio_denoising", "ai_audio_upsampling", "ai_surround_upmix"
+    )
+}
+
+# (condition, message) pairs, in report order. Each condition gets the
+# status of every checked component and the feature availability; the
+# feature rules only fire for components that were actually checked
+_RECOMMENDATION_RULES: Tuple[
+    Tuple[Callable[[Dict[str, ComponentStatus], Dict[str, bool]], bool], str], ...
+] = (
+    (lambda s, f: s.get("FFmpeg") is not ComponentStatus.AVAILABLE,
+     "CRITICAL: Install FFmpeg - required for all video processing"),
+    (lambda s, f: s.get("GPU") is ComponentStatus.UNAVAILABLE,
+     "Consider using a GPU-enabled system for better performance"),
+    (lambda s, f: s.get("GPU") is ComponentStatus.PARTIAL,
+     "NVIDIA GPU recommended for optimal AI processing performance"),
+    (lambda s, f: s.get("PyTorch") is ComponentStatus.UNAVAILABLE,
+     "Install PyTorch for AI features: pip install torch torchaudio"),
+    (lambda s, f: s.get("PyTorch") is ComponentStatus.PARTIAL,
+     "Install CUDA-enabled PyTorch for GPU acceleration"),
+    (lambda s, f: "VapourSynth" in s and not f.get("advanced_deinterlacing"),
+     "Install VapourSynth for QTGMC deinterlacing (best quality for VHS)"),
+    (lambda s, f: ("GFPGAN" in s or "CodeFormer" in s) and not f.get("face_restoration"),
+     "Install GFPGAN or CodeFormer for face restoration in videos"),
+    (lambda s, f: "DeepFilterNet" in s and not f.get("ai_audio_denoising"),
+     "Install DeepFilterNet for superior AI audio denoising"),
+    (lambda s, f: "Demucs" in s and not f.get("ai_surround_upmix"),
+     "Install Demucs for best-quality surround upmix (requires GPU)"),
+)
+
+
 class InstallationVerifier:
     """Main installation verification system."""
 
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, use_cache: bool = False, isolate_cuda: bool = False,
+                 quiet: bool = False):
         self.verbose = verbose
+        # Build the report without printing any progress output
+        self.quiet = quiet
+        # Reuse results from a run in the last VERIFY_CACHE_TTL seconds
+        self.use_cache = use_cache
+        # Run the CUDA-initializing PyTorch probe in a child process
+        self.isolate_cuda = isolate_cuda
         self.setup_logging()
 
     def setup_logging(self):
@@ -972,34 +1654,50 @@ class InstallationVerifier:
 
     def get_system_info(self) -> Dict[str, str]:
         """Get system information."""
-        return {
-            "platform": platform.platform(),
-            "system": platform.system(),
-            "machine": platform.machine(),
-            "processor": platform.processor(),
-            "python_version": platform.python_version(),
-            "python_implementation": platform.python_implementation()
-        }
+        return dict(_system_info())
+
+    def _print_result(self, name: str, result: ComponentResult):
+        """Print the status block for one component."""
+        print(f"\n{name}:")
+        status_symbol = _STATUS_SYMBOL.get(result.status, "[UNKNOWN]")
+        version_str = f" v{result.version}" if result.version else ""
+        print(f"  {status_symbol}{version_str}")
+
+        # Print details
+        if result.details and self.verbose:
+            for key, value in result.details.items():
+                if isinstance(value, (list, dict)):
+                    continue
+                print(f"    {key}: {value}")
+
+        # Print suggestions
+        for suggestion in result.suggestions:
+            print(f"    💡 {suggestion}")
+
+        # Print performance notes
+        if result.performance_notes and self.verbose:
+            for note in result.performance_notes:
+                print(f"    ⚡ {note}")
 
     def verify_all(self, quick: bool = False) -> VerificationReport:
         """Run all verification checks."""
-        print("=" * 70)
-        print("TerminalAI Installation Verification")
-        print("=" * 70)
-        print()
-
         system_info = self.get_system_info()
-        print("System Information:")
-        print(f"  Platform: {system_info['platform']}")
-        print(f"  Python: {system_info['python_version']} ({system_info['python_implementation']})")
-        print()
+        if not self.quiet:
+            print("=" * 70)
+            print("TerminalAI Installation Verification")
+            print("=" * 70)
+            print()
+            print("System Information:")
+            print(f"  Platform: {system_info['platform']}")
+            print(f"  Python: {system_info['python_version']} ({system_info['python_implementation']})")
+            print()
 
         # Define verifiers
         verifiers = [
             ("Python", PythonVerifier(self.verbose)),
             ("FFmpeg", FFmpegVerifier(self.verbose)),
             ("GPU", GPUVerifier(self.verbose)),
-            ("PyTorch", PyTorchVerifier(self.verbose)),
+            ("PyTorch", PyTorchVerifier(self.verbose, isolated=self.isolate_cuda)),
             ("VapourSynth", VapourSynthVerifier(self.verbose)),
             ("GFPGAN", GFPGANVerifier(self.verbose)),
             ("CodeFormer", CodeFormerVerifier(self.verbose)),
@@ -1008,56 +1706,55 @@ class InstallationVerifier:
             ("Demucs", DemucsVerifier(self.verbose)),
         ]
 
+        # Quick mode stops at the critical path; the AI verifiers import
+        # torch and model packages, which dominate the run time
+        if quick:
+            verifiers = [
+                (name, verifier) for name, verifier in verifiers
+                if name in QUICK_COMPONENTS
+            ]
+
         components = {}
         warnings = []
         errors = []
 
-        print("Checking components...")
-        print("-" * 70)
-
-        for name, verifier in verifiers:
-            print(f"\n{name}:")
+        if not self.quiet:
+            print("Checking components...")
+            if quick:
+                print("(quick mode: AI components skipped - run without --quick to check them)")
+            print("-" * 70)
+
+        cached = load_cached_results() if self.use_cache else {}
+        if cached and not self.quiet:
+            print(f"Using results cached in the last {VERIFY_CACHE_TTL // 60} minutes "
+                  "(--no-cache to re-check)")
+        pending = [(name, verifier) for name, verifier in verifiers if name not in cached]
+        fresh = dict(zip(
+            [name for name, _ in pending],
+            run_all_verifiers([verifier for _, verifier in pending])
+        ))
+
+        for name, _ in verifiers:
+            result = cached[name] if name in cached else fresh[name]
             try:
-                result = verifier.verify()
+                if isinstance(result, Exception):
+                    raise result
                 components[name] = result
 
-                # Print status
-                status_symbol = {
-                    ComponentStatus.AVAILABLE: "[OK]",
-                    ComponentStatus.PARTIAL: "[PARTIAL]",
-                    ComponentStatus.UNAVAILABLE: "[NOT INSTALLED]",
-                    ComponentStatus.ERROR: "[ERROR]"
-                }.get(result.status, "[UNKNOWN]")
-
-                version_str = f" v{result.version}" if result.version else ""
-                print(f"  {status_symbol}{version_str}")
-
-                # Print details
-                if result.details and self.verbose:
-                    for key, value in result.details.items():
-                        if isinstance(value, (list, dict)):
-                            continue
-                        print(f"    {key}: {value}")
-
-                # Print suggestions
-                if result.suggestions:
-                    for suggestion in result.suggestions:
-                        print(f"    💡 {suggestion}")
-                        if result.status == ComponentStatus.UNAVAILABLE:
-                            warnings.append(f"{name}: {suggestion}")
-
-                # Print performance notes
-                if result.performance_notes and self.verbose:
-                    for note in result.performance_notes:
-                        print(f"    ⚡ {note}")
-
-                # Collect errors
-                if result.status == ComponentStatus.ERROR:
+                if not self.quiet:
+                    self._print_result(name, result)
+
+                # Collect warnings and errors
+                if result.status is ComponentStatus.UNAVAILABLE:
+                    warnings.extend(f"{name}: {suggestion}" for suggestion in result.suggestions)
+                elif result.status is ComponentStatus.ERROR:
                     errors.append(f"{name}: {result.error_message}")
 
             except Exception as e:
                 error_msg = f"Verification failed: {str(e)}"
-                print(f"  [ERROR] {error_msg}")
+                if not self.quiet:
+                    print(f"\n{name}:")
+                    print(f"  [ERROR] {error_msg}")
                 errors.append(f"{name}: {error_msg}")
                 components[name] = ComponentResult(
                     name=name,
@@ -1065,20 +1762,25 @@ class InstallationVerifier:
                     error_message=error_msg
                 )
 
-        # Determine feature availability
+        # Only what was checked now; cached entries keep their timestamps
+        if self.use_cache and fresh:
+            save_cached_results({
+                name: result for name, result in fresh.items()
+                if not isinstance(result, Exception)
+            })
+
+        # Determine feature availability from a single pass over the statuses
+        available = _available_names(components)
         feature_availability = {
-            "basic_video_processing": components.get("FFmpeg", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available,
-            "gpu_acceleration": components.get("GPU", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available,
-            "hardware_encoding": components.get("FFmpeg", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available and
-                                 components.get("GPU", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available,
-            "ai_upscaling": components.get("PyTorch", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available or
-                           components.get("GPU", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available,
-            "advanced_deinterlacing": components.get("VapourSynth", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available,
-            "face_restoration": components.get("GFPGAN", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available or
-                               components.get("CodeFormer", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available,
-            "ai_audio_denoising": components.get("DeepFilterNet", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available,
-            "ai_audio_upsampling": components.get("AudioSR", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available,
-            "ai_surround_upmix": components.get("Demucs", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available
+            "basic_video_processing": "FFmpeg" in available,
+            "gpu_acceleration": "GPU" in available,
+            "hardware_encoding": "FFmpeg" in available and "GPU" in available,
+            "ai_upscaling": "PyTorch" in available or "GPU" in available,
+            "advanced_deinterlacing": "VapourSynth" in available,
+            "face_restoration": "GFPGAN" in available or "CodeFormer" in available,
+            "ai_audio_denoising": "DeepFilterNet" in available,
+            "ai_audio_upsampling": "AudioSR" in available,
+            "ai_surround_upmix": "Demucs" in available
         }
 
         # Generate recommendations
@@ -1099,40 +1801,11 @@ class InstallationVerifier:
         features: Dict[str, bool]
     ) -> List[str]:
         """Generate recommendations based on verification results."""
-        recommendations = []
-
-        # Critical components
-        if not components.get("FFmpeg", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available:
-            recommendations.append("CRITICAL: Install FFmpeg - required for all video processing")
-
-        # GPU recommendations
-        gpu = components.get("GPU", None)
-        if gpu and gpu.status == ComponentStatus.UNAVAILABLE:
-            recommendations.append("Consider using a GPU-enabled system for better performance")
-        elif gpu and gpu.status == ComponentStatus.PARTIAL:
-            recommendations.append("NVIDIA GPU recommended for optimal AI processing performance")
-
-        # PyTorch recommendations
-        pytorch = components.get("PyTorch", None)
-        if pytorch and pytorch.status == ComponentStatus.UNAVAILABLE:
-            recommendations.append("Install PyTorch for AI features: pip install torch torchaudio")
-        elif pytorch and pytorch.status == ComponentStatus.PARTIAL:
-            recommendations.append("Install CUDA-enabled PyTorch for GPU acceleration")
-
-        # Feature-specific recommendations
-        if not features.get("advanced_deinterlacing"):
-            recommendations.append("Install VapourSynth for QTGMC deinterlacing (best quality for VHS)")
-
-        if not features.get("face_restoration"):
-            recommendations.append("Install GFPGAN or CodeFormer for face restoration in videos")
-
-        if not features.get("ai_audio_denoising"):
-            recommendations.append("Install DeepFilterNet for superior AI audio denoising")
-
-        if not features.get("ai_surround_upmix"):
-            recommendations.append("Install Demucs for best-quality surround upmix (requires GPU)")
-
-        return recommendations
+        statuses = {name: comp.status for name, comp in components.items()}
+        return [
+            message for condition, message in _RECOMMENDATION_RULES
+            if condition(statuses, features)
+        ]
 
     def print_summary(self, report: VerificationReport):
         """Print verification summary."""
@@ -1144,7 +1817,7 @@ class InstallationVerifier:
         print("\nFeature Availability:")
         for feature, available in report.feature_availability.items():
             status = "[OK]" if available else "[NOT AVAILABLE]"
-            feature_name = feature.replace("_", " ").title()
+            feature_name = _FEATURE_LABELS.get(feature) or feature.replace("_", " ").title()
             print(f"  {status} {feature_name}")
 
         # Recommendations
@@ -1210,18 +1883,13 @@ class InstallationVerifier:
             }
         }
 
+        available = report.available_components()
         for feature_name, deps in features.items():
             # Check if all required components are available
-            required_ok = all(
-                report.components.get(comp, ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available
-                for comp in deps["required"]
-            )
+            required_ok = available.issuperset(deps["required"])
 
             # Check optional components
-            optional_status = [
-                report.components.get(comp, ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available
-                for comp in deps["optional"]
-            ]
+            optional_status = [comp in available for comp in deps["optional"]]
 
             status_symbol = "[OK]" if required_ok else "[NOT AVAILABLE]"
             optional_text = ""
@@ -1248,54 +1916,87 @@ def get_available_features() -> Dict[str, bool]:
     """
     Get available features without verbose output.
 
+    Meant for library callers that keep running afterwards, so the CUDA
+    probe runs in a child process and holds no VRAM in the caller.
+
     Returns:
         Dictionary mapping feature names to availability status
     """
-    verifier = InstallationVerifier(verbose=False)
+    verifier = InstallationVerifier(verbose=False, isolate_cuda=True, quiet=True)
     report = verifier.verify_all()
     return report.feature_availability
 
 
+# Lower-case component name -> verifier class, for check_component()
+_VERIFIERS = {
+    "python": PythonVerifier,
+    "pytorch": PyTorchVerifier,
+    "vapoursynth": VapourSynthVerifier,
+    "gfpgan": GFPGANVerifier,
+    "codeformer": CodeFormerVerifier,
+    "deepfilternet": DeepFilterNetVerifier,
+    "audiosr": AudioSRVerifier,
+    "demucs": DemucsVerifier,
+    "ffmpeg": FFmpegVerifier,
+    "gpu": GPUVerifier
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _check_known_component(key: str) -> ComponentResult:
+    """Verify one registered component, once per process."""
+    return _VERIFIERS[key](verbose=False).verify()
+
+
 def check_component(component_name: str) -> ComponentResult:
     """
     Check a specific component.
 
+    Results are cached for the life of the process, so repeated checks
+    of the same component don't re-run its verifier.
+
     Args:
         component_name: Name of component to check
 
     Returns:
         ComponentResult with verification details
     """
-    verifiers = {
-        "python": PythonVerifier(verbose=False),
-        "pytorch": PyTorchVerifier(verbose=False),
-        "vapoursynth": VapourSynthVerifier(verbose=False),
-        "gfpgan": GFPGANVerifier(verbose=False),
-        "codeformer": CodeFormerVerifier(verbose=False),
-        "deepfilternet": DeepFilterNetVerifier(verbose=False),
-        "audiosr": AudioSRVerifier(verbose=False),
-        "demucs": DemucsVerifier(verbose=False),
-        "ffmpeg": FFmpegVerifier(verbose=False),
-        "gpu": GPUVerifier(verbose=False)
-    }
-
-    verifier = verifiers.get(component_name.lower())
-    if not verifier:
+    key = component_name.lower()
+    if key not in _VERIFIERS:
         return ComponentResult(
             name=component_name,
             status=ComponentStatus.ERROR,
             error_message=f"Unknown component: {component_name}"
         )
 
-    return verifier.verify()
+    return _check_known_component(key)
 
 
 # =============================================================================
 # CLI Interface
 # =============================================================================
 
+def _print_check(result: ComponentResult):
+    """Print the result of ``--check``."""
+    print(f"\n{result.name}: {result.status.value}")
+    if result.version:
+        print(f"Version: {result.version}")
+    if result.error_message:
+        print(f"Error: {result.error_message}")
+    if result.suggestions:
+        print("\nSuggestions:")
+        for suggestion in result.suggestions:
+            print(f"  - {suggestion}")
+
+
 def main():
     """Main CLI entry point."""
+    # `--check <component>` on its own needs none of the other options;
+    # answer it before paying for argparse
+    if len(sys.argv) == 3 and sys.argv[1] == "--check":
+        _print_check(check_component(sys.argv[2]))
+        return
+
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -1312,34 +2013,33 @@ Examples:
     )
 
     parser.add_argument("--quick", action="store_true",
-                       help="Quick check (less verbose)")
+                       help="Quick check of Python, FFmpeg and GPU only (less verbose)")
     parser.add_argument("--report", type=str,
                        help="Save detailed report to JSON file")
+    parser.add_argument("--ndjson", type=str,
+                       help="Append the report as one line to an NDJSON file")
     parser.add_argument("--matrix", action="store_true",
                        help="Show feature compatibility matrix")
     parser.add_argument("--check", type=str,
                        help="Check specific component")
     parser.add_argument("--quiet", action="store_true",
                        help="Minimal output")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Re-check every component instead of reusing recent results")
 
     args = parser.parse_args()
 
     if args.check:
         # Check specific component
-        result = check_component(args.check)
-        print(f"\n{result.name}: {result.status.value}")
-        if result.version:
-            print(f"Version: {result.version}")
-        if result.error_message:
-            print(f"Error: {result.error_message}")
-        if result.suggestions:
-            print("\nSuggestions:")
-            for suggestion in result.suggestions:
-                print(f"  - {suggestion}")
+        _print_check(check_component(args.check))
         return
 
     # Full verification
-    verifier = InstallationVerifier(verbose=not args.quick and not args.quiet)
+    verifier = InstallationVerifier(
+        verbose=not args.quick and not args.quiet,
+        use_cache=not args.no_cache,
+        quiet=args.quiet
+    )
     report = verifier.verify_all(quick=args.quick)
 
     if not args.quiet:
@@ -1353,11 +2053,12 @@ Examples:
         report.to_json(report_path)
         print(f"\nDetailed report saved to: {report_path}")
 
+    if args.ndjson:
+        to_json_batch([report], Path(args.ndjson))
+        print(f"\nReport appended to: {args.ndjson}")
+
     # Exit code
-    critical_ok = (
-        report.components.get("FFmpeg", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available and
-        report.components.get("Python", ComponentResult("", ComponentStatus.UNAVAILABLE)).is_available
-    )
+    critical_ok = report.available_components().issuperset({"FFmpeg", "Python"})
     sys.exit(0 if critical_ok else 1)
 
 
@@ -6,12 +6,13 @@ Comprehensive post-installation verification for Windows systems.
 Tests all components, dependencies, and optional features.
 """
 
+import importlib
 import os
 import sys
 import subprocess
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
@@ -50,6 +51,28 @@ def print_section(msg: str):
     print(f"{Colors.HEADER}{'='*60}{Colors.ENDC}\n")
 
 
+# Modules that failed to import, so a re-check fails the same way
+# without searching sys.path again
+_FAILED_IMPORTS: Dict[str, ImportError] = {}
+
+
+def _cached_import(name: str):
+    """Import a module, reusing sys.modules and remembered failures."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if name in _FAILED_IMPORTS:
+        # A fresh exception each time; re-raising the stored one would
+        # grow its traceback on every re-check
+        stored = _FAILED_IMPORTS[name]
+        raise ImportError(str(stored), name=stored.name) from stored
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        _FAILED_IMPORTS[name] = e
+        raise
+
+
 @dataclass
 class VerificationResult:
     """Stores results of a verification check."""
@@ -123,7 +146,7 @@ class SetupVerifier:
             import_name = package_name
 
         try:
-            module = __import__(import_name)
+            module = _cached_import(import_name)
             version = getattr(module, '__version__', 'unknown')
 
             self.add_result(VerificationResult(
@@ -216,7 +239,7 @@ class SetupVerifier:
     def check_pytorch_cuda(self):
         """Check PyTorch CUDA availability."""
         try:
-            import torch
+            torch = _cached_import("torch")
             cuda_available = torch.cuda.is_available()
 
             if cuda_available:
@@ -253,7 +276,7 @@ class SetupVerifier:
     def check_vapoursynth(self):
         """Check VapourSynth installation."""
         try:
-            import vapoursynth as vs
+            vs = _cached_import("vapoursynth")
             core = vs.core
 
             version = core.version()
@@ -266,7 +289,7 @@ class SetupVerifier:
 
             # Check for HAVSFunc (QTGMC)
             try:
-                import havsfunc
+                _cached_import("havsfunc")
                 self.add_result(VerificationResult(
                     name="HAVSFunc (QTGMC)",
                     status=True,
@@ -378,7 +401,7 @@ class SetupVerifier:
 
         # CodeFormer is special - may not be installed via pip
         try:
-            import codeformer
+            _cached_import("codeformer")
             self.add_result(VerificationResult(
                 name="CodeFormer",
                 status=True,
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """Run all test files individually to avoid pytest capture bug."""
+import importlib.util
+import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Fix Windows console encoding
@@ -9,66 +13,128 @@ if sys.platform == "win32":
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# Each file runs in its own interpreter; skip the bytecode and pytest
+# cache writes that the parallel runs would otherwise race on
+TEST_ENV = {**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+
+PYTEST_ARGS = ["-v", "--tb=short", "-p", "no:cacheprovider"]
+
+# Counts in pytest's final "== 3 passed, 1 failed in 2.01s ==" line
+SUMMARY_RE = re.compile(r"(\d+) (passed|failed|errors?|skipped)")
+
+
+def parse_summary(output):
+    """Return the counts from pytest's summary line, e.g. {"passed": 3}."""
+    counts = {}
+    for line in output.splitlines()[-5:]:
+        if line.startswith("="):
+            for num, outcome in SUMMARY_RE.findall(line):
+                outcome = "error" if outcome.startswith("error") else outcome
+                counts[outcome] = counts.get(outcome, 0) + int(num)
+    return counts
+
+
+def can_run_forked():
+    """Whether pytest-xdist and pytest-forked are available to isolate tests."""
+    # --forked relies on os.fork, which Windows doesn't have
+    return (
+        sys.platform != "win32"
+        and importlib.util.find_spec("xdist") is not None
+        and importlib.util.find_spec("pytest_forked") is not None
+    )
+
+
+def run_one(test_file):
+    """Run one test file in its own pytest process."""
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", str(test_file), *PYTEST_ARGS],
+        capture_output=True,
+        text=True,
+        env=TEST_ENV
+    )
+    return test_file, result
+
+
+def print_tail(output):
+    """Print the last 30 non-blank lines of a pytest run."""
+    lines = output.split("\n")
+    for line in lines[-30:]:
+        if line.strip():
+            print(f"  {line}")
+
+
+def main_forked(test_files):
+    """
+    Run every file in one pytest session, forking a process per test.
+
+    --forked gives each test the isolation the per-file runs were for,
+    while xdist spreads the files across cores (--dist=loadfile keeps a
+    file's tests on one worker). One interpreter start instead of one
+    per file.
+    """
+    print(f"Running {len(test_files)} test files with pytest-xdist --forked...")
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", *map(str, test_files), *PYTEST_ARGS,
+         "-n", "auto", "--dist=loadfile", "--forked"],
+        capture_output=True,
+        text=True,
+        env=TEST_ENV
+    )
+    output = result.stdout + result.stderr
+    counts = parse_summary(output)
+
+    print(f"\n{'='*70}")
+    print(f"SUMMARY: {counts.get('passed', 0)} passed, {counts.get('failed', 0)} failed, "
+          f"{counts.get('error', 0)} errors")
+    print(f"{'='*70}")
+
+    if result.returncode != 0:
+        print("\nFailures:")
+        print_tail(output)
+
+    return 0 if result.returncode == 0 else 1
+
+
 def main():
     test_dir = Path("tests")
     test_files = sorted(test_dir.glob("test_*.py"))
 
+    print(f"Found {len(test_files)} test files\n")
+
+    if can_run_forked():
+        return main_forked(test_files)
+
     passed = 0
     failed = 0
     errors = 0
     failed_files = []
 
-    print(f"Found {len(test_files)} test files\n")
+    # Per-file wall time is mostly interpreter and pytest start-up, so run
+    # the files side by side and report each one as it finishes
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        futures = [pool.submit(run_one, test_file) for test_file in test_files]
+
+        for future in as_completed(futures):
+            test_file, result = future.result()
+            print(f"Running {test_file.name}... ", end="", flush=True)
+
+            output = result.stdout + result.stderr
+            counts = parse_summary(output)
+
+            if counts.get("passed"):
+                passed += counts["passed"]
+                print(f"✓ {counts['passed']} passed", end=" " if counts.get("failed") else "\n")
 
-    for test_file in test_files:
-        print(f"Running {test_file.name}... ", end="", flush=True)
-
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", str(test_file), "-v", "--tb=short"],
-            capture_output=True,
-            text=True
-        )
-
-        # Parse results
-        output = result.stdout + result.stderr
-
-        if "passed" in output:
-            # Extract number of passed tests
-            for line in output.split("\n"):
-                if "passed" in line:
-                    try:
-                        # Extract numbers from summary line
-                        parts = line.split()
-                        for i, part in enumerate(parts):
-                            if "passed" in part and i > 0:
-                                num = int(parts[i-1])
-                                passed += num
-                                print(f"✓ {num} passed")
-                                break
-                    except:
-                        print("✓ passed")
-                    break
-
-        if "failed" in output or result.returncode != 0:
-            failed_files.append((test_file.name, output))
-            # Extract number of failed tests
-            for line in output.split("\n"):
-                if "failed" in line:
-                    try:
-                        parts = line.split()
-                        for i, part in enumerate(parts):
-                            if "failed" in part and i > 0:
-                                num = int(parts[i-1])
-                                failed += num
-                                print(f"✗ {num} failed")
-                                break
-                    except:
-                        print("✗ failed")
-                    break
-            else:
-                if result.returncode != 0:
-                    print(f"✗ ERROR (code {result.returncode})")
-                    errors += 1
+            if counts.get("failed"):
+                failed += counts["failed"]
+                failed_files.append((test_file.name, output))
+                print(f"✗ {counts['failed']} failed")
+            elif result.returncode != 0:
+                errors += 1
+                failed_files.append((test_file.name, output))
+                print(f"✗ ERROR (code {result.returncode})")
+            elif not counts.get("passed"):
+                print("no tests ran")
 
     print(f"\n{'='*70}")
     print(f"SUMMARY: {passed} passed, {failed} failed, {errors} errors")
@@ -76,13 +142,9 @@ def main():
 
     if failed_files:
         print(f"\nFailed files ({len(failed_files)}):")
-        for filename, output in failed_files:
+        for filename, output in sorted(failed_files):
             print(f"\n{filename}:")
-            # Print last 30 lines of output
-            lines = output.split("\n")
-            for line in lines[-30:]:
-                if line.strip():
-                    print(f"  {line}")
+            print_tail(output)
 
     return 0 if failed == 0 and errors == 0 else 1
 
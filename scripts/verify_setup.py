@@ -5,6 +5,7 @@ TerminalAI Setup Verification
 Checks all dependencies and system capabilities.
 """
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -38,14 +39,18 @@ def check_package():
 
 def check_ffmpeg():
     """Check FFmpeg installation."""
+    # The Windows installer passes the version line it already probed
+    version_line = os.environ.get("TERMINALAI_FFMPEG_VERSION")
     try:
-        result = subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        version = result.stdout.split("\n")[0].split("version")[1].split()[0]
+        if not version_line:
+            result = subprocess.run(
+                ["ffmpeg", "-version"],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            version_line = result.stdout.split("\n")[0]
+        version = version_line.split("version")[1].split()[0]
         print(f"[OK] FFmpeg {version}")
         return True
     except (subprocess.CalledProcessError, FileNotFoundError):
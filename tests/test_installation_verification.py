@@ -32,7 +32,9 @@ from verify_installation import (
     GPUVerifier,
     InstallationVerifier,
     get_available_features,
-    check_component
+    check_component,
+    run_all_verifiers,
+    to_json_batch
 )
 
 
@@ -69,6 +71,52 @@ class TestComponentResult(unittest.TestCase):
         self.assertEqual(len(result.performance_notes), 1)
         self.assertTrue(result.is_partial)
 
+    def test_repeated_suggestions_share_one_string(self):
+        """Test identical suggestion texts are pooled across results."""
+        text = "".join(["Install ", "missing dependency"])
+        first = ComponentResult("A", ComponentStatus.PARTIAL, suggestions=[text])
+        second = ComponentResult(
+            "B", ComponentStatus.PARTIAL,
+            suggestions=["".join(["Install ", "missing dependency"])]
+        )
+
+        self.assertEqual(first.suggestions, (text,))
+        self.assertIs(first.suggestions[0], second.suggestions[0])
+
+    def test_default_fields_are_empty(self):
+        """Test results without details get their own empty dict."""
+        import copy
+        import pickle
+
+        first = ComponentResult(name="A", status=ComponentStatus.AVAILABLE)
+        second = ComponentResult(name="B", status=ComponentStatus.AVAILABLE)
+
+        self.assertEqual(first.details, {})
+        self.assertIsNot(first.details, second.details)
+        self.assertEqual(first.suggestions, ())
+        self.assertEqual(first.performance_notes, ())
+        self.assertEqual(pickle.loads(pickle.dumps(first)), first)
+        self.assertEqual(copy.deepcopy(first), first)
+
+    def test_result_pickles_and_copies(self):
+        """Test results survive pickle, deepcopy and dataclasses.asdict."""
+        import copy
+        import dataclasses
+        import pickle
+
+        result = ComponentResult(
+            "FFmpeg", ComponentStatus.PARTIAL, version="6.0",
+            details={"available_encoders": {"libx264": "x264"}},
+            suggestions=["Update NVIDIA drivers for NVENC support"]
+        )
+
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+        self.assertEqual(copy.deepcopy(result), result)
+        self.assertEqual(
+            dataclasses.asdict(result)["details"],
+            {"available_encoders": {"libx264": "x264"}}
+        )
+
     def test_unavailable_result(self):
         """Test unavailable component result."""
         result = ComponentResult(
@@ -99,17 +147,14 @@ class TestPythonVerifier(unittest.TestCase):
 class TestFFmpegVerifier(unittest.TestCase):
     """Test FFmpeg verification."""
 
+    @patch('verify_installation._find_executable', return_value="ffmpeg")
     @patch('subprocess.run')
-    def test_ffmpeg_available(self, mock_run):
+    def test_ffmpeg_available(self, mock_run, mock_which):
         """Test FFmpeg when available."""
-        # Mock FFmpeg version output
-        mock_version = Mock()
-        mock_version.stdout = "ffmpeg version 6.0 Copyright (c) 2000-2023"
-        mock_version.returncode = 0
-
-        # Mock encoders output
+        # Mock encoders output, with the version banner on stderr
         mock_encoders = Mock()
-        mock_encoders.stdout = """
+        mock_encoders.stderr = b"ffmpeg version 6.0 Copyright (c) 2000-2023\n  built with gcc"
+        mock_encoders.stdout = b"""
         V..... h264_nvenc           NVIDIA NVENC H.264 encoder
         V..... hevc_nvenc           NVIDIA NVENC hevc encoder
         V..... libx264              libx264 H.264
@@ -119,14 +164,14 @@ class TestFFmpegVerifier(unittest.TestCase):
 
         # Mock filters output
         mock_filters = Mock()
-        mock_filters.stdout = """
+        mock_filters.stdout = b"""
         ... yadif               Deinterlace
         ... hqdn3d              Denoise
         ... scale_cuda          CUDA scale
         """
         mock_filters.returncode = 0
 
-        mock_run.side_effect = [mock_version, mock_encoders, mock_filters]
+        mock_run.side_effect = [mock_encoders, mock_filters]
 
         verifier = FFmpegVerifier(verbose=False)
         result = verifier.verify()
@@ -136,17 +181,91 @@ class TestFFmpegVerifier(unittest.TestCase):
         self.assertIsNotNone(result.version)
         self.assertIn("available_encoders", result.details)
         self.assertIn("h264_nvenc", result.details["available_encoders"])
+        self.assertEqual(result.version, "6.0")
+        self.assertIn("av1_nvenc", result.details["missing_encoders"])
+        self.assertIn("scale_cuda", result.details["available_filters"])
+        self.assertNotIn("scale_npp", result.details["available_filters"])
 
+    @patch('verify_installation._find_executable', return_value=None)
     @patch('subprocess.run')
-    def test_ffmpeg_missing(self, mock_run):
+    def test_ffmpeg_missing(self, mock_run, mock_which):
         """Test FFmpeg when not installed."""
-        mock_run.side_effect = FileNotFoundError()
-
         verifier = FFmpegVerifier(verbose=False)
         result = verifier.verify()
 
         self.assertEqual(result.status, ComponentStatus.UNAVAILABLE)
         self.assertGreater(len(result.suggestions), 0)
+        mock_run.assert_not_called()
+
+    @patch('verify_installation._find_executable', return_value="ffmpeg")
+    @patch('subprocess.run')
+    def test_ffmpeg_hung(self, mock_run, mock_which):
+        """Test a hung FFmpeg times out instead of blocking verification."""
+        import subprocess
+        mock_run.side_effect = subprocess.TimeoutExpired(["ffmpeg", "-encoders"], 10)
+
+        result = FFmpegVerifier(verbose=False).verify()
+
+        self.assertEqual(result.status, ComponentStatus.UNAVAILABLE)
+        self.assertEqual(mock_run.call_args.kwargs["timeout"], 10)
+
+    @patch('verify_installation._find_executable', return_value="ffmpeg")
+    @patch('subprocess.run')
+    def test_ffmpeg_filters_hung(self, mock_run, mock_which):
+        """Test a hung filter listing keeps the encoder results as PARTIAL."""
+        import subprocess
+        mock_encoders = Mock()
+        mock_encoders.stderr = b"ffmpeg version 6.0 Copyright (c) 2000-2023"
+        mock_encoders.stdout = b" V..... h264_nvenc           NVIDIA NVENC H.264 encoder\n"
+        mock_run.side_effect = [
+            mock_encoders,
+            subprocess.TimeoutExpired(["ffmpeg", "-filters"], 10),
+        ]
+
+        result = FFmpegVerifier(verbose=False).verify()
+
+        self.assertEqual(result.status, ComponentStatus.PARTIAL)
+        self.assertEqual(result.version, "6.0")
+        self.assertEqual(result.details["available_filters"], {})
+        self.assertTrue(any("timed out" in s for s in result.suggestions))
+
+
+class TestModelDiscovery(unittest.TestCase):
+    """Test model checkpoint discovery."""
+
+    def test_glob_reused_until_directory_changes(self):
+        """Test the model glob is cached per directory mtime."""
+        import os
+        import tempfile
+        from verify_installation import _glob_pth
+
+        model_dir = Path(tempfile.mkdtemp())
+        (model_dir / "GFPGANv1.4.pth").touch()
+        mtime_ns = model_dir.stat().st_mtime_ns
+
+        first = _glob_pth(str(model_dir), mtime_ns)
+        self.assertEqual(first, ("GFPGANv1.4.pth",))
+        self.assertIs(_glob_pth(str(model_dir), mtime_ns), first)
+
+        (model_dir / "codeformer.pth").touch()
+        os.utime(model_dir, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+        updated = _glob_pth(str(model_dir), model_dir.stat().st_mtime_ns)
+        self.assertEqual(sorted(updated), ["GFPGANv1.4.pth", "codeformer.pth"])
+
+
+class TestDeepFilterNetVerifier(unittest.TestCase):
+    """Test DeepFilterNet verification."""
+
+    def test_model_not_loaded(self):
+        """Test verification doesn't initialize (or download) the model."""
+        fake_module = MagicMock()
+        with patch('verify_installation._import_optional', return_value=fake_module), \
+                patch('verify_installation._has_cuda_noinit', return_value=False):
+            result = DeepFilterNetVerifier(verbose=False).verify()
+
+        self.assertEqual(result.status, ComponentStatus.AVAILABLE)
+        self.assertFalse(result.details["model_loaded"])
+        fake_module.init_df.assert_not_called()
 
 
 class TestPyTorchVerifier(unittest.TestCase):
@@ -155,6 +274,8 @@ class TestPyTorchVerifier(unittest.TestCase):
     @patch('verify_installation.ComponentVerifier.verify')
     def test_pytorch_not_installed(self, mock_verify):
         """Test PyTorch when not installed."""
+        from verify_installation import _FAILED_IMPORTS
+        self.addCleanup(_FAILED_IMPORTS.pop, "torch", None)
         verifier = PyTorchVerifier(verbose=False)
 
         # Mock import error
@@ -175,6 +296,81 @@ class TestPyTorchVerifier(unittest.TestCase):
         self.assertEqual(result.name, "PyTorch")
         self.assertIsInstance(result.status, ComponentStatus)
 
+    def test_failed_import_remembered(self):
+        """Test a missing optional module is only searched for once."""
+        from verify_installation import _import_optional, _FAILED_IMPORTS
+        self.addCleanup(_FAILED_IMPORTS.pop, "terminalai_missing_module", None)
+
+        with patch('importlib.import_module', side_effect=ImportError("missing")) as mock_import:
+            for _ in range(2):
+                with self.assertRaises(ImportError):
+                    _import_optional("terminalai_missing_module")
+
+        mock_import.assert_called_once_with("terminalai_missing_module")
+
+    def test_isolated_probe_runs_in_child(self):
+        """Test an isolated verification returns the child's result."""
+        from verify_installation import _verify_isolated
+
+        result = _verify_isolated(PythonVerifier, timeout=60)
+
+        self.assertEqual(result.name, "Python")
+        self.assertIsInstance(result.status, ComponentStatus)
+        self.assertIn("platform", result.details)
+
+    def test_cuda_availability_queried_once(self):
+        """Test the CUDA probe is shared by all verifiers."""
+        from verify_installation import _cuda_available
+
+        fake_torch = MagicMock()
+        fake_torch.cuda.is_available.return_value = False
+        _cuda_available.cache_clear()
+        try:
+            with patch.dict('sys.modules', {'torch': fake_torch}):
+                self.assertFalse(_cuda_available())
+                self.assertFalse(_cuda_available())
+        finally:
+            _cuda_available.cache_clear()
+
+        fake_torch.cuda.is_available.assert_called_once()
+
+    def test_cuda_probe_without_cuda_build(self):
+        """Test CPU-only torch builds skip the device query entirely."""
+        from verify_installation import _has_cuda_noinit
+
+        fake_torch = MagicMock()
+        fake_torch.version.cuda = None
+        _has_cuda_noinit.cache_clear()
+        try:
+            with patch.dict('sys.modules', {'torch': fake_torch}):
+                self.assertFalse(_has_cuda_noinit())
+        finally:
+            _has_cuda_noinit.cache_clear()
+
+        fake_torch.cuda.device_count.assert_not_called()
+        fake_torch.cuda.is_available.assert_not_called()
+
+    def test_device_queries_cached(self):
+        """Test device count and properties are looked up once per device."""
+        from verify_installation import _device_count, _device_properties
+
+        fake_torch = MagicMock()
+        fake_torch.cuda.device_count.return_value = 2
+        _device_count.cache_clear()
+        _device_properties.cache_clear()
+        try:
+            with patch.dict('sys.modules', {'torch': fake_torch}):
+                for _ in range(3):
+                    self.assertEqual(_device_count(), 2)
+                    for i in range(_device_count()):
+                        _device_properties(i)
+        finally:
+            _device_count.cache_clear()
+            _device_properties.cache_clear()
+
+        fake_torch.cuda.device_count.assert_called_once()
+        self.assertEqual(fake_torch.cuda.get_device_properties.call_count, 2)
+
 
 class TestVapourSynthVerifier(unittest.TestCase):
     """Test VapourSynth verification."""
@@ -195,8 +391,17 @@ class TestVapourSynthVerifier(unittest.TestCase):
 class TestGPUVerifier(unittest.TestCase):
     """Test GPU detection."""
 
+    def setUp(self):
+        # Probes are cached per process; start each test from a clean slate
+        from verify_installation import _detect_nvidia, _windows_adapter_names
+        for probe in (_detect_nvidia, _windows_adapter_names):
+            probe.cache_clear()
+            self.addCleanup(probe.cache_clear)
+
+    @patch('verify_installation._nvml_gpus', return_value=None)
+    @patch('verify_installation._find_executable', return_value="nvidia-smi")
     @patch('subprocess.run')
-    def test_nvidia_gpu_detected(self, mock_run):
+    def test_nvidia_gpu_detected(self, mock_run, mock_which, mock_nvml):
         """Test NVIDIA GPU detection."""
         mock_result = Mock()
         mock_result.stdout = "NVIDIA GeForce RTX 3080, 10240 MiB, 535.98"
@@ -215,6 +420,32 @@ class TestGPUVerifier(unittest.TestCase):
         self.assertEqual(result.details["nvidia_gpus"][0]["memory"], "10240 MiB")
         self.assertEqual(result.details["nvidia_gpus"][0]["driver_version"], "535.98")
 
+        # A second verification reuses the probe instead of re-running nvidia-smi
+        GPUVerifier(verbose=False).verify()
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch('subprocess.run')
+    def test_nvidia_gpu_detected_through_nvml(self, mock_run):
+        """Test NVML answers without running nvidia-smi."""
+        fake_nvml = MagicMock()
+        fake_nvml.NVMLError = type("NVMLError", (Exception,), {})
+        fake_nvml.nvmlSystemGetDriverVersion.return_value = b"535.98"
+        fake_nvml.nvmlDeviceGetCount.return_value = 1
+        fake_nvml.nvmlDeviceGetName.return_value = "NVIDIA GeForce RTX 3080"
+        fake_nvml.nvmlDeviceGetMemoryInfo.return_value.total = 10240 * 1024 * 1024
+
+        with patch('verify_installation._import_optional', return_value=fake_nvml):
+            result = GPUVerifier(verbose=False).verify()
+
+        self.assertEqual(result.status, ComponentStatus.AVAILABLE)
+        self.assertEqual(result.details["nvidia_gpus"], [{
+            "name": "NVIDIA GeForce RTX 3080",
+            "memory": "10240 MiB",
+            "driver_version": "535.98"
+        }])
+        fake_nvml.nvmlShutdown.assert_called_once()
+        mock_run.assert_not_called()
+
     @patch('subprocess.run')
     def test_no_gpu(self, mock_run):
         """Test when no GPU is detected."""
@@ -227,6 +458,61 @@ class TestGPUVerifier(unittest.TestCase):
         # Should be unavailable or partial
         self.assertIn(result.status, [ComponentStatus.UNAVAILABLE, ComponentStatus.PARTIAL])
 
+    @patch('verify_installation._find_executable', side_effect=lambda name: name)
+    @patch('subprocess.run')
+    def test_windows_adapters_listed_once(self, mock_run, mock_which):
+        """Test AMD and Intel detection share one adapter query."""
+        def fake_run(cmd, **kwargs):
+            if cmd[0] == "nvidia-smi":
+                raise FileNotFoundError()
+            return Mock(stdout=b"AMD Radeon RX 6800\nIntel(R) UHD Graphics 770\n", returncode=0)
+
+        mock_run.side_effect = fake_run
+
+        with patch.object(sys, "platform", "win32"):
+            result = GPUVerifier(verbose=False).verify()
+
+        self.assertEqual(result.status, ComponentStatus.PARTIAL)
+        self.assertTrue(result.details["amd_gpu_detected"])
+        self.assertTrue(result.details["intel_gpu_detected"])
+        adapter_calls = [c for c in mock_run.call_args_list if c.args[0][0] != "nvidia-smi"]
+        self.assertEqual(len(adapter_calls), 1)
+
+
+class TestGPUMonitor(unittest.TestCase):
+    """Test repeated GPU sampling."""
+
+    @patch('verify_installation._find_executable', return_value="nvidia-smi")
+    @patch('subprocess.Popen')
+    def test_monitor_reads_one_process(self, mock_popen, mock_which):
+        """Test samples stream from a single nvidia-smi process."""
+        from verify_installation import GPUMonitor
+        mock_popen.return_value.stdout.__iter__.return_value = iter([
+            "NVIDIA GeForce RTX 3080, 10240 MiB, 535.98\n",
+            "\n",
+            "NVIDIA GeForce RTX 3080, 10240 MiB, 535.98\n",
+        ])
+
+        with GPUMonitor(interval_ms=250) as monitor:
+            samples = list(monitor)
+
+        mock_popen.assert_called_once()
+        self.assertIn("250", mock_popen.call_args.args[0])
+        self.assertEqual(len(samples), 2)
+        self.assertEqual(samples[0]["memory"], "10240 MiB")
+        mock_popen.return_value.terminate.assert_called_once()
+
+    @patch('verify_installation._find_executable', return_value=None)
+    @patch('subprocess.Popen')
+    def test_monitor_without_nvidia_smi(self, mock_popen, mock_which):
+        """Test the monitor yields nothing when nvidia-smi is missing."""
+        from verify_installation import GPUMonitor
+
+        with GPUMonitor() as monitor:
+            self.assertEqual(list(monitor), [])
+
+        mock_popen.assert_not_called()
+
 
 class TestVerificationReport(unittest.TestCase):
     """Test verification report generation."""
@@ -288,6 +574,32 @@ class TestVerificationReport(unittest.TestCase):
         self.assertIn("system_info", report_dict)
         self.assertIn("components", report_dict)
         self.assertIn("feature_availability", report_dict)
+        self.assertEqual(report_dict["components"]["Test"], {
+            "name": "Test",
+            "status": "available",
+            "version": None,
+            "details": {},
+            "error_message": None,
+            "suggestions": (),
+            "performance_notes": ()
+        })
+
+    def test_available_components(self):
+        """Test only AVAILABLE components are reported as available."""
+        report = VerificationReport(
+            system_info={},
+            components={
+                "FFmpeg": ComponentResult("FFmpeg", ComponentStatus.AVAILABLE),
+                "GPU": ComponentResult("GPU", ComponentStatus.PARTIAL),
+                "Demucs": ComponentResult("Demucs", ComponentStatus.UNAVAILABLE),
+            },
+            feature_availability={},
+            warnings=[],
+            errors=[],
+            recommendations=[]
+        )
+
+        self.assertEqual(report.available_components(), {"FFmpeg"})
 
     def test_report_to_json(self, tmp_path=None):
         """Test saving report as JSON."""
@@ -318,6 +630,66 @@ class TestVerificationReport(unittest.TestCase):
             data = json.load(f)
             self.assertIn("system_info", data)
 
+    def test_report_to_json_without_orjson(self):
+        """Test the stdlib fallback writes the same report."""
+        import tempfile
+
+        report = VerificationReport(
+            system_info={"platform": "test"},
+            components={
+                "Test": ComponentResult(
+                    name="Test",
+                    status=ComponentStatus.PARTIAL,
+                    details={"key": "value"},
+                    suggestions=["Install missing dependency"]
+                )
+            },
+            feature_availability={"gpu_acceleration": False},
+            warnings=[],
+            errors=[],
+            recommendations=[]
+        )
+
+        expected = json.loads(json.dumps(report.to_dict()))
+
+        tmp_dir = Path(tempfile.mkdtemp())
+        json_file = tmp_dir / "fallback_report.json"
+        with patch("verify_installation._get_json_encoder", return_value=None):
+            report.to_json(json_file)
+
+        with open(json_file) as f:
+            self.assertEqual(json.load(f), expected)
+
+        # orjson (when installed) encodes the dataclasses directly
+        report.to_json(tmp_dir / "report.json")
+        with open(tmp_dir / "report.json") as f:
+            self.assertEqual(json.load(f), expected)
+
+    def test_reports_appended_as_ndjson(self):
+        """Test each report becomes one compact JSON line."""
+        import tempfile
+
+        reports = [
+            VerificationReport(
+                system_info={"platform": name},
+                components={"Test": ComponentResult("Test", ComponentStatus.AVAILABLE)},
+                feature_availability={},
+                warnings=[],
+                errors=[],
+                recommendations=[]
+            )
+            for name in ("linux", "windows")
+        ]
+
+        ndjson_file = Path(tempfile.mkdtemp()) / "reports.ndjson"
+        to_json_batch(reports[:1], ndjson_file)
+        to_json_batch(reports[1:], ndjson_file)
+
+        lines = ndjson_file.read_text().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[1])["system_info"]["platform"], "windows")
+        self.assertEqual(json.loads(lines[0])["components"]["Test"]["status"], "available")
+
 
 class TestInstallationVerifier(unittest.TestCase):
     """Test main installation verifier."""
@@ -381,6 +753,40 @@ class TestFeatureDetectionAPI(unittest.TestCase):
         self.assertEqual(result.name, "Python")
         self.assertIsInstance(result.status, ComponentStatus)
 
+    def test_check_component_cached(self):
+        """Test repeated checks reuse the first result."""
+        self.assertIs(check_component("Python"), check_component("python"))
+
+    def test_check_component_skips_heavy_imports(self):
+        """Test checking FFmpeg never imports the AI packages."""
+        import subprocess
+        script = (
+            "import sys; import verify_installation as v; v.check_component('ffmpeg'); "
+            "print(sorted({'torch', 'vapoursynth', 'demucs', 'df', 'audiosr', 'gfpgan'} "
+            "& set(sys.modules)))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=Path(__file__).parent.parent / "scripts" / "installation",
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+
+        self.assertEqual(output.strip(), "[]")
+
+    @patch('argparse.ArgumentParser')
+    def test_check_cli_skips_argparse(self, mock_parser):
+        """Test `--check <component>` is answered without building the parser."""
+        from verify_installation import main
+
+        with patch.object(sys, 'argv', ["verify_installation.py", "--check", "python"]), \
+                patch('builtins.print') as mock_print:
+            main()
+
+        mock_parser.assert_not_called()
+        self.assertTrue(any("Python" in str(call) for call in mock_print.call_args_list))
+
     def test_check_component_invalid(self):
         """Test checking invalid component."""
         result = check_component("nonexistent_component")
@@ -403,6 +809,28 @@ class TestIntegration(unittest.TestCase):
         except Exception as e:
             self.fail(f"Full verification should not raise exception: {e}")
 
+    def test_quick_verification_skips_ai_components(self):
+        """Test quick mode only checks the critical-path components."""
+        verifier = InstallationVerifier(verbose=False)
+
+        with patch('verify_installation.PyTorchVerifier.verify') as mock_torch:
+            report = verifier.verify_all(quick=True)
+
+        mock_torch.assert_not_called()
+        self.assertEqual(set(report.components), {"Python", "FFmpeg", "GPU"})
+        self.assertFalse(report.feature_availability["ai_surround_upmix"])
+        self.assertFalse(any("Demucs" in rec for rec in report.recommendations))
+
+    def test_quiet_verification_prints_nothing(self):
+        """Test quiet mode builds the report without any output."""
+        verifier = InstallationVerifier(verbose=False, quiet=True)
+
+        with patch('builtins.print') as mock_print:
+            report = verifier.verify_all(quick=True)
+
+        mock_print.assert_not_called()
+        self.assertEqual(set(report.components), {"Python", "FFmpeg", "GPU"})
+
     def test_component_verifiers_complete(self):
         """Test that all verifiers complete successfully."""
         verifiers = [
@@ -420,6 +848,103 @@ class TestIntegration(unittest.TestCase):
             except Exception as e:
                 self.fail(f"{name} verifier should not raise exception: {e}")
 
+    def test_run_all_verifiers_keeps_order(self):
+        """Test concurrent verifiers return results in input order."""
+        failing = Mock()
+        failing.verify.side_effect = RuntimeError("boom")
+        verifiers = [PythonVerifier(verbose=False), failing, PythonVerifier(verbose=False)]
+
+        results = run_all_verifiers(verifiers)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].name, "Python")
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual(results[2].name, "Python")
+
+
+class TestResultCache(unittest.TestCase):
+    """Test the on-disk cache of verification results."""
+
+    def setUp(self):
+        import tempfile
+        cache_file = Path(tempfile.mkdtemp()) / "verify.json"
+        patcher = patch('verify_installation._cache_file', return_value=cache_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_results_roundtrip(self):
+        """Test saved AVAILABLE results load back while fresh."""
+        from verify_installation import load_cached_results, save_cached_results
+
+        save_cached_results({
+            "FFmpeg": ComponentResult(
+                "FFmpeg", ComponentStatus.AVAILABLE, version="6.0",
+                details={"available_encoders": {"libx264": "x264"}},
+                suggestions=["Update NVIDIA drivers for NVENC support"]
+            ),
+            "PyTorch": ComponentResult("PyTorch", ComponentStatus.PARTIAL),
+            "AudioSR": ComponentResult("AudioSR", ComponentStatus.UNAVAILABLE),
+            "Demucs": ComponentResult("Demucs", ComponentStatus.ERROR, error_message="boom")
+        })
+        cached = load_cached_results()
+
+        # Missing or partial components are re-checked on the next run
+        self.assertEqual(list(cached), ["FFmpeg"])
+        self.assertIs(cached["FFmpeg"].status, ComponentStatus.AVAILABLE)
+        self.assertEqual(cached["FFmpeg"].details["available_encoders"], {"libx264": "x264"})
+        self.assertEqual(cached["FFmpeg"].suggestions, ("Update NVIDIA drivers for NVENC support",))
+
+    def test_stale_or_forced_cache_ignored(self):
+        """Test expired results and TERMINALAI_VERIFY_FORCE bypass the cache."""
+        import verify_installation
+        from verify_installation import load_cached_results, save_cached_results
+
+        save_cached_results({"Python": ComponentResult("Python", ComponentStatus.AVAILABLE)})
+        with patch.dict('os.environ', {"TERMINALAI_VERIFY_FORCE": "1"}):
+            self.assertEqual(load_cached_results(), {})
+        with patch.object(verify_installation, "VERIFY_CACHE_TTL", -1):
+            self.assertEqual(load_cached_results(), {})
+        self.assertIn("Python", load_cached_results())
+
+    def test_reused_results_keep_their_timestamp(self):
+        """Test saving other components doesn't extend a cached result's TTL."""
+        import verify_installation
+        from verify_installation import load_cached_results, save_cached_results
+
+        with patch('time.time', return_value=1000.0):
+            save_cached_results({"Python": ComponentResult("Python", ComponentStatus.AVAILABLE)})
+        with patch('time.time', return_value=1000.0 + verify_installation.VERIFY_CACHE_TTL - 1):
+            save_cached_results({"GPU": ComponentResult("GPU", ComponentStatus.AVAILABLE)})
+            self.assertEqual(set(load_cached_results()), {"Python", "GPU"})
+        with patch('time.time', return_value=1000.0 + verify_installation.VERIFY_CACHE_TTL + 1):
+            self.assertEqual(set(load_cached_results()), {"GPU"})
+
+    def test_path_change_invalidates_cache(self):
+        """Test results saved under another PATH are re-checked."""
+        import os
+        from verify_installation import load_cached_results, save_cached_results
+
+        save_cached_results({"Python": ComponentResult("Python", ComponentStatus.AVAILABLE)})
+        path = os.environ.get("PATH", "") + os.pathsep + "/opt/cuda/bin"
+        with patch.dict('os.environ', {"PATH": path}):
+            self.assertEqual(load_cached_results(), {})
+
+    def test_package_install_invalidates_cache(self):
+        """Test installing into site-packages re-checks cached results."""
+        import os
+        import tempfile
+        from verify_installation import load_cached_results, save_cached_results
+
+        site_dir = Path(tempfile.mkdtemp()) / "site-packages"
+        site_dir.mkdir()
+        os.utime(site_dir, ns=(0, 0))
+        with patch.object(sys, 'path', sys.path + [str(site_dir)]):
+            save_cached_results({"Demucs": ComponentResult("Demucs", ComponentStatus.AVAILABLE)})
+            self.assertIn("Demucs", load_cached_results())
+
+            (site_dir / "demucs").mkdir()
+            self.assertEqual(load_cached_results(), {})
+
 
 class TestErrorHandling(unittest.TestCase):
     """Test error handling in verification."""
@@ -4,6 +4,7 @@ Tests for scripts/installation/install.py
 Focuses on the basicsr torchvision compatibility patch.
 """
 
+import json
 import sys
 import tempfile
 from pathlib import Path
@@ -18,6 +19,15 @@ sys.path.insert(0, str(scripts_path))
 from install import TerminalAIInstaller
 
 
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """Keep pip caches and install sentinels out of the real home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    return tmp_path
+
+
 class TestBasicsrPatch:
     """Test the basicsr torchvision compatibility patch."""
 
@@ -203,6 +213,398 @@ from torchvision.transforms import functional as F
                 assert "Fix for torchvision >= 0.17" in content
 
 
+class TestToolProbes:
+    """Test executable probes used by the installer checks."""
+
+    def test_basic_gpu_check_skips_nvidia_smi(self, tmp_path):
+        """Basic installs only need to know nvidia-smi exists."""
+        nvidia_smi = tmp_path / "nvidia-smi"
+        nvidia_smi.write_text("#!/bin/sh\n")
+        nvidia_smi.chmod(0o755)
+
+        installer = TerminalAIInstaller(install_type="basic")
+        with patch('shutil.which', return_value=str(nvidia_smi)), \
+             patch('subprocess.run') as mock_run:
+            assert installer.check_nvidia_gpu() is True
+            mock_run.assert_not_called()
+
+    def test_full_gpu_check_queries_details(self, tmp_path):
+        """Full installs still query GPU name and driver version."""
+        nvidia_smi = tmp_path / "nvidia-smi"
+        nvidia_smi.write_text("#!/bin/sh\n")
+        nvidia_smi.chmod(0o755)
+
+        installer = TerminalAIInstaller(install_type="full")
+        mock_result = MagicMock()
+        mock_result.stdout = "NVIDIA GeForce RTX 4090, 551.23\n"
+        with patch('shutil.which', return_value=str(nvidia_smi)), \
+             patch('subprocess.run', return_value=mock_result) as mock_run:
+            assert installer.check_nvidia_gpu() is True
+            mock_run.assert_called_once()
+
+    def test_cuda_index_tag_shares_gpu_query(self, tmp_path):
+        """GPU check and PyTorch index selection share one nvidia-smi run."""
+        nvidia_smi = tmp_path / "nvidia-smi"
+        nvidia_smi.write_text("#!/bin/sh\n")
+        nvidia_smi.chmod(0o755)
+
+        installer = TerminalAIInstaller(install_type="full")
+        mock_result = MagicMock()
+        mock_result.stdout = "NVIDIA GeForce RTX 5090, 572.16\n"
+        with patch('shutil.which', return_value=str(nvidia_smi)), \
+             patch('subprocess.run', return_value=mock_result) as mock_run:
+            assert installer.check_nvidia_gpu() is True
+            assert installer._query_gpu_info() == ("NVIDIA GeForce RTX 5090", "572.16")
+            assert installer.cuda_index_tag == "nightly/cu128"
+            mock_run.assert_called_once()
+
+    def test_multi_gpu_output_uses_first_gpu(self):
+        """Only the first GPU line of nvidia-smi output is parsed."""
+        installer = TerminalAIInstaller(install_type="full")
+        mock_result = MagicMock()
+        mock_result.stdout = "NVIDIA GeForce RTX 4090, 551.23\nNVIDIA GeForce RTX 3060, 551.23\n"
+        with patch('subprocess.run', return_value=mock_result):
+            assert installer._nvidia_details() == ["NVIDIA GeForce RTX 4090", "551.23"]
+
+    def test_check_pip_runs_in_process(self):
+        """pip availability is checked without spawning an interpreter."""
+        installer = TerminalAIInstaller()
+        with patch('subprocess.run') as mock_run:
+            assert installer.check_pip() is True
+            mock_run.assert_not_called()
+
+    def test_which_is_cached(self):
+        """PATH lookups are resolved once per tool."""
+        installer = TerminalAIInstaller()
+        with patch('shutil.which', return_value="/usr/bin/ffmpeg") as mock_which:
+            installer._which("ffmpeg")
+            installer._which("ffmpeg")
+            mock_which.assert_called_once_with("ffmpeg")
+
+
+class TestBatchedPipInstall:
+    """Test batching of optional pip installs."""
+
+    def test_flush_runs_single_pip_call(self):
+        """Queued packages are installed with one pip invocation."""
+        installer = TerminalAIInstaller(install_type="full")
+        installer._installed_versions = {}
+        installer._queue_pip("demucs", ["demucs>=4.0.0"], "demucs failed")
+        installer._queue_pip("GFPGAN", ["gfpgan", "facexlib"], "gfpgan failed")
+        installer._queue_pip("Real-ESRGAN", ["facexlib", "realesrgan"], "realesrgan failed")
+
+        with patch('subprocess.run') as mock_run:
+            installer._flush_pip()
+
+            mock_run.assert_called_once()
+            cmd = mock_run.call_args[0][0]
+            assert cmd.count("facexlib") == 1
+            assert {"demucs>=4.0.0", "gfpgan", "realesrgan"} <= set(cmd)
+        assert installer.installed == ["demucs", "GFPGAN", "Real-ESRGAN"]
+        assert installer._pending_installs == []
+
+    def test_flush_falls_back_to_individual_installs(self):
+        """A failed batch is retried per group to attribute failures."""
+        from subprocess import CalledProcessError
+
+        installer = TerminalAIInstaller(install_type="full")
+        installer._installed_versions = {}
+        installer._queue_pip("demucs", ["demucs>=4.0.0"], "demucs failed")
+        installer._queue_pip("audiosr", ["audiosr>=0.0.4"], "audiosr failed")
+
+        def fake_run(cmd, **kwargs):
+            if "audiosr>=0.0.4" in cmd:
+                raise CalledProcessError(1, cmd)
+            return MagicMock()
+
+        with patch('subprocess.run', side_effect=fake_run):
+            installer._flush_pip()
+
+        assert installer.installed == ["demucs"]
+        assert installer.warnings == ["audiosr failed"]
+
+
+    def test_common_ai_deps_installed_before_leaf_retries(self):
+        """Real-ESRGAN/GFPGAN retries reuse the shared dependency install."""
+        from subprocess import CalledProcessError
+
+        installer = TerminalAIInstaller(install_type="full")
+        installer._installed_versions = {}
+        installer.install_common_ai_deps()
+        installer.install_optional_realesrgan()
+        installer.install_optional_gfpgan()
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            if len(calls) == 1:
+                raise CalledProcessError(1, cmd)
+            return MagicMock()
+
+        with patch('subprocess.run', side_effect=fake_run):
+            installer._flush_pip()
+
+        assert calls[1][-4:] == ["numpy", "opencv-python", "basicsr", "facexlib"]
+        assert sorted(cmd[-1] for cmd in calls[2:]) == ["gfpgan", "realesrgan"]
+        assert len(installer.installed) == 3
+
+    def test_pip_timeout_retried_with_backoff(self):
+        """A hung pip is retried with exponential backoff, then given up."""
+        from subprocess import TimeoutExpired
+
+        installer = TerminalAIInstaller(install_type="basic")
+        with patch('subprocess.run', side_effect=TimeoutExpired("pip", 300)) as mock_run, \
+             patch('time.sleep') as mock_sleep:
+            ok, _ = installer._run_pip_cmd(["pip", "install", "demucs"], 300)
+
+        assert not ok
+        assert mock_run.call_count == 3
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [1, 2]
+        assert mock_run.call_args.kwargs["timeout"] == 300
+
+    def test_audio_extras_resolved_in_one_call(self):
+        """demucs and audiosr share one resolver pass while deepfilternet builds."""
+        installer = TerminalAIInstaller(install_type="audio")
+        installer._installed_versions = {}
+
+        async def fake_concurrent(commands, timeout, max_parallel=3):
+            fake_concurrent.commands = commands
+            fake_concurrent.timeout = timeout
+            return [(True, None)] * len(commands)
+
+        with patch.object(installer, 'check_rust', return_value=True), \
+             patch.object(installer, '_run_concurrently', side_effect=fake_concurrent), \
+             patch('subprocess.run') as mock_run:
+            installer._install_demucs()
+            installer._install_deepfilternet()
+            installer._install_audiosr()
+            installer._flush_pip()
+
+        batch, build = fake_concurrent.commands
+        assert {"demucs>=4.0.0", "audiosr>=0.0.4"} <= set(batch)
+        assert "deepfilternet>=0.5.0" not in batch
+        assert build[3:5] == ["wheel", "--cache-dir"] and build[-1] == "deepfilternet>=0.5.0"
+        assert fake_concurrent.timeout == 900
+
+        # The built wheel is installed once the batch is done
+        mock_run.assert_called_once()
+        assert "--find-links" in mock_run.call_args[0][0]
+        assert sorted(installer.installed) == ["audiosr", "deepfilternet", "demucs"]
+
+    def test_run_concurrently_reports_each_command(self):
+        """Concurrent runner returns per-command results in order."""
+        import asyncio
+
+        installer = TerminalAIInstaller()
+        commands = [
+            [sys.executable, "-c", "pass"],
+            [sys.executable, "-c", "import sys; sys.stderr.write('bad'); sys.exit(1)"],
+        ]
+
+        results = asyncio.run(installer._run_concurrently(commands, timeout=30))
+
+        assert results[0] == (True, b"")
+        assert results[1] == (False, b"bad")
+
+    def test_fallback_retries_groups_sequentially(self):
+        """After a failed batch each group is retried in its own pip run, in order."""
+        from subprocess import CalledProcessError
+
+        installer = TerminalAIInstaller(install_type="full")
+        installer._installed_versions = {}
+        installer._queue_pip("Real-ESRGAN", ["facexlib", "realesrgan"], "realesrgan failed")
+        installer._queue_pip("GFPGAN", ["gfpgan", "facexlib"], "gfpgan failed")
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            if len(calls) == 1:
+                raise CalledProcessError(1, cmd)
+            return MagicMock()
+
+        with patch('subprocess.run', side_effect=fake_run):
+            installer._flush_pip()
+
+        assert calls[1][-2:] == ["facexlib", "realesrgan"]
+        assert calls[2][-2:] == ["gfpgan", "facexlib"]
+        assert len(calls) == 3
+        assert installer.installed == ["Real-ESRGAN", "GFPGAN"]
+
+
+    def test_already_satisfied_specs_are_not_queued(self):
+        """Packages already installed at a matching version skip pip."""
+        installer = TerminalAIInstaller(install_type="full")
+        installer._installed_versions = {"demucs": "4.0.1", "audiosr": "0.0.3"}
+
+        assert installer._already_satisfied("demucs>=4.0.0")
+        assert installer._already_satisfied("Demucs")
+        assert not installer._already_satisfied("audiosr>=0.0.4")
+        assert not installer._already_satisfied("gfpgan")
+
+        installer._queue_pip("demucs", ["demucs>=4.0.0"], "demucs failed")
+        installer._queue_pip("audiosr", ["audiosr>=0.0.4"], "audiosr failed")
+        assert [label for label, _, _ in installer._pending_installs] == ["audiosr"]
+
+
+    def test_pip_commands_use_explicit_cache_dir(self, tmp_path):
+        """Every pip install shares the configured cache directory."""
+        installer = TerminalAIInstaller(install_type="full", cache_dir=tmp_path, use_uv=False)
+        installer._installed_versions = {}
+        installer._queue_pip("demucs", ["demucs>=4.0.0"], "demucs failed")
+
+        with patch('subprocess.run') as mock_run:
+            installer._flush_pip()
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--cache-dir") + 1] == str(tmp_path)
+        assert "--prefer-binary" in cmd
+        assert "--disable-pip-version-check" in cmd
+        assert "--no-compile" in cmd
+
+    def test_bytecode_compiled_for_dev_and_on_request(self):
+        """--no-compile is dropped for dev installs and with --compile."""
+        dev = TerminalAIInstaller(install_type="dev", use_uv=False)
+        full = TerminalAIInstaller(install_type="full", use_uv=False, compile_bytecode=True)
+
+        assert "--no-compile" not in dev._pip_base_cmd()
+        assert "--no-compile" not in full._pip_base_cmd()
+
+
+    def test_uv_frontend_used_when_available(self):
+        """uv replaces pip as the install frontend when it is on PATH."""
+        with patch('shutil.which', return_value="/usr/bin/uv"):
+            installer = TerminalAIInstaller(install_type="full")
+
+        cmd = installer._pip_base_cmd()
+        assert cmd[:3] == ["/usr/bin/uv", "pip", "install"]
+        assert cmd[cmd.index("--python") + 1] == sys.executable
+        # --report is pip-only, so plan resolution still goes through pip
+        assert installer._pip_base_cmd(use_uv=False)[:4] == [sys.executable, "-m", "pip", "install"]
+
+    def test_no_uv_forces_pip(self):
+        """--no-uv keeps pip even when uv is installed."""
+        with patch('shutil.which', return_value="/usr/bin/uv"):
+            installer = TerminalAIInstaller(install_type="full", use_uv=False)
+
+        assert installer._pip_base_cmd()[:3] == [sys.executable, "-m", "pip"]
+
+    def test_resolve_plan_parses_pip_report(self):
+        """The dry-run report yields the download URL of each planned dist."""
+        installer = TerminalAIInstaller(install_type="full")
+        report = {
+            "install": [
+                {"download_info": {"url": "https://files.example/demucs-4.0.1-py3-none-any.whl"}},
+                {"download_info": {"url": "file:///local/checkout"}},
+            ]
+        }
+        mock_result = MagicMock()
+        mock_result.stdout = json.dumps(report)
+
+        with patch('subprocess.run', return_value=mock_result) as mock_run:
+            urls = installer._resolve_plan(["demucs>=4.0.0"])
+
+        cmd = mock_run.call_args[0][0]
+        assert "--dry-run" in cmd and "--report" in cmd
+        assert urls == ["https://files.example/demucs-4.0.1-py3-none-any.whl"]
+
+
+class TestEditableInstallCheck:
+    """Test detection of an up-to-date editable install."""
+
+    def _fake_dist(self, url, requires):
+        dist = MagicMock()
+        dist.read_text.return_value = json.dumps({"url": url, "dir_info": {"editable": True}})
+        dist.requires = requires
+        return dist
+
+    def test_current_editable_install_is_skipped(self):
+        """Editable install of this checkout with deps met is a no-op."""
+        installer = TerminalAIInstaller(install_type="dev")
+        installer._installed_versions = {"pyyaml": "6.0", "pytest": "8.0"}
+        dist = self._fake_dist(
+            Path.cwd().resolve().as_uri(),
+            ["pyyaml>=6.0", 'pytest>=7.0; extra == "dev"', 'cupy>=12; extra == "cuda"'],
+        )
+
+        with patch('importlib.metadata.distribution', return_value=dist):
+            assert installer._editable_install_current(["dev"]) is True
+
+    def test_missing_extra_requirement_triggers_install(self):
+        """Newly requested extras still need the editable install."""
+        installer = TerminalAIInstaller(install_type="dev")
+        installer._installed_versions = {"pyyaml": "6.0"}
+        dist = self._fake_dist(
+            Path.cwd().resolve().as_uri(),
+            ["pyyaml>=6.0", 'pytest>=7.0; extra == "dev"'],
+        )
+
+        with patch('importlib.metadata.distribution', return_value=dist):
+            assert installer._editable_install_current(["dev"]) is False
+            assert installer._editable_install_current([]) is True
+
+    def test_other_checkout_triggers_install(self):
+        """An editable install pointing elsewhere is not reused."""
+        installer = TerminalAIInstaller()
+        installer._installed_versions = {}
+        dist = self._fake_dist("file:///somewhere/else", [])
+
+        with patch('importlib.metadata.distribution', return_value=dist):
+            assert installer._editable_install_current([]) is False
+
+
+class TestStepScheduler:
+    """Test the installer step runner."""
+
+    def test_steps_run_in_order(self):
+        """Sequential steps run one after another, in the given order."""
+        installer = TerminalAIInstaller()
+        order = []
+        steps = [
+            ("Step A", lambda: order.append("a")),
+            ("Step B", lambda: order.append("b")),
+            ("Step C", lambda: order.append("c")),
+        ]
+
+        installer._run_steps(steps)
+
+        assert order == ["a", "b", "c"]
+
+    def test_failed_step_is_recorded(self):
+        """Exceptions become installer errors without stopping later steps."""
+        installer = TerminalAIInstaller()
+        ran = []
+
+        def broken():
+            raise RuntimeError("boom")
+
+        installer._run_steps([
+            ("Broken step", broken),
+            ("After step", lambda: ran.append("after")),
+        ])
+
+        assert installer.errors == ["Broken step failed: boom"]
+        assert ran == ["after"]
+
+    def test_concurrent_probes_all_run(self):
+        """Concurrent steps all run and their failures are still recorded."""
+        installer = TerminalAIInstaller()
+        ran = []
+
+        def broken():
+            raise RuntimeError("boom")
+
+        installer._run_steps([
+            ("Probe A", lambda: ran.append("a")),
+            ("Broken probe", broken),
+            ("Probe B", lambda: ran.append("b")),
+        ], concurrent=True)
+
+        assert sorted(ran) == ["a", "b"]
+        assert installer.errors == ["Broken probe failed: boom"]
+
+
 class TestInstallerIntegration:
     """Test installer integration."""
 
@@ -218,6 +620,7 @@ class TestInstallerIntegration:
              patch.object(installer, 'check_nvidia_gpu', return_value=True), \
              patch.object(installer, 'check_maxine_sdk', return_value=True), \
              patch.object(installer, 'check_realesrgan', return_value=True), \
+             patch.object(installer, 'install_common_ai_deps', return_value=None), \
              patch.object(installer, 'install_optional_vapoursynth', return_value=None), \
              patch.object(installer, 'install_optional_realesrgan', return_value=None), \
              patch.object(installer, 'install_optional_gfpgan', return_value=None), \
@@ -231,6 +634,57 @@ class TestInstallerIntegration:
             # Verify patch method was called
             mock_patch.assert_called_once()
 
+    def test_repeat_run_only_verifies(self):
+        """A successful plan is not re-run unless --force is given."""
+        installer = TerminalAIInstaller(install_type="basic")
+        installer.plan_sentinel.parent.mkdir(parents=True)
+        installer.plan_sentinel.touch()
+
+        with patch.object(installer, 'install_package') as mock_install, \
+             patch.object(installer, 'verify_installation', return_value=True) as mock_verify, \
+             patch.object(installer, 'print_summary', return_value=True):
+            installer.run()
+
+        mock_install.assert_not_called()
+        mock_verify.assert_called_once()
+
+    def test_successful_run_writes_sentinel(self):
+        """Sentinel is only recorded once the whole plan succeeded."""
+        installer = TerminalAIInstaller(install_type="basic", force=True)
+
+        with patch.object(installer, '_run_steps'), \
+             patch.object(installer, 'print_summary', return_value=False):
+            installer.run()
+        assert not installer.plan_sentinel.exists()
+
+        with patch.object(installer, '_run_steps'), \
+             patch.object(installer, 'print_summary', return_value=True):
+            installer.run()
+        assert installer.plan_sentinel.exists()
+
+    def test_warnings_prevent_sentinel(self):
+        """A run that left install warnings is retried next time."""
+        installer = TerminalAIInstaller(install_type="basic", force=True)
+
+        def failing_steps(steps, concurrent=False):
+            installer.warnings.append("Failed to install demucs")
+
+        with patch.object(installer, '_run_steps', side_effect=failing_steps), \
+             patch.object(installer, 'print_summary', return_value=True):
+            installer.run()
+        assert not installer.plan_sentinel.exists()
+
+    def test_plan_key_tracks_installer_options(self):
+        """Changing the frontend or bytecode compilation changes the plan."""
+        base = TerminalAIInstaller(install_type="full", use_uv=False).plan_key
+
+        assert TerminalAIInstaller(install_type="full", use_uv=False).plan_key == base
+        assert TerminalAIInstaller(
+            install_type="full", use_uv=False, compile_bytecode=True
+        ).plan_key != base
+        with patch('shutil.which', return_value="/usr/bin/uv"):
+            assert TerminalAIInstaller(install_type="full").plan_key != base
+
     def test_basic_installation_skips_patch(self):
         """Test that basic installation doesn't include basicsr patch."""
         installer = TerminalAIInstaller(install_type="basic")